@@ -1,6 +1,12 @@
 import os
+import gzip
+import queue
+import functools
+import logging
+import logging.handlers
+import threading
 from dotenv import load_dotenv
-import boto3
+from botocore.config import Config
 
 # Load environment variables from .env file
 load_dotenv()
@@ -13,21 +19,163 @@ AWS_REGION = os.getenv("AWS_REGION", "us-east-1")
 # AWS Managed Blockchain Configuration
 BLOCKCHAIN_NETWORK = os.getenv("BLOCKCHAIN_NETWORK", "ETHEREUM_MAINNET")
 
+# Retry Configuration
+# "standard" retries throttling and transient errors with full-jitter exponential backoff;
+# "adaptive" (the default) adds client-side rate limiting on top of it under sustained throttling.
+AWS_RETRY_MODE = os.getenv("AWS_RETRY_MODE", "adaptive").lower()
+AWS_MAX_ATTEMPTS = int(os.getenv("AWS_MAX_ATTEMPTS", "10"))
+
+# Connection Configuration
+MB_MAX_SOCKETS = int(os.getenv("MB_MAX_SOCKETS", "50"))
+AWS_CONNECT_TIMEOUT = float(os.getenv("AWS_CONNECT_TIMEOUT", "3"))
+AWS_READ_TIMEOUT = float(os.getenv("AWS_READ_TIMEOUT", "30"))
+
+# Logging Configuration
+# Wrapper modules log through `logging.getLogger(__name__)` under the "src" package logger,
+# so records below the configured level are dropped before any message is formatted.
+LOG_LEVEL = os.getenv("LOG_LEVEL", "WARNING")
+logging.getLogger("src").setLevel(LOG_LEVEL)
+
+def enable_background_logging(*handlers, logger_name="src"):
+    """
+    Routes the wrappers' log records through a queue so formatting and handler I/O run
+    on a background thread instead of the calling (request) thread.
+
+    :param handlers: Handlers that should receive the records. Defaults to a StreamHandler.
+    :param logger_name: The logger to attach the queue handler to.
+    :return: The started QueueListener; call stop() on shutdown to flush pending records.
+    """
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        log_queue, *(handlers or (logging.StreamHandler(),)), respect_handler_level=True
+    )
+    logging.getLogger(logger_name).addHandler(logging.handlers.QueueHandler(log_queue))
+    listener.start()
+    return listener
+
+# AWS Client Configuration
+# The default pool of 10 connections overflows under concurrent callers, forcing a
+# fresh TCP/TLS handshake per extra request; keepalive lets sequential calls reuse sockets.
+# Standard/adaptive retries back off with jitter, so throttled calls are retried by the SDK.
+# A short connect timeout fails fast on unreachable endpoints so the retry can move on.
+CLIENT_CONFIG = Config(
+    max_pool_connections=MB_MAX_SOCKETS,
+    tcp_keepalive=True,
+    connect_timeout=AWS_CONNECT_TIMEOUT,
+    read_timeout=AWS_READ_TIMEOUT,
+    retries={"max_attempts": AWS_MAX_ATTEMPTS, "mode": AWS_RETRY_MODE}
+)
+
+def _keep_alive(request, **kwargs):
+    """Asks the endpoint to keep the connection open so the pool can reuse it."""
+    request.headers["Connection"] = "keep-alive"
+
+def _accept_gzip(request, **kwargs):
+    """Asks the endpoint to gzip the response; list pages of JSON records shrink several-fold."""
+    request.headers["Accept-Encoding"] = "gzip"
+
+def _gunzip(response_dict, **kwargs):
+    """Decompresses gzip-encoded bodies before parsing; botocore reads responses undecoded."""
+    if response_dict["headers"].get("Content-Encoding", "").lower() == "gzip" and response_dict["body"]:
+        response_dict["body"] = gzip.decompress(response_dict["body"])
+
+# Errors that no number of retries can fix: the request itself is wrong or not permitted.
+NON_RETRYABLE_ERROR_CODES = frozenset({
+    "InvalidRequestException",
+    "ValidationException",
+    "AccessDeniedException",
+    "ResourceNotFoundException",
+    "TooManyTagsException",
+})
+
+def _no_retry(response=None, **kwargs):
+    """Stops the retry handler from retrying unrecoverable errors; returns None otherwise."""
+    if response is None:
+        return None
+    error_code = (response[1] or {}).get("Error", {}).get("Code")
+    if error_code in NON_RETRYABLE_ERROR_CODES:
+        return False
+    return None
+
 # AWS Clients
+# Clients are thread-safe and expensive to build (service model loading, endpoint
+# resolution, credential lookup), so each factory builds one and shares it.
+def _build_once(factory):
+    """
+    Caches the result of a zero-argument factory, building it at most once.
+
+    Unlike `functools.lru_cache`, concurrent first callers wait on a lock instead of
+    each building (and all but one discarding) their own instance. After the first
+    build the lock is skipped entirely.
+    """
+    lock = threading.Lock()
+    instance = None
+
+    @functools.wraps(factory)
+    def wrapper():
+        nonlocal instance
+        if instance is None:
+            with lock:
+                if instance is None:
+                    instance = factory()
+        return instance
+
+    def cache_clear():
+        nonlocal instance
+        with lock:
+            instance = None
+
+    wrapper.cache_clear = cache_clear
+    return wrapper
+
+@_build_once
+def get_session():
+    """Returns the shared botocore session used to build every AWS client."""
+    # Only low-level clients are used, so botocore's session is enough; boto3's
+    # resource layer and transfer utilities are never imported.
+    import botocore.session
+
+    # Credentials come from the standard provider chain (environment, config files,
+    # instance/container roles) and are resolved once per session, not per client.
+    return botocore.session.get_session()
+
+@_build_once
+def get_aio_session():
+    """Returns the shared aiobotocore session used to build async AWS clients."""
+    from aiobotocore.session import get_session as get_aiobotocore_session  # Optional dependency
+
+    return get_aiobotocore_session()
+
+@_build_once
 def get_managed_blockchain_client():
-    """Returns a boto3 client for AWS Managed Blockchain."""
-    return boto3.client(
-        "managedblockchain",
-        aws_access_key_id=AWS_ACCESS_KEY,
-        aws_secret_access_key=AWS_SECRET_KEY,
-        region_name=AWS_REGION
-    )
+    """Returns a shared boto3 client for AWS Managed Blockchain."""
+    client = get_session().create_client("managedblockchain", region_name=AWS_REGION, config=CLIENT_CONFIG)
+    client.meta.events.register("request-created.managedblockchain", _keep_alive)
+    # Registered first so it runs before botocore's own retry handler.
+    client.meta.events.register_first("needs-retry.managedblockchain", _no_retry)
+    return client
 
+@_build_once
 def get_managed_blockchain_query_client():
-    """Returns a boto3 client for AWS Managed Blockchain Query."""
-    return boto3.client(
-        "managedblockchain-query",
-        aws_access_key_id=AWS_ACCESS_KEY,
-        aws_secret_access_key=AWS_SECRET_KEY,
-        region_name=AWS_REGION
-    )
+    """Returns a shared boto3 client for AWS Managed Blockchain Query."""
+    client = get_session().create_client("managedblockchain-query", region_name=AWS_REGION, config=CLIENT_CONFIG)
+    client.meta.events.register("request-created.managedblockchain-query", _keep_alive)
+    client.meta.events.register("request-created.managedblockchain-query", _accept_gzip)
+    client.meta.events.register("before-parse.managedblockchain-query", _gunzip)
+    # Registered first so it runs before botocore's own retry handler.
+    client.meta.events.register_first("needs-retry.managedblockchain-query", _no_retry)
+    return client
+
+def warmup():
+    """
+    Builds the shared client and makes one cheap call so credentials, endpoint data
+    and a pooled TLS connection are ready before the first real request.
+
+    Intended to be called once from application start-up (e.g., Lambda global scope
+    or a CLI entry point). Failures are logged and ignored; the first real call will
+    simply pay the set-up cost instead.
+    """
+    try:
+        get_managed_blockchain_client().list_networks(MaxResults=1)
+    except Exception as e:
+        logging.getLogger(__name__).debug("Client warm-up failed: %s", e)
@@ -1,13 +1,24 @@
-import boto3
-import uuid
+import logging
+import secrets
 import botocore
-from typing import Optional, Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, List, Iterator
+
+from src.config.settings import CLIENT_CONFIG, get_managed_blockchain_client
+from src.managed_blockchain.managed_blockchain_utils import handle_client_errors, prefetch_pages
+
+logger = logging.getLogger(__name__)
+
+# ListAccessors returns at most 50 results per page.
+MAX_ACCESSORS_PAGE_SIZE = 50
 
 
 class ManagedBlockchainAccessors:
     def __init__(self):
-        self.client = boto3.client('managedblockchain')
+        self.client = get_managed_blockchain_client()
+        self._list_accessors_paginator = self.client.get_paginator('list_accessors')
 
+    @handle_client_errors()
     def create_accessor(self, network_type: str, tags: dict = None):
         """
         Creates a new accessor for use with Amazon Managed Blockchain service.
@@ -16,31 +27,34 @@ class ManagedBlockchainAccessors:
         :param tags: Optional dictionary of tags.
         :return: Dictionary containing the AccessorId and BillingToken.
         """
-        try:
-            response = self.client.create_accessor(
-                ClientRequestToken=str(uuid.uuid4()),  # Ensures idempotency
-                AccessorType="BILLING_TOKEN",
-                Tags=tags if tags else {},
-                NetworkType=network_type,
-            )
-            return response
-        except self.client.exceptions.InvalidRequestException as e:
-            print(f"Invalid request: {e}")
-        except self.client.exceptions.AccessDeniedException as e:
-            print(f"Access denied: {e}")
-        except self.client.exceptions.ResourceAlreadyExistsException as e:
-            print(f"Resource already exists: {e}")
-        except self.client.exceptions.ThrottlingException as e:
-            print(f"Throttling limit reached: {e}")
-        except self.client.exceptions.ResourceLimitExceededException as e:
-            print(f"Resource limit exceeded: {e}")
-        except self.client.exceptions.InternalServiceErrorException as e:
-            print(f"Internal service error: {e}")
-        except self.client.exceptions.TooManyTagsException as e:
-            print(f"Too many tags: {e}")
-
-        return None
+        params = {
+            'ClientRequestToken': secrets.token_hex(16),  # Ensures idempotency
+            'AccessorType': "BILLING_TOKEN",
+            'NetworkType': network_type,
+        }
+        # Optional fields are omitted rather than sent empty.
+        if tags:
+            params['Tags'] = tags
+
+        response = self.client.create_accessor(**params)
+        return response
+
+    def create_accessors_bulk(self, specs: List[Dict], max_workers: int = 16) -> List[Optional[Dict]]:
+        """
+        Creates several accessors concurrently.
 
+        :param specs: A list of keyword-argument dictionaries, one per `create_accessor` call.
+        :param max_workers: The maximum number of concurrent requests.
+        :return: The `create_accessor` results, in the same order as `specs`.
+        """
+        if not specs:
+            return []
+
+        max_workers = min(len(specs), max_workers, CLIENT_CONFIG.max_pool_connections)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda spec: self.create_accessor(**spec), specs))
+
+    @handle_client_errors()
     def delete_accessor(self, accessor_id: str):
         """
         Deletes an accessor associated with an AWS Managed Blockchain account.
@@ -48,25 +62,13 @@ class ManagedBlockchainAccessors:
         :param accessor_id: The unique identifier of the accessor to delete.
         :return: None if successful, otherwise an error message.
         """
-        try:
-            response = self.client.delete_accessor(
-                AccessorId=accessor_id
-            )
-            print(f"Accessor {accessor_id} has been marked for deletion.")
-            return response
-        except self.client.exceptions.InvalidRequestException as e:
-            print(f"Invalid request: {e}")
-        except self.client.exceptions.AccessDeniedException as e:
-            print(f"Access denied: {e}")
-        except self.client.exceptions.ResourceNotFoundException as e:
-            print(f"Resource not found: {e}")
-        except self.client.exceptions.ThrottlingException as e:
-            print(f"Throttling limit reached: {e}")
-        except self.client.exceptions.InternalServiceErrorException as e:
-            print(f"Internal service error: {e}")
-
-        return None
+        response = self.client.delete_accessor(
+            AccessorId=accessor_id
+        )
+        logger.info("Accessor %s has been marked for deletion.", accessor_id)
+        return response
 
+    @handle_client_errors()
     def get_accessor(self, accessor_id: str):
         """
         Retrieves detailed information about a specific accessor.
@@ -74,21 +76,8 @@ class ManagedBlockchainAccessors:
         :param accessor_id: The unique identifier of the accessor.
         :return: Dictionary containing accessor details or None if an error occurs.
         """
-        try:
-            response = self.client.get_accessor(AccessorId=accessor_id)
-            return response.get("Accessor", {})
-        except self.client.exceptions.InvalidRequestException as e:
-            print(f"Invalid request: {e}")
-        except self.client.exceptions.AccessDeniedException as e:
-            print(f"Access denied: {e}")
-        except self.client.exceptions.ResourceNotFoundException as e:
-            print(f"Resource not found: {e}")
-        except self.client.exceptions.ThrottlingException as e:
-            print(f"Throttling limit reached: {e}")
-        except self.client.exceptions.InternalServiceErrorException as e:
-            print(f"Internal service error: {e}")
-
-        return None
+        response = self.client.get_accessor(AccessorId=accessor_id)
+        return response.get("Accessor", {})
 
     def list_accessors(
             self,
@@ -116,9 +105,25 @@ class ManagedBlockchainAccessors:
             response = self.client.list_accessors(**params)
             return response
         except botocore.exceptions.BotoCoreError as e:
-            print(f"Error listing accessors: {e}")
+            logger.warning("Error listing accessors: %s", e)
             return {}
 
+    def iter_accessors(self, network_type: Optional[str] = None, eager_pages: int = 0) -> Iterator[Dict]:
+        """
+        Yields accessors page by page instead of collecting them all in memory.
+
+        :param network_type: The blockchain network type for which accessors are created.
+        :param eager_pages: Number of pages to fetch ahead while the current page is consumed; off by default.
+        :return: An iterator over all accessors.
+        """
+        params = {}
+        if network_type:
+            params['NetworkType'] = network_type
+
+        pages = self._list_accessors_paginator.paginate(**params, PaginationConfig={'PageSize': MAX_ACCESSORS_PAGE_SIZE})
+        for page in prefetch_pages(pages, eager_pages):
+            yield from page.get('Accessors', [])
+
     def get_all_accessors(self, network_type: Optional[str] = None) -> List[Dict]:
         """
         Retrieves all accessors available in Managed Blockchain, handling pagination.
@@ -126,15 +131,26 @@ class ManagedBlockchainAccessors:
         :param network_type: The blockchain network type for which accessors are created.
         :return: A list of all accessors.
         """
-        accessors = []
-        next_token = None
+        try:
+            return list(self.iter_accessors(network_type=network_type))
+        except botocore.exceptions.BotoCoreError as e:
+            logger.warning("Error listing accessors: %s", e)
+            return []
+
+    def get_all_accessors_multi(self, network_types: List[str]) -> Dict[str, List[Dict]]:
+        """
+        Retrieves all accessors for several network types concurrently.
 
-        while True:
-            response = self.list_accessors(next_token=next_token, network_type=network_type)
-            if 'Accessors' in response:
-                accessors.extend(response['Accessors'])
-            next_token = response.get('NextToken')
-            if not next_token:
-                break
+        Each network type is paginated on its own thread over the shared client, so the
+        total latency is that of the slowest network type rather than the sum of all.
+
+        :param network_types: The blockchain network types to list accessors for.
+        :return: A dictionary mapping each network type to its list of accessors.
+        """
+        if not network_types:
+            return {}
 
-        return accessors
+        max_workers = min(len(network_types), CLIENT_CONFIG.max_pool_connections)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(self.get_all_accessors, network_types)
+            return dict(zip(network_types, results))
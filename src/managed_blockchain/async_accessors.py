@@ -0,0 +1,37 @@
+from typing import AsyncIterator, Dict, List, Optional
+
+from src.managed_blockchain.accessors import MAX_ACCESSORS_PAGE_SIZE
+from src.managed_blockchain.async_client import AsyncManagedBlockchainClient
+
+
+class AsyncManagedBlockchainAccessors(AsyncManagedBlockchainClient):
+    """
+    Async twin of `ManagedBlockchainAccessors` for high-fanout listing workloads.
+
+        async with AsyncManagedBlockchainAccessors() as accessors:
+            results = await asyncio.gather(*(accessors.get_all_accessors(n) for n in networks))
+    """
+
+    async def iter_accessors(self, network_type: Optional[str] = None) -> AsyncIterator[Dict]:
+        """
+        Streams accessors page by page without holding the full result set in memory.
+
+        :param network_type: Optional blockchain network to filter by.
+        :return: An async iterator over accessor summaries.
+        """
+        params = {'PaginationConfig': {'PageSize': MAX_ACCESSORS_PAGE_SIZE}}
+        if network_type:
+            params['NetworkType'] = network_type
+
+        async for page in self.client.get_paginator('list_accessors').paginate(**params):
+            for accessor in page.get('Accessors', []):
+                yield accessor
+
+    async def get_all_accessors(self, network_type: Optional[str] = None) -> List[Dict]:
+        """
+        Retrieves all accessors, handling pagination automatically.
+
+        :param network_type: Optional blockchain network to filter by.
+        :return: A list of all accessors.
+        """
+        return [accessor async for accessor in self.iter_accessors(network_type)]
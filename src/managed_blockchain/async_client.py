@@ -0,0 +1,52 @@
+import asyncio
+import contextlib
+
+try:
+    import aiobotocore
+except ImportError:  # aiobotocore is optional; only the async wrappers need it
+    aiobotocore = None
+
+from src.config.settings import AWS_REGION, CLIENT_CONFIG, get_aio_session
+
+
+class AsyncManagedBlockchainClient:
+    """
+    Base class for the aiobotocore-backed async wrappers.
+
+    The client is created once on `__aenter__` and shared by every coroutine until
+    `__aexit__`, so concurrent calls run on one event loop and one connection pool:
+
+        async with AsyncManagedBlockchainNodes() as nodes:
+            details = await asyncio.gather(*(nodes.get_node(network_id, n) for n in node_ids))
+
+    Subclasses for other services override `service_name`.
+    """
+
+    service_name = "managedblockchain"
+
+    def __init__(self):
+        if aiobotocore is None:
+            raise ImportError(f"{type(self).__name__} requires the 'aiobotocore' package.")
+        self._exit_stack = contextlib.AsyncExitStack()
+        self.client = None
+
+    @staticmethod
+    def _load_models(service_name: str):
+        """Builds the session and loads the service's JSON models, which is blocking disk and CPU work."""
+        session = get_aio_session()
+        loader = session.get_component('data_loader')
+        for type_name in ('service-2', 'endpoint-rule-set-1'):
+            loader.load_service_model(service_name, type_name)
+        return session
+
+    async def __aenter__(self):
+        # The loader caches what it reads, so client creation below no longer stalls the event loop.
+        session = await asyncio.to_thread(self._load_models, self.service_name)
+        self.client = await self._exit_stack.enter_async_context(
+            session.create_client(self.service_name, region_name=AWS_REGION, config=CLIENT_CONFIG)
+        )
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self._exit_stack.aclose()
+        self.client = None
@@ -0,0 +1,71 @@
+import asyncio
+from typing import AsyncIterator, Dict, List, Optional
+
+from src.managed_blockchain.async_client import AsyncManagedBlockchainClient
+from src.managed_blockchain.managed_blockchain_utils import aiter_token_pages, handle_client_errors
+from src.managed_blockchain.nodes import MAX_NODES_PAGE_SIZE
+
+
+class AsyncManagedBlockchainNodes(AsyncManagedBlockchainClient):
+    """Async twin of `ManagedBlockchainNodes` for cross-network node inventories."""
+
+    @handle_client_errors()
+    async def get_node(self, network_id: str, node_id: str, member_id: str = None):
+        """
+        Retrieves detailed information about a specific blockchain node.
+
+        :param network_id: The unique identifier of the network.
+        :param node_id: The unique identifier of the node.
+        :param member_id: The unique identifier of the member (required for Hyperledger Fabric).
+        :return: Dictionary containing node details or None if an error occurs.
+        """
+        params = {"NetworkId": network_id, "NodeId": node_id}
+        if member_id:
+            params["MemberId"] = member_id  # Required for Hyperledger Fabric
+
+        response = await self.client.get_node(**params)
+        return response.get("Node", {})
+
+    async def get_nodes_bulk(self, network_id: str, node_ids: List[str],
+                             member_id: str = None) -> List[Optional[Dict]]:
+        """
+        Retrieves several nodes of a network concurrently.
+
+        :param network_id: The unique identifier of the network.
+        :param node_ids: The unique identifiers of the nodes to retrieve.
+        :param member_id: The unique identifier of the member (required for Hyperledger Fabric).
+        :return: The `get_node` results, in the same order as `node_ids`.
+        """
+        return list(await asyncio.gather(*(self.get_node(network_id, node_id, member_id) for node_id in node_ids)))
+
+    async def iter_nodes(self, network_id: str, member_id: Optional[str] = None,
+                         status: Optional[str] = None) -> AsyncIterator[Dict]:
+        """
+        Streams the nodes of a network page by page without holding them all in memory.
+
+        :param network_id: The unique identifier of the network.
+        :param member_id: The unique identifier of the member who owns the nodes (required for Hyperledger Fabric).
+        :param status: Optional node status to filter by.
+        :return: An async iterator over all nodes within the network.
+        """
+        params = {"NetworkId": network_id, "MaxResults": MAX_NODES_PAGE_SIZE}
+        if member_id:
+            params["MemberId"] = member_id
+        if status:
+            params["Status"] = status
+
+        async for page in aiter_token_pages(self.client.list_nodes, **params):
+            for node in page.get('Nodes', []):
+                yield node
+
+    async def get_all_nodes(self, network_id: str, member_id: Optional[str] = None,
+                            status: Optional[str] = None) -> List[Dict]:
+        """
+        Retrieves all nodes within a specified network, handling pagination.
+
+        :param network_id: The unique identifier of the network.
+        :param member_id: The unique identifier of the member who owns the nodes (required for Hyperledger Fabric).
+        :param status: Optional node status to filter by.
+        :return: A list of all nodes within the network.
+        """
+        return [node async for node in self.iter_nodes(network_id, member_id, status)]
@@ -0,0 +1,66 @@
+from typing import AsyncIterator, Dict, List
+
+from src.managed_blockchain.async_client import AsyncManagedBlockchainClient
+from src.managed_blockchain.managed_blockchain_utils import aiter_token_pages, handle_client_errors
+from src.managed_blockchain.proposals import MAX_PROPOSAL_VOTES_PAGE_SIZE, MAX_PROPOSALS_PAGE_SIZE
+
+
+class AsyncManagedBlockchainProposals(AsyncManagedBlockchainClient):
+    """Async twin of `ManagedBlockchainProposals` for reading proposals and votes concurrently."""
+
+    @handle_client_errors()
+    async def get_proposal(self, network_id: str, proposal_id: str):
+        """
+        Retrieves detailed information about a specific proposal.
+
+        :param network_id: The unique identifier of the network for which the proposal is made.
+        :param proposal_id: The unique identifier of the proposal.
+        :return: Dictionary containing proposal details or None if an error occurs.
+        """
+        response = await self.client.get_proposal(NetworkId=network_id, ProposalId=proposal_id)
+        return response.get("Proposal", {})
+
+    async def iter_proposals(self, network_id: str) -> AsyncIterator[Dict]:
+        """
+        Streams the proposals of a network page by page without holding them all in memory.
+
+        :param network_id: The unique identifier of the network.
+        :return: An async iterator over all proposals.
+        """
+        pages = aiter_token_pages(self.client.list_proposals, NetworkId=network_id, MaxResults=MAX_PROPOSALS_PAGE_SIZE)
+        async for page in pages:
+            for proposal in page.get('Proposals', []):
+                yield proposal
+
+    async def get_all_proposals(self, network_id: str) -> List[Dict]:
+        """
+        Retrieves all proposals for a network, handling pagination.
+
+        :param network_id: The unique identifier of the network.
+        :return: A list of all proposals.
+        """
+        return [proposal async for proposal in self.iter_proposals(network_id)]
+
+    async def iter_proposal_votes(self, network_id: str, proposal_id: str) -> AsyncIterator[Dict]:
+        """
+        Streams the votes cast on a proposal page by page without holding them all in memory.
+
+        :param network_id: The unique identifier of the network.
+        :param proposal_id: The unique identifier of the proposal.
+        :return: An async iterator over all votes cast for the proposal.
+        """
+        pages = aiter_token_pages(self.client.list_proposal_votes, NetworkId=network_id, ProposalId=proposal_id,
+                                  MaxResults=MAX_PROPOSAL_VOTES_PAGE_SIZE)
+        async for page in pages:
+            for vote in page.get('ProposalVotes', []):
+                yield vote
+
+    async def get_all_proposal_votes(self, network_id: str, proposal_id: str) -> List[Dict]:
+        """
+        Retrieves all votes for a specified proposal, handling pagination.
+
+        :param network_id: The unique identifier of the network.
+        :param proposal_id: The unique identifier of the proposal.
+        :return: A list of all votes cast for the proposal.
+        """
+        return [vote async for vote in self.iter_proposal_votes(network_id, proposal_id)]
@@ -0,0 +1,43 @@
+from typing import Dict
+
+from src.managed_blockchain.async_client import AsyncManagedBlockchainClient
+from src.managed_blockchain.managed_blockchain_utils import handle_client_errors
+
+
+class AsyncManagedBlockchainTags(AsyncManagedBlockchainClient):
+    """Async twin of `ManagedBlockchainTags` for bulk tag audits and updates."""
+
+    @handle_client_errors(default={})
+    async def list_tags_for_resource(self, resource_arn: str) -> Dict[str, str]:
+        """
+        Retrieves a list of tags associated with a Managed Blockchain resource.
+
+        :param resource_arn: The Amazon Resource Name (ARN) of the resource.
+        :return: A dictionary containing key-value pairs of tags.
+        """
+        response = await self.client.list_tags_for_resource(ResourceArn=resource_arn)
+        return response.get("Tags", {})
+
+    @handle_client_errors(default=False)
+    async def tag_resource(self, resource_arn: str, tags: dict) -> bool:
+        """
+        Adds or overwrites tags for a specified Managed Blockchain resource.
+
+        :param resource_arn: The Amazon Resource Name (ARN) of the resource.
+        :param tags: A dictionary of tags to assign (key-value pairs).
+        :return: True if tagging was successful, False otherwise.
+        """
+        await self.client.tag_resource(ResourceArn=resource_arn, Tags=tags)
+        return True
+
+    @handle_client_errors(default=False)
+    async def untag_resource(self, resource_arn: str, tag_keys: list) -> bool:
+        """
+        Removes the specified tags from the Managed Blockchain resource.
+
+        :param resource_arn: The Amazon Resource Name (ARN) of the resource.
+        :param tag_keys: A list of tag keys to remove.
+        :return: True if untagging was successful, False otherwise.
+        """
+        await self.client.untag_resource(ResourceArn=resource_arn, TagKeys=tag_keys)
+        return True
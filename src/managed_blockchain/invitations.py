@@ -1,9 +1,19 @@
-import boto3
+import logging
 import botocore
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Iterator
+
+from src.config.settings import get_managed_blockchain_client
+from src.managed_blockchain.managed_blockchain_utils import iter_token_pages, prefetch_pages
+
+logger = logging.getLogger(__name__)
+
+# ListInvitations returns at most 100 results per page.
+MAX_INVITATIONS_PAGE_SIZE = 100
+
+
 class ManagedBlockchainInvitations:
     def __init__(self):
-        self.client = boto3.client('managedblockchain')
+        self.client = get_managed_blockchain_client()
 
     def list_invitations(self, max_results: Optional[int] = None, next_token: Optional[str] = None) -> Dict:
         """
@@ -23,27 +33,34 @@ class ManagedBlockchainInvitations:
             response = self.client.list_invitations(**params)
             return response
         except botocore.exceptions.BotoCoreError as e:
-            print(f"Error listing invitations: {e}")
+            logger.warning("Error listing invitations: %s", e)
             return {}
 
+    def iter_invitations(self, eager_pages: int = 0) -> Iterator[Dict]:
+        """
+        Yields invitations page by page instead of collecting them all in memory.
+
+        ListInvitations has no boto3 paginator, so pages are requested at the maximum
+        page size to keep the number of round trips down.
+
+        :param eager_pages: Number of pages to fetch ahead while the current page is consumed; off by default.
+        :return: An iterator over all invitations.
+        """
+        pages = iter_token_pages(self.client.list_invitations, MaxResults=MAX_INVITATIONS_PAGE_SIZE)
+        for page in prefetch_pages(pages, eager_pages):
+            yield from page.get('Invitations', [])
+
     def get_all_invitations(self) -> List[Dict]:
         """
         Retrieves all invitations available in Managed Blockchain, handling pagination.
 
         :return: A list of all invitations.
         """
-        invitations = []
-        next_token = None
-
-        while True:
-            response = self.list_invitations(next_token=next_token)
-            if 'Invitations' in response:
-                invitations.extend(response['Invitations'])
-            next_token = response.get('NextToken')
-            if not next_token:
-                break
-
-        return invitations
+        try:
+            return list(self.iter_invitations())
+        except botocore.exceptions.BotoCoreError as e:
+            logger.warning("Error listing invitations: %s", e)
+            return []
 
     def reject_invitation(self, invitation_id: str) -> bool:
         """
@@ -54,8 +71,8 @@ class ManagedBlockchainInvitations:
         """
         try:
             self.client.reject_invitation(InvitationId=invitation_id)
-            print(f"Successfully rejected invitation: {invitation_id}")
+            logger.info("Successfully rejected invitation: %s", invitation_id)
             return True
         except botocore.exceptions.BotoCoreError as e:
-            print(f"Error rejecting invitation: {e}")
+            logger.warning("Error rejecting invitation: %s", e)
             return False
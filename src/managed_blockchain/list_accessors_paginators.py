@@ -1,12 +1,16 @@
-import boto3
+import logging
 import botocore
 from datetime import datetime
 
+from src.config.settings import get_managed_blockchain_client
+
+logger = logging.getLogger(__name__)
+
 
 class ManagedBlockchainPaginator:
     def __init__(self):
         """Initialize the Managed Blockchain client and paginator."""
-        self.client = boto3.client('managedblockchain')
+        self.client = get_managed_blockchain_client()
         self.paginator = self.client.get_paginator('list_accessors')
 
     def list_all_accessors(self, network_type: str, max_items: int = 100, page_size: int = 50):
@@ -35,14 +39,15 @@ class ManagedBlockchainPaginator:
                         "Id": accessor["Id"],
                         "Type": accessor["Type"],
                         "Status": accessor["Status"],
-                        "CreationDate": accessor["CreationDate"].strftime('%Y-%m-%d %H:%M:%S'),
+                        # Same 'YYYY-MM-DD HH:MM:SS' text as strftime, without parsing a format string per row.
+                        "CreationDate": accessor["CreationDate"].isoformat(sep=' ', timespec='seconds')[:19],
                         "Arn": accessor["Arn"],
                         "NetworkType": accessor["NetworkType"]
                     })
 
-            print(f"Retrieved {len(accessors_list)} accessors for network {network_type}.")
+            logger.info("Retrieved %s accessors for network %s.", len(accessors_list), network_type)
             return accessors_list
 
         except botocore.exceptions.BotoCoreError as e:
-            print(f"Error listing accessors: {e}")
+            logger.warning("Error listing accessors: %s", e)
             return []
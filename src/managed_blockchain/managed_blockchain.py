@@ -1,8 +1,8 @@
-import boto3
+from src.config.settings import get_managed_blockchain_client
 
 class ManagedBlockchain:
     def __init__(self):
-        self.client = boto3.client("managedblockchain")
+        self.client = get_managed_blockchain_client()
 
     def list_networks(self):
         """Lists all blockchain networks under AWS Managed Blockchain."""
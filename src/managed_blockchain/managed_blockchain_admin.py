@@ -1,6 +1,9 @@
+from src.config.settings import get_managed_blockchain_client
+
+
 class ManagedBlockchainAdmin:
     def __init__(self):
-        self.client = boto3.client("managedblockchain")
+        self.client = get_managed_blockchain_client()
 
     def create_network(self, name, framework="HYPERLEDGER_FABRIC"):
         """Creates a new blockchain network."""
@@ -1,10 +1,369 @@
-from datetime import datetime
+import asyncio
+import copy
+import functools
+import inspect
+import pickle
+import random
+import sqlite3
+import threading
+import time
+import logging
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, Iterator, Optional
+
+import botocore
+
+logger = logging.getLogger(__name__)
 
 def format_timestamp(timestamp):
     """Converts AWS timestamp to human-readable format."""
-    return datetime.utcfromtimestamp(timestamp).strftime('%Y-%m-%d %H:%M:%S')
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat(sep=' ', timespec='seconds')[:19]
 
 def handle_errors(error):
     """Logs errors and returns a friendly message."""
-    print(f"Error: {error}")
+    logger.warning("Error: %s", error)
     return {"error": str(error)}
+
+# Log level per ClientError code; codes not listed are logged as warnings. Throttling
+# is expected under load and already retried by botocore, so it is only informational.
+CLIENT_ERROR_LOG_LEVELS = {
+    'ThrottlingException': logging.INFO,
+    'TooManyRequestsException': logging.INFO,
+}
+
+def handle_client_errors(default: Any = None):
+    """
+    Decorator that logs a failed Managed Blockchain API call and returns `default`.
+
+    Service exceptions (InvalidRequestException, ResourceNotFoundException, etc.) are
+    all ClientError subclasses, so a single handler keyed on the error code replaces a
+    chain of per-exception except clauses. The code also picks the log level from
+    `CLIENT_ERROR_LOG_LEVELS`.
+
+    :param default: The value returned when the call fails.
+    """
+    def log_client_error(func, e):
+        # Log the parsed error fields rather than `e`, whose __str__ re-formats the response.
+        error = e.response.get("Error", {})
+        fields = {
+            "op": func.__name__,
+            "code": error.get("Code"),
+            "request_id": e.response.get("ResponseMetadata", {}).get("RequestId"),
+        }
+        level = CLIENT_ERROR_LOG_LEVELS.get(fields["code"], logging.WARNING)
+        logger.log(level, "%s failed (%s): %s", fields["op"], fields["code"], error.get("Message"), extra=fields)
+
+    def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                try:
+                    return await func(*args, **kwargs)
+                except botocore.exceptions.ClientError as e:
+                    log_client_error(func, e)
+                    return default
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                return func(*args, **kwargs)
+            except botocore.exceptions.ClientError as e:
+                log_client_error(func, e)
+                return default
+        return wrapper
+    return decorator
+
+class TTLCache:
+    """
+    Thread-safe, size-bounded cache whose entries expire `ttl` seconds after being set.
+
+    Once `maxsize` entries are held, the least recently used entry is evicted.
+    Loads that overlap an `invalidate` or `clear` are returned but not cached, so a
+    read racing a write cannot put the pre-write state back.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._in_flight: Dict[Any, Future] = {}
+        self._in_flight_lock = threading.Lock()
+        self._generation = 0
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._store(key, value)
+
+    def _store(self, key, value):
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def get_or_load(self, key, loader: Callable[[], Any]):
+        """
+        Returns the cached value for `key`, calling `loader` on a miss.
+
+        Concurrent misses for the same key are coalesced: the first caller runs
+        `loader` and the others wait on its result instead of issuing duplicate
+        requests. None results are returned but not cached.
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        with self._in_flight_lock:
+            future = self._in_flight.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = self._in_flight[key] = Future()
+
+        if not is_owner:
+            return future.result()
+
+        try:
+            generation = self._generation
+            value = loader()
+            if value is not None:
+                with self._lock:
+                    if generation == self._generation:
+                        self._store(key, value)
+            future.set_result(value)
+            return value
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._in_flight_lock:
+                del self._in_flight[key]
+
+    def invalidate(self, *key_prefix):
+        """Drops every entry whose key starts with `key_prefix`."""
+        with self._lock:
+            self._generation += 1
+            for key in [key for key in self._entries if key[:len(key_prefix)] == key_prefix]:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+class SQLiteCache:
+    """
+    Thread-safe cache persisted to a SQLite file, for results that never change (e.g. finalized blocks).
+
+    Shares the `get_or_load`/`invalidate`/`clear` interface of `TTLCache`, but entries never
+    expire and survive across sessions. Keys are tuples; values are pickled.
+    """
+
+    _SEPARATOR = "\x1f"
+
+    def __init__(self, path: str):
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute("CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value BLOB NOT NULL)")
+
+    @classmethod
+    def _key(cls, key) -> str:
+        return cls._SEPARATOR.join(map(repr, key))
+
+    def get(self, key, default=None):
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM cache WHERE key = ?", (self._key(key),)).fetchone()
+        return default if row is None else pickle.loads(row[0])
+
+    def set(self, key, value):
+        with self._lock, self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO cache (key, value) VALUES (?, ?)",
+                               (self._key(key), pickle.dumps(value)))
+
+    def get_or_load(self, key, loader: Callable[[], Any]):
+        """Returns the stored value for `key`, calling `loader` and storing its result on a miss."""
+        value = self.get(key)
+        if value is None:
+            value = loader()
+            if value is not None:
+                self.set(key, value)
+        return value
+
+    def invalidate(self, *key_prefix):
+        """Drops every entry whose key starts with `key_prefix`."""
+        prefix = self._key(key_prefix)
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM cache WHERE key = ? OR substr(key, 1, ?) = ?",
+                               (prefix, len(prefix) + 1, prefix + self._SEPARATOR))
+
+    def clear(self):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM cache")
+
+def cached_read(cache_attr: str = '_cache'):
+    """
+    Decorator that memoizes a read method in the instance's `TTLCache`.
+
+    Entries are keyed on `(method name, *bound arguments)`, so positional and keyword
+    calls share an entry and writers can drop them with `cache.invalidate(name, *ids)`.
+    Concurrent misses for the same key share one request, and None results (failed
+    calls) are not cached. Every caller gets its own copy of the result, so mutating
+    it never changes what other readers see.
+
+    :param cache_attr: The instance attribute holding the cache.
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+        parameters = list(signature.parameters.values())[1:]
+        defaults = tuple(parameter.default for parameter in parameters)
+        required = sum(parameter.default is inspect.Parameter.empty for parameter in parameters)
+        plain = all(parameter.kind is inspect.Parameter.POSITIONAL_OR_KEYWORD for parameter in parameters)
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            if plain and not kwargs and required <= len(args) <= len(defaults):
+                # Fast path: the key is the positional arguments padded with defaults, no binding needed.
+                key = (func.__name__, *args, *defaults[len(args):])
+            else:
+                bound = signature.bind(self, *args, **kwargs)
+                bound.apply_defaults()
+                key = (func.__name__, *list(bound.arguments.values())[1:])
+
+            return copy.deepcopy(getattr(self, cache_attr).get_or_load(key, lambda: func(self, *args, **kwargs)))
+        return wrapper
+    return decorator
+
+def iter_token_pages(operation: Callable[..., Dict], **params) -> Iterator[Dict]:
+    """
+    Yields every response page of a list operation paginated with NextToken.
+
+    Used for Managed Blockchain list operations that have no boto3 paginator.
+
+    :param operation: The client method to call (e.g., client.list_invitations).
+    :param params: Request parameters passed to every call.
+    :return: An iterator over the raw response pages.
+    """
+    page = operation(**params)
+    yield page
+    while next_token := page.get('NextToken'):
+        page = operation(**params, NextToken=next_token)
+        yield page
+
+async def aiter_token_pages(operation: Callable[..., Awaitable[Dict]], **params) -> AsyncIterator[Dict]:
+    """
+    Async counterpart of `iter_token_pages` for aiobotocore clients.
+
+    :param operation: The async client method to call (e.g., client.list_nodes).
+    :param params: Request parameters passed to every call.
+    :return: An async iterator over the raw response pages.
+    """
+    page = await operation(**params)
+    yield page
+    while next_token := page.get('NextToken'):
+        page = await operation(**params, NextToken=next_token)
+        yield page
+
+def prefetch_pages(pages: Iterable[Dict], eager_pages: int = 0) -> Iterator[Dict]:
+    """
+    Yields pages while fetching up to `eager_pages` pages ahead on a background thread,
+    so the next request is in flight while the caller processes the current page.
+
+    :param pages: An iterable of response pages (e.g., a boto3 PageIterator).
+    :param eager_pages: Number of pages to fetch ahead; 0 (the default) disables prefetching.
+    :return: An iterator over the same pages, in order.
+    """
+    if eager_pages < 1:
+        yield from pages
+        return
+
+    pages = iter(pages)
+    exhausted = object()
+    # A single worker keeps calls to next() on the page iterator sequential.
+    executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        pending = deque(executor.submit(next, pages, exhausted) for _ in range(eager_pages))
+        while True:
+            page = pending.popleft().result()
+            if page is exhausted:
+                return
+            pending.append(executor.submit(next, pages, exhausted))
+            yield page
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+def poll_until(fetch: Callable[[], Any], is_done: Callable[[Any], bool], base_delay: float = 1.0,
+               max_delay: float = 30.0, max_attempts: Optional[int] = 60,
+               max_elapsed: Optional[float] = None) -> Optional[Any]:
+    """
+    Calls `fetch` until `is_done` accepts its result, for resources without a boto3 waiter.
+
+    Attempts are spaced with exponential backoff and full jitter (a random sleep of up
+    to `min(max_delay, base_delay * 2**attempt)`), so fast transitions are seen quickly
+    and concurrent pollers do not hit the API in lockstep.
+
+    :param fetch: Returns the current state of the resource.
+    :param is_done: Returns True once the state is final.
+    :param base_delay: The upper bound (in seconds) of the first sleep.
+    :param max_delay: The upper bound (in seconds) of any sleep.
+    :param max_attempts: The maximum number of calls to `fetch`, or None for no limit.
+    :param max_elapsed: Optional bound (in seconds) on the total time spent polling.
+    :return: The first result accepted by `is_done`, or None if attempts or time run out.
+    """
+    deadline = None if max_elapsed is None else time.monotonic() + max_elapsed
+    attempt = 0
+    while True:
+        result = fetch()
+        if is_done(result):
+            return result
+        attempt += 1
+        if max_attempts is not None and attempt >= max_attempts:
+            return None
+
+        sleep = random.uniform(0, min(max_delay, base_delay * 2 ** min(attempt - 1, 16)))
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            sleep = min(sleep, remaining)
+        time.sleep(sleep)
+
+def asyncify(cls):
+    """
+    Class decorator that adds an `<name>_async` coroutine for every public method.
+
+    Each coroutine runs the blocking method via `asyncio.to_thread`, so async callers
+    (e.g., FastAPI handlers) can await Managed Blockchain calls without blocking the
+    event loop. The wrappers are generated once, when the class is defined.
+    Generator methods (`iter_*`) are skipped since they cannot be awaited.
+    """
+    def make_async(name):
+        method = getattr(cls, name)
+
+        @functools.wraps(method)
+        async def wrapper(self, *args, **kwargs):
+            return await asyncio.to_thread(method, self, *args, **kwargs)
+
+        wrapper.__name__ = f"{name}_async"
+        wrapper.__qualname__ = f"{cls.__qualname__}.{name}_async"
+        return wrapper
+
+    for name, member in list(vars(cls).items()):
+        if name.startswith('_') or not inspect.isfunction(member) or inspect.isgeneratorfunction(member):
+            continue
+        setattr(cls, f"{name}_async", make_async(name))
+    return cls
@@ -1,14 +1,39 @@
-import boto3
+import logging
+import secrets
 import botocore
-from typing import Optional, Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, List, Iterator
 
+from src.config.settings import CLIENT_CONFIG, get_managed_blockchain_client
+from src.managed_blockchain.managed_blockchain_utils import (
+    TTLCache, asyncify, cached_read, handle_client_errors, iter_token_pages
+)
 
+logger = logging.getLogger(__name__)
+
+# ListMembers returns at most 20 results per page.
+MAX_MEMBERS_PAGE_SIZE = 20
+
+# LogPublishingConfiguration payloads, keyed by whether CA logs are enabled. Built once
+# and shared by every request; botocore only reads request parameters.
+MEMBER_LOG_PUBLISHING = {
+    enabled: {'Fabric': {'CaLogs': {'Cloudwatch': {'Enabled': enabled}}}}
+    for enabled in (False, True)
+}
+
+
+@asyncify
 class ManagedBlockchainMembers:
+    __slots__ = ('client', '_cache')
+
     def __init__(self):
-        self.client = boto3.client('managedblockchain')
+        self.client = get_managed_blockchain_client()
+        self._cache = TTLCache(maxsize=1024, ttl=60)
 
+    @handle_client_errors()
     def create_member(self, invitation_id: str, network_id: str, member_name: str, admin_username: str,
-                      admin_password: str, description: str = None, tags: dict = None, kms_key_arn: str = None):
+                      admin_password: str, description: str = None, tags: dict = None, kms_key_arn: str = None,
+                      client_request_token: Optional[str] = None):
         """
         Creates a new member within a Managed Blockchain network.
 
@@ -20,57 +45,57 @@ class ManagedBlockchainMembers:
         :param description: Optional description of the member.
         :param tags: Optional dictionary of key-value pairs for tagging.
         :param kms_key_arn: Optional KMS Key ARN for encryption at rest.
+        :param client_request_token: Optional idempotency token; a fresh random token is used when omitted.
         :return: Dictionary containing the `MemberId` of the created member.
         """
-        try:
-            response = self.client.create_member(
-                ClientRequestToken=str(uuid.uuid4()),  # Ensures idempotency
-                InvitationId=invitation_id,
-                NetworkId=network_id,
-                MemberConfiguration={
-                    'Name': member_name,
-                    'Description': description or "",
-                    'FrameworkConfiguration': {
-                        'Fabric': {
-                            'AdminUsername': admin_username,
-                            'AdminPassword': admin_password
-                        }
-                    },
-                    'LogPublishingConfiguration': {
-                        'Fabric': {
-                            'CaLogs': {
-                                'Cloudwatch': {
-                                    'Enabled': True
-                                }
-                            }
-                        }
-                    },
-                    'Tags': tags if tags else {},
-                    'KmsKeyArn': kms_key_arn or ""
+        member_configuration = {
+            'Name': member_name,
+            'FrameworkConfiguration': {
+                'Fabric': {
+                    'AdminUsername': admin_username,
+                    'AdminPassword': admin_password
                 }
-            )
-            return response
-        except self.client.exceptions.InvalidRequestException as e:
-            print(f"Invalid request: {e}")
-        except self.client.exceptions.AccessDeniedException as e:
-            print(f"Access denied: {e}")
-        except self.client.exceptions.ResourceNotFoundException as e:
-            print(f"Resource not found: {e}")
-        except self.client.exceptions.ResourceAlreadyExistsException as e:
-            print(f"Member already exists: {e}")
-        except self.client.exceptions.ResourceNotReadyException as e:
-            print(f"Resource not ready: {e}")
-        except self.client.exceptions.ThrottlingException as e:
-            print(f"Throttling limit reached: {e}")
-        except self.client.exceptions.ResourceLimitExceededException as e:
-            print(f"Resource limit exceeded: {e}")
-        except self.client.exceptions.InternalServiceErrorException as e:
-            print(f"Internal service error: {e}")
-        except self.client.exceptions.TooManyTagsException as e:
-            print(f"Too many tags: {e}")
-
-        return None
+            },
+            'LogPublishingConfiguration': MEMBER_LOG_PUBLISHING[True]
+        }
+        # Optional fields are omitted rather than sent empty; an empty KmsKeyArn fails validation.
+        if description:
+            member_configuration['Description'] = description
+        if tags:
+            member_configuration['Tags'] = tags
+        if kms_key_arn:
+            member_configuration['KmsKeyArn'] = kms_key_arn
+
+        params = {
+            'ClientRequestToken': client_request_token or secrets.token_hex(16),  # Ensures idempotency
+            'InvitationId': invitation_id,
+            'NetworkId': network_id,
+            'MemberConfiguration': member_configuration
+        }
+
+        response = self.client.create_member(**params)
+        return response
+
+    def create_members_bulk(self, specs: List[Dict], max_workers: int = 16) -> List[Optional[Dict]]:
+        """
+        Creates several members concurrently.
+
+        Concurrency is bounded by `max_workers` and the client's connection pool; any
+        throttling that results is absorbed by the client's adaptive retry mode.
 
+        :param specs: A list of keyword-argument dictionaries, one per `create_member` call.
+        :param max_workers: The maximum number of concurrent requests.
+        :return: The `create_member` results, in the same order as `specs`.
+        """
+        if not specs:
+            return []
+
+        max_workers = min(len(specs), max_workers, CLIENT_CONFIG.max_pool_connections)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda spec: self.create_member(**spec), specs))
+
+    @cached_read()
+    @handle_client_errors()
     def get_member(self, network_id: str, member_id: str):
         """
         Retrieves detailed information about a specific member.
@@ -79,21 +104,24 @@ class ManagedBlockchainMembers:
         :param member_id: The unique identifier of the member.
         :return: Dictionary containing member details or None if an error occurs.
         """
-        try:
-            response = self.client.get_member(NetworkId=network_id, MemberId=member_id)
-            return response.get("Member", {})
-        except self.client.exceptions.InvalidRequestException as e:
-            print(f"Invalid request: {e}")
-        except self.client.exceptions.AccessDeniedException as e:
-            print(f"Access denied: {e}")
-        except self.client.exceptions.ResourceNotFoundException as e:
-            print(f"Resource not found: {e}")
-        except self.client.exceptions.ThrottlingException as e:
-            print(f"Throttling limit reached: {e}")
-        except self.client.exceptions.InternalServiceErrorException as e:
-            print(f"Internal service error: {e}")
-
-        return None
+        response = self.client.get_member(NetworkId=network_id, MemberId=member_id)
+        return response.get("Member", {})
+
+    def get_members_bulk(self, network_id: str, member_ids: List[str], max_workers: int = 16) -> List[Optional[Dict]]:
+        """
+        Retrieves several members of a network concurrently.
+
+        :param network_id: The unique identifier of the network.
+        :param member_ids: The unique identifiers of the members to retrieve.
+        :param max_workers: The maximum number of concurrent requests.
+        :return: The `get_member` results, in the same order as `member_ids`.
+        """
+        if not member_ids:
+            return []
+
+        max_workers = min(len(member_ids), max_workers, CLIENT_CONFIG.max_pool_connections)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda member_id: self.get_member(network_id, member_id), member_ids))
 
     def list_members(
             self,
@@ -116,24 +144,34 @@ class ManagedBlockchainMembers:
         :return: A dictionary containing the list of members and the next pagination token.
         """
         try:
-            params = {"NetworkId": network_id}
-            if name:
-                params["Name"] = name
-            if status:
-                params["Status"] = status
-            if is_owned is not None:
-                params["IsOwned"] = is_owned
-            if max_results:
-                params["MaxResults"] = max_results
-            if next_token:
-                params["NextToken"] = next_token
+            # `is not None` rather than truthiness, so IsOwned=False is still sent
+            params = {"NetworkId": network_id, **{
+                key: value for key, value in (
+                    ("Name", name), ("Status", status), ("IsOwned", is_owned),
+                    ("MaxResults", max_results), ("NextToken", next_token)
+                ) if value is not None
+            }}
 
             response = self.client.list_members(**params)
             return response
         except botocore.exceptions.BotoCoreError as e:
-            print(f"Error listing members: {e}")
+            logger.warning("Error listing members: %s", e)
             return {}
 
+    def iter_members(self, network_id: str) -> Iterator[Dict]:
+        """
+        Yields the members of a network page by page instead of collecting them all in memory.
+
+        ListMembers has no boto3 paginator, so pages are requested at the maximum
+        page size to keep the number of round trips down.
+
+        :param network_id: The unique identifier of the network.
+        :return: An iterator over all members in the network.
+        """
+        pages = iter_token_pages(self.client.list_members, NetworkId=network_id, MaxResults=MAX_MEMBERS_PAGE_SIZE)
+        for page in pages:
+            yield from page.get('Members', [])
+
     def get_all_members(self, network_id: str) -> List[Dict]:
         """
         Retrieves all members in a specified network, handling pagination.
@@ -141,19 +179,13 @@ class ManagedBlockchainMembers:
         :param network_id: The unique identifier of the network.
         :return: A list of all members in the network.
         """
-        members = []
-        next_token = None
-
-        while True:
-            response = self.list_members(network_id=network_id, next_token=next_token)
-            if 'Members' in response:
-                members.extend(response['Members'])
-            next_token = response.get('NextToken')
-            if not next_token:
-                break
-
-        return members
+        try:
+            return list(self.iter_members(network_id))
+        except botocore.exceptions.BotoCoreError as e:
+            logger.warning("Error listing members: %s", e)
+            return []
 
+    @handle_client_errors()
     def delete_member(self, network_id: str, member_id: str):
         """
         Deletes a member from a specified network in AWS Managed Blockchain.
@@ -162,28 +194,31 @@ class ManagedBlockchainMembers:
         :param member_id: The unique identifier of the member to remove.
         :return: None if successful, otherwise an error message.
         """
-        try:
-            response = self.client.delete_member(
-                NetworkId=network_id,
-                MemberId=member_id
-            )
-            print(f"Member {member_id} has been removed from network {network_id}.")
-            return response
-        except self.client.exceptions.InvalidRequestException as e:
-            print(f"Invalid request: {e}")
-        except self.client.exceptions.AccessDeniedException as e:
-            print(f"Access denied: {e}")
-        except self.client.exceptions.ResourceNotFoundException as e:
-            print(f"Resource not found: {e}")
-        except self.client.exceptions.ResourceNotReadyException as e:
-            print(f"Resource not ready: {e}")
-        except self.client.exceptions.ThrottlingException as e:
-            print(f"Throttling limit reached: {e}")
-        except self.client.exceptions.InternalServiceErrorException as e:
-            print(f"Internal service error: {e}")
-
-        return None
+        response = self.client.delete_member(
+            NetworkId=network_id,
+            MemberId=member_id
+        )
+        self._cache.invalidate('get_member', network_id, member_id)
+        logger.info("Member %s has been removed from network %s.", member_id, network_id)
+        return response
+
+    def delete_members_bulk(self, network_id: str, member_ids: List[str], max_workers: int = 16) -> List[Optional[Dict]]:
+        """
+        Deletes several members of a network concurrently.
 
+        :param network_id: The unique identifier of the network.
+        :param member_ids: The unique identifiers of the members to remove.
+        :param max_workers: The maximum number of concurrent requests.
+        :return: The `delete_member` results, in the same order as `member_ids`.
+        """
+        if not member_ids:
+            return []
+
+        max_workers = min(len(member_ids), max_workers, CLIENT_CONFIG.max_pool_connections)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda member_id: self.delete_member(network_id, member_id), member_ids))
+
+    @handle_client_errors(default=False)
     def update_member(self, network_id: str, member_id: str, enable_logging: bool) -> bool:
         """
         Updates the member's log publishing configuration.
@@ -197,18 +232,11 @@ class ManagedBlockchainMembers:
             response = self.client.update_member(
                 NetworkId=network_id,
                 MemberId=member_id,
-                LogPublishingConfiguration={
-                    'Fabric': {
-                        'CaLogs': {
-                            'Cloudwatch': {
-                                'Enabled': enable_logging
-                            }
-                        }
-                    }
-                }
+                LogPublishingConfiguration=MEMBER_LOG_PUBLISHING[bool(enable_logging)]
             )
-            print(f"Successfully updated member {member_id} in network {network_id}. Logging enabled: {enable_logging}")
+            self._cache.invalidate('get_member', network_id, member_id)
+            logger.info("Successfully updated member %s in network %s. Logging enabled: %s", member_id, network_id, enable_logging)
             return True
         except botocore.exceptions.BotoCoreError as e:
-            print(f"Error updating member: {e}")
+            logger.warning("Error updating member: %s", e)
             return False
@@ -1,11 +1,27 @@
-import boto3
+import logging
+import secrets
 import botocore
-import uuid
-from typing import Optional, Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, List, Iterator
 
+from src.config.settings import CLIENT_CONFIG, get_managed_blockchain_client
+from src.managed_blockchain.managed_blockchain_utils import (
+    TTLCache, asyncify, cached_read, handle_client_errors, iter_token_pages
+)
+
+logger = logging.getLogger(__name__)
+
+# ListNetworks returns at most 10 results per page.
+MAX_NETWORKS_PAGE_SIZE = 10
+
+
+@asyncify
 class ManagedBlockchainNetwork:
+    __slots__ = ('client', '_cache')
+
     def __init__(self):
-        self.client = boto3.client('managedblockchain')
+        self.client = get_managed_blockchain_client()
+        self._cache = TTLCache(maxsize=1024, ttl=60)
 
     def list_networks(
             self,
@@ -26,43 +42,45 @@ class ManagedBlockchainNetwork:
         :return: A dictionary containing the list of networks and the next pagination token.
         """
         try:
-            params = {}
-            if name:
-                params["Name"] = name
-            if framework:
-                params["Framework"] = framework
-            if status:
-                params["Status"] = status
-            if max_results:
-                params["MaxResults"] = max_results
-            if next_token:
-                params["NextToken"] = next_token
+            params = {
+                key: value for key, value in (
+                    ("Name", name), ("Framework", framework), ("Status", status),
+                    ("MaxResults", max_results), ("NextToken", next_token)
+                ) if value is not None
+            }
 
             response = self.client.list_networks(**params)
             return response
         except botocore.exceptions.BotoCoreError as e:
-            print(f"Error listing networks: {e}")
+            logger.warning("Error listing networks: %s", e)
             return {}
 
+    def iter_networks(self) -> Iterator[Dict]:
+        """
+        Yields networks page by page instead of collecting them all in memory.
+
+        ListNetworks has no boto3 paginator, so pages are requested at the maximum
+        page size to keep the number of round trips down.
+
+        :return: An iterator over all networks.
+        """
+        for page in iter_token_pages(self.client.list_networks, MaxResults=MAX_NETWORKS_PAGE_SIZE):
+            yield from page.get('Networks', [])
+
     def get_all_networks(self) -> List[Dict]:
         """
         Retrieves all networks the AWS account participates in, handling pagination.
 
         :return: A list of all networks.
         """
-        networks = []
-        next_token = None
-
-        while True:
-            response = self.list_networks(next_token=next_token)
-            if 'Networks' in response:
-                networks.extend(response['Networks'])
-            next_token = response.get('NextToken')
-            if not next_token:
-                break
-
-        return networks
+        try:
+            return list(self.iter_networks())
+        except botocore.exceptions.BotoCoreError as e:
+            logger.warning("Error listing networks: %s", e)
+            return []
 
+    @cached_read()
+    @handle_client_errors()
     def get_network(self, network_id: str):
         """
         Retrieves detailed information about a specific blockchain network.
@@ -70,22 +88,25 @@ class ManagedBlockchainNetwork:
         :param network_id: The unique identifier of the network.
         :return: Dictionary containing network details or None if an error occurs.
         """
-        try:
-            response = self.client.get_network(NetworkId=network_id)
-            return response.get("Network", {})
-        except self.client.exceptions.InvalidRequestException as e:
-            print(f"Invalid request: {e}")
-        except self.client.exceptions.AccessDeniedException as e:
-            print(f"Access denied: {e}")
-        except self.client.exceptions.ResourceNotFoundException as e:
-            print(f"Resource not found: {e}")
-        except self.client.exceptions.ThrottlingException as e:
-            print(f"Throttling limit reached: {e}")
-        except self.client.exceptions.InternalServiceErrorException as e:
-            print(f"Internal service error: {e}")
-
-        return None
+        response = self.client.get_network(NetworkId=network_id)
+        return response.get("Network", {})
+
+    def get_networks_bulk(self, network_ids: List[str], max_workers: int = 16) -> List[Optional[Dict]]:
+        """
+        Retrieves several networks concurrently.
+
+        :param network_ids: The unique identifiers of the networks to retrieve.
+        :param max_workers: The maximum number of concurrent requests.
+        :return: The `get_network` results, in the same order as `network_ids`.
+        """
+        if not network_ids:
+            return []
+
+        max_workers = min(len(network_ids), max_workers, CLIENT_CONFIG.max_pool_connections)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.get_network, network_ids))
 
+    @handle_client_errors()
     def create_network(
         self,
         name: str,
@@ -96,6 +117,7 @@ class ManagedBlockchainNetwork:
         member_config: dict,
         description: str = "",
         tags: dict = None,
+        client_request_token: Optional[str] = None,
     ):
         """
         Creates a new blockchain network using Amazon Managed Blockchain.
@@ -108,38 +130,25 @@ class ManagedBlockchainNetwork:
         :param member_config: Configuration for the first member of the network.
         :param description: Optional description of the network.
         :param tags: Optional dictionary of tags.
+        :param client_request_token: Optional idempotency token; a fresh random token is used when omitted.
         :return: Dictionary containing the NetworkId and MemberId.
         """
-        try:
-            response = self.client.create_network(
-                ClientRequestToken=str(uuid.uuid4()),  # Ensures idempotency
-                Name=name,
-                Description=description,
-                Framework=framework,
-                FrameworkVersion=framework_version,
-                FrameworkConfiguration={"Fabric": {"Edition": edition}},
-                VotingPolicy={"ApprovalThresholdPolicy": voting_policy},
-                MemberConfiguration=member_config,
-                Tags=tags if tags else {},
-            )
-            return response
-        except self.client.exceptions.InvalidRequestException as e:
-            print(f"Invalid request: {e}")
-        except self.client.exceptions.AccessDeniedException as e:
-            print(f"Access denied: {e}")
-        except self.client.exceptions.ResourceAlreadyExistsException as e:
-            print(f"Resource already exists: {e}")
-        except self.client.exceptions.ThrottlingException as e:
-            print(f"Throttling limit reached: {e}")
-        except self.client.exceptions.ResourceLimitExceededException as e:
-            print(f"Resource limit exceeded: {e}")
-        except self.client.exceptions.InternalServiceErrorException as e:
-            print(f"Internal service error: {e}")
-        except self.client.exceptions.TooManyTagsException as e:
-            print(f"Too many tags: {e}")
-
-        return None
-
+        params = {
+            "ClientRequestToken": client_request_token or secrets.token_hex(16),  # Ensures idempotency
+            "Name": name,
+            "Description": description,
+            "Framework": framework,
+            "FrameworkVersion": framework_version,
+            "FrameworkConfiguration": {"Fabric": {"Edition": edition}},
+            "VotingPolicy": {"ApprovalThresholdPolicy": voting_policy},
+            "MemberConfiguration": member_config,
+            "Tags": tags if tags else {},
+        }
+
+        response = self.client.create_network(**params)
+        return response
+
+    @handle_client_errors(default=False)
     def delete_network(self, network_id: str):
         """
         Deletes a blockchain network from Amazon Managed Blockchain.
@@ -147,19 +156,7 @@ class ManagedBlockchainNetwork:
         :param network_id: The unique identifier of the network.
         :return: Boolean indicating success or failure.
         """
-        try:
-            self.client.delete_network(NetworkId=network_id)
-            print(f"Network {network_id} deletion initiated.")
-            return True
-        except self.client.exceptions.InvalidRequestException as e:
-            print(f"Invalid request: {e}")
-        except self.client.exceptions.AccessDeniedException as e:
-            print(f"Access denied: {e}")
-        except self.client.exceptions.ResourceNotFoundException as e:
-            print(f"Network not found: {e}")
-        except self.client.exceptions.ThrottlingException as e:
-            print(f"Throttling limit reached: {e}")
-        except self.client.exceptions.InternalServiceErrorException as e:
-            print(f"Internal service error: {e}")
-
-        return False
+        self.client.delete_network(NetworkId=network_id)
+        self._cache.invalidate('get_network', network_id)
+        logger.info("Network %s deletion initiated.", network_id)
+        return True
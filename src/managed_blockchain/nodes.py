@@ -1,13 +1,51 @@
-import uuid
-import boto3
+import itertools
+import logging
+import secrets
 import botocore
-from typing import Optional, Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, List, Iterator, Sequence
 
+from src.config.settings import CLIENT_CONFIG, get_managed_blockchain_client
+from src.managed_blockchain.managed_blockchain_utils import (
+    TTLCache, asyncify, cached_read, handle_client_errors, iter_token_pages, poll_until
+)
 
+logger = logging.getLogger(__name__)
+
+# ListNodes returns at most 20 results per page.
+MAX_NODES_PAGE_SIZE = 20
+
+# Every NodeStatus value.
+NODE_STATUSES = (
+    'CREATING', 'AVAILABLE', 'UNHEALTHY', 'CREATE_FAILED', 'UPDATING',
+    'DELETING', 'DELETED', 'FAILED', 'INACCESSIBLE_ENCRYPTION_KEY'
+)
+
+# LogPublishingConfiguration payloads, keyed by (chaincode logs enabled, peer logs enabled).
+# Built once and shared by every request; botocore only reads request parameters.
+NODE_LOG_PUBLISHING = {
+    (chaincode, peer): {
+        'Fabric': {
+            'ChaincodeLogs': {'Cloudwatch': {'Enabled': chaincode}},
+            'PeerLogs': {'Cloudwatch': {'Enabled': peer}}
+        }
+    }
+    for chaincode in (False, True) for peer in (False, True)
+}
+
+# Statuses a node passes through on its way to AVAILABLE.
+NODE_PENDING_STATUSES = frozenset({'CREATING', 'UPDATING'})
+
+
+@asyncify
 class ManagedBlockchainNodes:
+    __slots__ = ('client', '_cache')
+
     def __init__(self):
-        self.client = boto3.client('managedblockchain')
+        self.client = get_managed_blockchain_client()
+        self._cache = TTLCache(maxsize=1024, ttl=60)
 
+    @handle_client_errors()
     def create_node(
         self,
         network_id: str,
@@ -17,7 +55,8 @@ class ManagedBlockchainNodes:
         enable_chaincode_logs: bool = False,
         enable_peer_logs: bool = False,
         state_db: str = "CouchDB",
-        tags: dict = None
+        tags: dict = None,
+        client_request_token: Optional[str] = None
     ):
         """
         Creates a new node in a Managed Blockchain network.
@@ -30,58 +69,34 @@ class ManagedBlockchainNodes:
         :param enable_peer_logs: Enable CloudWatch logs for peer node actions (Hyperledger Fabric).
         :param state_db: The state database for Fabric nodes (LevelDB or CouchDB).
         :param tags: Optional dictionary of key-value pairs for tagging.
+        :param client_request_token: Optional idempotency token; a fresh random token is used when omitted.
         :return: Dictionary containing the `NodeId` of the created node.
         """
-        try:
-            node_config = {
-                'InstanceType': instance_type,
-                'LogPublishingConfiguration': {
-                    'Fabric': {
-                        'ChaincodeLogs': {
-                            'Cloudwatch': {'Enabled': enable_chaincode_logs}
-                        },
-                        'PeerLogs': {
-                            'Cloudwatch': {'Enabled': enable_peer_logs}
-                        }
-                    }
-                },
-                'StateDB': state_db
-            }
-
-            # Add Availability Zone if it's an Ethereum network
-            if availability_zone:
-                node_config["AvailabilityZone"] = availability_zone
-
-            response = self.client.create_node(
-                ClientRequestToken=str(uuid.uuid4()),  # Ensures idempotency
-                NetworkId=network_id,
-                MemberId=member_id if member_id else "",
-                NodeConfiguration=node_config,
-                Tags=tags if tags else {}
-            )
+        node_config = {'InstanceType': instance_type}
+        if availability_zone:
+            node_config['AvailabilityZone'] = availability_zone
+        # Log publishing and the state database only apply to Hyperledger Fabric, whose nodes belong to a member
+        if member_id:
+            node_config['LogPublishingConfiguration'] = NODE_LOG_PUBLISHING[
+                bool(enable_chaincode_logs), bool(enable_peer_logs)
+            ]
+            node_config['StateDB'] = state_db
 
-            return response
-        except self.client.exceptions.InvalidRequestException as e:
-            print(f"Invalid request: {e}")
-        except self.client.exceptions.AccessDeniedException as e:
-            print(f"Access denied: {e}")
-        except self.client.exceptions.ResourceNotFoundException as e:
-            print(f"Resource not found: {e}")
-        except self.client.exceptions.ResourceAlreadyExistsException as e:
-            print(f"Node already exists: {e}")
-        except self.client.exceptions.ResourceNotReadyException as e:
-            print(f"Resource not ready: {e}")
-        except self.client.exceptions.ThrottlingException as e:
-            print(f"Throttling limit reached: {e}")
-        except self.client.exceptions.ResourceLimitExceededException as e:
-            print(f"Resource limit exceeded: {e}")
-        except self.client.exceptions.InternalServiceErrorException as e:
-            print(f"Internal service error: {e}")
-        except self.client.exceptions.TooManyTagsException as e:
-            print(f"Too many tags: {e}")
-
-        return None
+        params = {
+            'ClientRequestToken': client_request_token or secrets.token_hex(16),  # Ensures idempotency
+            'NetworkId': network_id,
+            'NodeConfiguration': node_config,
+            'Tags': tags if tags else {}
+        }
+        if member_id:  # Required for Hyperledger Fabric, omitted for Ethereum
+            params['MemberId'] = member_id
+
+        response = self.client.create_node(**params)
 
+        return response
+
+    @cached_read()
+    @handle_client_errors()
     def get_node(self, network_id: str, node_id: str, member_id: str = None):
         """
         Retrieves detailed information about a specific blockchain node.
@@ -91,25 +106,30 @@ class ManagedBlockchainNodes:
         :param member_id: The unique identifier of the member (required for Hyperledger Fabric).
         :return: Dictionary containing node details or None if an error occurs.
         """
-        try:
-            params = {"NetworkId": network_id, "NodeId": node_id}
-            if member_id:
-                params["MemberId"] = member_id  # Required for Hyperledger Fabric
-
-            response = self.client.get_node(**params)
-            return response.get("Node", {})
-        except self.client.exceptions.InvalidRequestException as e:
-            print(f"Invalid request: {e}")
-        except self.client.exceptions.AccessDeniedException as e:
-            print(f"Access denied: {e}")
-        except self.client.exceptions.ResourceNotFoundException as e:
-            print(f"Resource not found: {e}")
-        except self.client.exceptions.ThrottlingException as e:
-            print(f"Throttling limit reached: {e}")
-        except self.client.exceptions.InternalServiceErrorException as e:
-            print(f"Internal service error: {e}")
-
-        return None
+        params = {"NetworkId": network_id, "NodeId": node_id}
+        if member_id:
+            params["MemberId"] = member_id  # Required for Hyperledger Fabric
+
+        response = self.client.get_node(**params)
+        return response.get("Node", {})
+
+    def get_nodes_bulk(self, network_id: str, node_ids: List[str], member_id: str = None,
+                       max_workers: int = 16) -> List[Optional[Dict]]:
+        """
+        Retrieves several nodes of a network concurrently.
+
+        :param network_id: The unique identifier of the network.
+        :param node_ids: The unique identifiers of the nodes to retrieve.
+        :param member_id: The unique identifier of the member (required for Hyperledger Fabric).
+        :param max_workers: The maximum number of concurrent requests.
+        :return: The `get_node` results, in the same order as `node_ids`.
+        """
+        if not node_ids:
+            return []
+
+        max_workers = min(len(node_ids), max_workers, CLIENT_CONFIG.max_pool_connections)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda node_id: self.get_node(network_id, node_id, member_id), node_ids))
 
     def list_nodes(
         self,
@@ -130,44 +150,81 @@ class ManagedBlockchainNodes:
         :return: A dictionary containing the list of nodes and the next pagination token.
         """
         try:
-            params = {"NetworkId": network_id}
-            if member_id:
-                params["MemberId"] = member_id
-            if status:
-                params["Status"] = status
-            if max_results:
-                params["MaxResults"] = max_results
-            if next_token:
-                params["NextToken"] = next_token
+            params = {"NetworkId": network_id, **{
+                key: value for key, value in (
+                    ("MemberId", member_id), ("Status", status),
+                    ("MaxResults", max_results), ("NextToken", next_token)
+                ) if value is not None
+            }}
 
             response = self.client.list_nodes(**params)
             return response
         except botocore.exceptions.BotoCoreError as e:
-            print(f"Error listing nodes: {e}")
+            logger.warning("Error listing nodes: %s", e)
             return {}
 
-    def get_all_nodes(self, network_id: str, member_id: Optional[str] = None) -> List[Dict]:
+    def iter_nodes(self, network_id: str, member_id: Optional[str] = None,
+                   status: Optional[str] = None) -> Iterator[Dict]:
+        """
+        Yields the nodes of a network page by page instead of collecting them all in memory.
+
+        ListNodes has no boto3 paginator, so pages are requested at the maximum
+        page size to keep the number of round trips down.
+
+        :param network_id: The unique identifier of the network.
+        :param member_id: The unique identifier of the member who owns the nodes (required for Hyperledger Fabric).
+        :param status: Optional node status to filter by.
+        :return: An iterator over all nodes within the network.
+        """
+        params = {"NetworkId": network_id, "MaxResults": MAX_NODES_PAGE_SIZE}
+        if member_id:
+            params["MemberId"] = member_id
+        if status:
+            params["Status"] = status
+
+        for page in iter_token_pages(self.client.list_nodes, **params):
+            yield from page.get('Nodes', [])
+
+    def get_all_nodes(self, network_id: str, member_id: Optional[str] = None,
+                      status: Optional[str] = None) -> List[Dict]:
         """
         Retrieves all nodes within a specified network, handling pagination.
 
         :param network_id: The unique identifier of the network.
         :param member_id: The unique identifier of the member who owns the nodes (required for Hyperledger Fabric).
+        :param status: Optional node status to filter by.
         :return: A list of all nodes within the network.
         """
-        nodes = []
-        next_token = None
+        try:
+            return list(self.iter_nodes(network_id, member_id, status))
+        except botocore.exceptions.BotoCoreError as e:
+            logger.warning("Error listing nodes: %s", e)
+            return []
+
+    def get_all_nodes_by_status(self, network_id: str, member_id: Optional[str] = None,
+                                statuses: Sequence[str] = NODE_STATUSES) -> List[Dict]:
+        """
+        Retrieves the nodes of a network that are in any of `statuses`, grouped by status.
 
-        while True:
-            response = self.list_nodes(network_id=network_id, member_id=member_id, next_token=next_token)
-            if 'Nodes' in response:
-                nodes.extend(response['Nodes'])
-            next_token = response.get('NextToken')
-            if not next_token:
-                break
+        The network is listed once, unfiltered, and the nodes are grouped client-side,
+        so asking for several statuses costs no more calls than a single listing.
 
-        return nodes
+        :param network_id: The unique identifier of the network.
+        :param member_id: The unique identifier of the member who owns the nodes (required for Hyperledger Fabric).
+        :param statuses: The node statuses to include. Defaults to every status.
+        :return: A list of the matching nodes, grouped in the order of `statuses`.
+        """
+        if not statuses:
+            return []
 
+        groups = {status: [] for status in statuses}
+        for node in self.get_all_nodes(network_id, member_id):
+            group = groups.get(node.get('Status'))
+            if group is not None:
+                group.append(node)
+        return list(itertools.chain.from_iterable(groups.values()))
 
+    @handle_client_errors()
     def delete_node(self, network_id: str, node_id: str, member_id: str = None):
         """
         Deletes a node from a specified blockchain network in AWS Managed Blockchain.
@@ -177,32 +234,19 @@ class ManagedBlockchainNodes:
         :param member_id: The unique identifier of the member (Required for Hyperledger Fabric).
         :return: None if successful, otherwise an error message.
         """
-        try:
-            params = {
-                "NetworkId": network_id,
-                "NodeId": node_id
-            }
-            if member_id:  # Required for Hyperledger Fabric
-                params["MemberId"] = member_id
-
-            response = self.client.delete_node(**params)
-            print(f"Node {node_id} has been removed from network {network_id}.")
-            return response
-        except self.client.exceptions.InvalidRequestException as e:
-            print(f"Invalid request: {e}")
-        except self.client.exceptions.AccessDeniedException as e:
-            print(f"Access denied: {e}")
-        except self.client.exceptions.ResourceNotFoundException as e:
-            print(f"Resource not found: {e}")
-        except self.client.exceptions.ResourceNotReadyException as e:
-            print(f"Resource not ready: {e}")
-        except self.client.exceptions.ThrottlingException as e:
-            print(f"Throttling limit reached: {e}")
-        except self.client.exceptions.InternalServiceErrorException as e:
-            print(f"Internal service error: {e}")
-
-        return None
+        params = {
+            "NetworkId": network_id,
+            "NodeId": node_id
+        }
+        if member_id:  # Required for Hyperledger Fabric
+            params["MemberId"] = member_id
+
+        response = self.client.delete_node(**params)
+        self._cache.invalidate('get_node', network_id, node_id)
+        logger.info("Node %s has been removed from network %s.", node_id, network_id)
+        return response
 
+    @handle_client_errors(default=False)
     def update_node(self, network_id: str, member_id: str, node_id: str, enable_chaincode_logs: bool,
                     enable_peer_logs: bool) -> bool:
         """
@@ -220,25 +264,70 @@ class ManagedBlockchainNodes:
                 NetworkId=network_id,
                 MemberId=member_id,
                 NodeId=node_id,
-                LogPublishingConfiguration={
-                    'Fabric': {
-                        'ChaincodeLogs': {
-                            'Cloudwatch': {
-                                'Enabled': enable_chaincode_logs
-                            }
-                        },
-                        'PeerLogs': {
-                            'Cloudwatch': {
-                                'Enabled': enable_peer_logs
-                            }
-                        }
-                    }
-                }
+                LogPublishingConfiguration=NODE_LOG_PUBLISHING[bool(enable_chaincode_logs), bool(enable_peer_logs)]
             )
-            print(f"Successfully updated node {node_id} in network {network_id}. "
-                  f"Chaincode logging enabled: {enable_chaincode_logs}, Peer logging enabled: {enable_peer_logs}")
+            self._cache.invalidate('get_node', network_id, node_id)
+            logger.info("Successfully updated node %s in network %s. Chaincode logging enabled: %s, Peer logging enabled: %s",
+                        node_id, network_id, enable_chaincode_logs, enable_peer_logs)
             return True
         except botocore.exceptions.BotoCoreError as e:
-            print(f"Error updating node: {e}")
+            logger.warning("Error updating node: %s", e)
             return False
 
+    def _poll_node(self, params: Dict, is_done, max_attempts: Optional[int], max_elapsed: float) -> Optional[Dict]:
+        def fetch():
+            try:
+                return self.client.get_node(**params).get("Node", {})
+            except botocore.exceptions.ClientError as e:
+                if e.response.get("Error", {}).get("Code") != "ResourceNotFoundException":
+                    raise
+                return {"Status": "DELETED"}
+
+        try:
+            return poll_until(fetch, is_done, max_attempts=max_attempts, max_elapsed=max_elapsed)
+        finally:
+            self._cache.invalidate('get_node', params["NetworkId"], params["NodeId"])
+
+    @handle_client_errors(default=False)
+    def wait_until_available(self, network_id: str, node_id: str, member_id: str = None,
+                             max_attempts: Optional[int] = None, max_elapsed: float = 1800.0) -> bool:
+        """
+        Waits for a node to finish creating or updating.
+
+        Managed Blockchain has no boto3 waiters, so the node is polled with jittered
+        exponential backoff (see `poll_until`).
+
+        :param network_id: The unique identifier of the network.
+        :param node_id: The unique identifier of the node.
+        :param member_id: The unique identifier of the member (required for Hyperledger Fabric).
+        :param max_attempts: Optional cap on the number of polling attempts.
+        :param max_elapsed: Bounds the total wait, in seconds, however many polls that took.
+        :return: True if the node became AVAILABLE, False if it failed or the wait ran out.
+        """
+        params = {"NetworkId": network_id, "NodeId": node_id}
+        if member_id:
+            params["MemberId"] = member_id
+
+        node = self._poll_node(params, lambda node: node.get("Status") not in NODE_PENDING_STATUSES,
+                               max_attempts, max_elapsed)
+        return bool(node) and node.get("Status") == "AVAILABLE"
+
+    @handle_client_errors(default=False)
+    def wait_until_deleted(self, network_id: str, node_id: str, member_id: str = None,
+                           max_attempts: Optional[int] = None, max_elapsed: float = 1800.0) -> bool:
+        """
+        Waits for a node to be deleted, polling with jittered exponential backoff.
+
+        :param network_id: The unique identifier of the network.
+        :param node_id: The unique identifier of the node.
+        :param member_id: The unique identifier of the member (required for Hyperledger Fabric).
+        :param max_attempts: Optional cap on the number of polling attempts.
+        :param max_elapsed: Bounds the total wait, in seconds, however many polls that took.
+        :return: True if the node is DELETED or no longer exists, False if the wait ran out.
+        """
+        params = {"NetworkId": network_id, "NodeId": node_id}
+        if member_id:
+            params["MemberId"] = member_id
+
+        node = self._poll_node(params, lambda node: node.get("Status") == "DELETED", max_attempts, max_elapsed)
+        return node is not None
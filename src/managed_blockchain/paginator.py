@@ -1,10 +1,15 @@
-import boto3
+import logging
 import botocore
 
+from src.config.settings import get_managed_blockchain_client
+
+logger = logging.getLogger(__name__)
+
 class ManagedBlockchainPaginator:
     def __init__(self):
         """Initialize the Managed Blockchain client."""
-        self.client = boto3.client('managedblockchain')
+        self.client = get_managed_blockchain_client()
+        self._paginators = {}
 
     def get_paginator(self, operation_name: str):
         """
@@ -13,17 +18,20 @@ class ManagedBlockchainPaginator:
         :param operation_name: The operation name (e.g., "list_networks", "list_members").
         :return: A paginator object or None if the operation is not pageable.
         """
+        if operation_name in self._paginators:
+            return self._paginators[operation_name]
+
         try:
             if not self.client.can_paginate(operation_name):
-                print(f"Operation '{operation_name}' is not pageable.")
+                logger.info("Operation '%s' is not pageable.", operation_name)
                 return None
 
-            paginator = self.client.get_paginator(operation_name)
+            paginator = self._paginators[operation_name] = self.client.get_paginator(operation_name)
             return paginator
         except botocore.exceptions.OperationNotPageableError as e:
-            print(f"Error: {e}")
+            logger.warning("Error: %s", e)
         except Exception as e:
-            print(f"Unexpected error occurred: {e}")
+            logger.warning("Unexpected error occurred: %s", e)
 
         return None
 
@@ -40,10 +48,11 @@ class ManagedBlockchainPaginator:
             return []
 
         results = []
+        extend, key = results.extend, operation_name.capitalize()
         try:
             for page in paginator.paginate(**kwargs):
-                results.extend(page.get(operation_name.capitalize(), []))
+                extend(page.get(key, ()))
         except Exception as e:
-            print(f"Error while paginating '{operation_name}': {e}")
+            logger.warning("Error while paginating '%s': %s", operation_name, e)
 
         return results
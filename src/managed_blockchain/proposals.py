@@ -1,13 +1,32 @@
-import boto3
-import uuid
+import copy
+import logging
+import secrets
 import botocore
-from typing import Optional, Dict, List
+from typing import Optional, Dict, Iterable, List, Iterator, Union
+
+from src.config.settings import get_managed_blockchain_client
+from src.managed_blockchain.managed_blockchain_utils import (
+    TTLCache, handle_client_errors, iter_token_pages, poll_until
+)
+
+logger = logging.getLogger(__name__)
+
+# ListProposals and ListProposalVotes return at most 100 results per page.
+MAX_PROPOSALS_PAGE_SIZE = 100
+MAX_PROPOSAL_VOTES_PAGE_SIZE = 100
+
+PROPOSAL_VOTES = frozenset({'YES', 'NO'})
+PROPOSAL_STATUSES = frozenset({'IN_PROGRESS', 'APPROVED', 'REJECTED', 'EXPIRED', 'ACTION_FAILED'})
+# Voting has closed on proposals in these statuses, so they no longer change.
+DECIDED_PROPOSAL_STATUSES = PROPOSAL_STATUSES - {'IN_PROGRESS'}
 
 
 class ManagedBlockchainProposals:
     def __init__(self):
-        self.client = boto3.client('managedblockchain')
+        self.client = get_managed_blockchain_client()
+        self._cache = TTLCache(maxsize=1024, ttl=60)
 
+    @handle_client_errors()
     def create_proposal(
         self,
         network_id: str,
@@ -15,7 +34,8 @@ class ManagedBlockchainProposals:
         invitations: list = None,
         removals: list = None,
         description: str = "",
-        tags: dict = None
+        tags: dict = None,
+        client_request_token: Optional[str] = None
     ):
         """
         Creates a proposal in a Managed Blockchain Hyperledger Fabric network.
@@ -26,61 +46,56 @@ class ManagedBlockchainProposals:
         :param removals: List of member IDs to remove from the network.
         :param description: Description of the proposal (optional).
         :param tags: Optional dictionary of key-value pairs for tagging.
+        :param client_request_token: Optional idempotency token; a fresh random token is used when omitted.
         :return: Dictionary containing the `ProposalId` of the created proposal.
         """
-        try:
-            actions = {}
+        actions = {}
 
-            if invitations:
-                actions["Invitations"] = [{"Principal": aws_id} for aws_id in invitations]
+        if invitations:
+            actions["Invitations"] = [{"Principal": aws_id} for aws_id in invitations]
 
-            if removals:
-                actions["Removals"] = [{"MemberId": member_id} for member_id in removals]
+        if removals:
+            actions["Removals"] = [{"MemberId": member_id} for member_id in removals]
 
-            if not actions:
-                raise ValueError("At least one action (invitations or removals) must be specified.")
+        if not actions:
+            raise ValueError("At least one action (invitations or removals) must be specified.")
 
-            response = self.client.create_proposal(
-                ClientRequestToken=str(uuid.uuid4()),  # Ensures idempotency
-                NetworkId=network_id,
-                MemberId=member_id,
-                Actions=actions,
-                Description=description,
-                Tags=tags if tags else {}
-            )
+        params = {
+            "ClientRequestToken": client_request_token or secrets.token_hex(16),  # Ensures idempotency
+            "NetworkId": network_id,
+            "MemberId": member_id,
+            "Actions": actions,
+            "Description": description,
+            "Tags": tags if tags else {}
+        }
 
-            return response
-        except self.client.exceptions.InvalidRequestException as e:
-            print(f"Invalid request: {e}")
-        except self.client.exceptions.AccessDeniedException as e:
-            print(f"Access denied: {e}")
-        except self.client.exceptions.ResourceNotFoundException as e:
-            print(f"Resource not found: {e}")
-        except self.client.exceptions.ResourceNotReadyException as e:
-            print(f"Resource not ready: {e}")
-        except self.client.exceptions.ThrottlingException as e:
-            print(f"Throttling limit reached: {e}")
-        except self.client.exceptions.InternalServiceErrorException as e:
-            print(f"Internal service error: {e}")
-        except self.client.exceptions.TooManyTagsException as e:
-            print(f"Too many tags: {e}")
-
-        return None
+        response = self.client.create_proposal(**params)
+
+        return response
 
     def get_proposal(self, network_id: str, proposal_id: str):
         """
         Retrieves detailed information about a specific proposal.
 
+        Only decided proposals are cached; open ones are always re-read, since their
+        `Status` and `VotingSummary` change as members vote.
+
         :param network_id: The unique identifier of the network for which the proposal is made.
         :param proposal_id: The unique identifier of the proposal.
         :return: Dictionary containing proposal details or None if an error occurs.
         """
-        try:
-            response = self.client.get_proposal(NetworkId=network_id, ProposalId=proposal_id)
-            return response.get("Proposal", {})
-        except botocore.exceptions.ClientError as e:
-            print(f"Error retrieving proposal {proposal_id}: {e}")
-        return None
+        key = ('get_proposal', network_id, proposal_id)
+        proposal = self._cache.get(key)
+        if proposal is None:
+            proposal = self._get_proposal(network_id, proposal_id)
+            if proposal and proposal.get("Status") in DECIDED_PROPOSAL_STATUSES:
+                self._cache.set(key, proposal)
+        return copy.deepcopy(proposal)
+
+    @handle_client_errors()
+    def _get_proposal(self, network_id: str, proposal_id: str) -> Optional[Dict]:
+        response = self.client.get_proposal(NetworkId=network_id, ProposalId=proposal_id)
+        return response.get("Proposal", {})
 
     def list_proposals(
         self,
@@ -97,18 +112,31 @@ class ManagedBlockchainProposals:
         :return: A dictionary containing the list of proposals and the next pagination token.
         """
         try:
-            params = {"NetworkId": network_id}
-            if max_results:
-                params["MaxResults"] = max_results
-            if next_token:
-                params["NextToken"] = next_token
+            params = {"NetworkId": network_id, **{
+                key: value for key, value in (("MaxResults", max_results), ("NextToken", next_token))
+                if value is not None
+            }}
 
             response = self.client.list_proposals(**params)
             return response
         except botocore.exceptions.BotoCoreError as e:
-            print(f"Error listing proposals: {e}")
+            logger.warning("Error listing proposals: %s", e)
             return {}
 
+    def iter_proposals(self, network_id: str) -> Iterator[Dict]:
+        """
+        Yields the proposals of a network page by page instead of collecting them all in memory.
+
+        ListProposals has no boto3 paginator, so pages are requested at the maximum
+        page size to keep the number of round trips down.
+
+        :param network_id: The unique identifier of the network.
+        :return: An iterator over all proposals.
+        """
+        pages = iter_token_pages(self.client.list_proposals, NetworkId=network_id, MaxResults=MAX_PROPOSALS_PAGE_SIZE)
+        for page in pages:
+            yield from page.get('Proposals', [])
+
     def get_all_proposals(self, network_id: str) -> List[Dict]:
         """
         Retrieves all proposals for a network, handling pagination.
@@ -116,30 +144,30 @@ class ManagedBlockchainProposals:
         :param network_id: The unique identifier of the network.
         :return: A list of all proposals.
         """
-        proposals = []
-        next_token = None
-
-        while True:
-            response = self.list_proposals(network_id=network_id, next_token=next_token)
-            if 'Proposals' in response:
-                proposals.extend(response['Proposals'])
-            next_token = response.get('NextToken')
-            if not next_token:
-                break
-
-        return proposals
+        try:
+            return list(self.iter_proposals(network_id))
+        except botocore.exceptions.BotoCoreError as e:
+            logger.warning("Error listing proposals: %s", e)
+            return []
 
-    def filter_proposals_by_status(self, network_id: str, status: str) -> List[Dict]:
+    def filter_proposals_by_status(self, network_id: str, status: Union[str, Iterable[str]]) -> List[Dict]:
         """
-        Retrieves all proposals for a network and filters by status.
+        Retrieves the proposals of a network that have the given status.
+
+        ListProposals has no status filter, so proposals are streamed and filtered as
+        each page arrives instead of collecting the full list first.
 
         :param network_id: The unique identifier of the network.
-        :param status: The status to filter proposals by.
-                       Options: 'IN_PROGRESS', 'APPROVED', 'REJECTED', 'EXPIRED', 'ACTION_FAILED'
+        :param status: The status, or collection of statuses, to filter proposals by
+                       (see `PROPOSAL_STATUSES`).
         :return: A list of proposals matching the specified status.
         """
-        all_proposals = self.get_all_proposals(network_id)
-        return [proposal for proposal in all_proposals if proposal.get("Status") == status]
+        statuses = {status} if isinstance(status, str) else set(status)
+        try:
+            return [proposal for proposal in self.iter_proposals(network_id) if proposal.get("Status") in statuses]
+        except botocore.exceptions.BotoCoreError as e:
+            logger.warning("Error listing proposals: %s", e)
+            return []
 
     def vote_on_proposal(self, network_id: str, proposal_id: str, voter_member_id: str, vote: str) -> bool:
         """
@@ -151,8 +179,8 @@ class ManagedBlockchainProposals:
         :param vote: The value of the vote ('YES' or 'NO').
         :return: True if the vote is successful, False otherwise.
         """
-        if vote not in ["YES", "NO"]:
-            print("Invalid vote value. Vote must be 'YES' or 'NO'.")
+        if vote not in PROPOSAL_VOTES:
+            logger.warning("Invalid vote value %r. Vote must be 'YES' or 'NO'.", vote)
             return False
 
         try:
@@ -162,13 +190,39 @@ class ManagedBlockchainProposals:
                 VoterMemberId=voter_member_id,
                 Vote=vote
             )
-            print(
-                f"Successfully cast {vote} vote on proposal {proposal_id} in network {network_id} as member {voter_member_id}.")
+            self._cache.invalidate('get_proposal', network_id, proposal_id)
+            logger.info("Successfully cast %s vote on proposal %s in network %s as member %s.",
+                        vote, proposal_id, network_id, voter_member_id)
             return True
         except botocore.exceptions.BotoCoreError as e:
-            print(f"Error voting on proposal: {e}")
+            logger.warning("Error voting on proposal: %s", e)
             return False
 
+    @handle_client_errors()
+    def wait_until_decided(self, network_id: str, proposal_id: str, max_attempts: Optional[int] = None,
+                           max_elapsed: float = 1800.0) -> Optional[str]:
+        """
+        Waits for voting on a proposal to close, e.g. after casting a vote.
+
+        Managed Blockchain has no boto3 waiters, so the proposal is polled with
+        jittered exponential backoff (see `poll_until`).
+
+        :param network_id: The unique identifier of the network.
+        :param proposal_id: The unique identifier of the proposal.
+        :param max_attempts: Optional cap on the number of polling attempts.
+        :param max_elapsed: Bounds the total wait, in seconds, however many polls that took.
+        :return: The final status (e.g. 'APPROVED', 'REJECTED'), or None if voting is still open.
+        """
+        def fetch():
+            return self.client.get_proposal(NetworkId=network_id, ProposalId=proposal_id).get("Proposal", {})
+
+        try:
+            proposal = poll_until(fetch, lambda proposal: proposal.get("Status") != "IN_PROGRESS",
+                                  max_attempts=max_attempts, max_elapsed=max_elapsed)
+        finally:
+            self._cache.invalidate('get_proposal', network_id, proposal_id)
+        return proposal.get("Status") if proposal else None
+
     def list_proposal_votes(
             self,
             network_id: str,
@@ -186,35 +240,62 @@ class ManagedBlockchainProposals:
         :return: A dictionary containing the list of votes and the next pagination token.
         """
         try:
-            params = {"NetworkId": network_id, "ProposalId": proposal_id}
-            if max_results:
-                params["MaxResults"] = max_results
-            if next_token:
-                params["NextToken"] = next_token
+            params = {"NetworkId": network_id, "ProposalId": proposal_id, **{
+                key: value for key, value in (("MaxResults", max_results), ("NextToken", next_token))
+                if value is not None
+            }}
 
             response = self.client.list_proposal_votes(**params)
             return response
         except botocore.exceptions.BotoCoreError as e:
-            print(f"Error listing proposal votes: {e}")
+            logger.warning("Error listing proposal votes: %s", e)
             return {}
 
+    def iter_proposal_votes(self, network_id: str, proposal_id: str) -> Iterator[Dict]:
+        """
+        Yields the votes cast on a proposal page by page instead of collecting them all in memory.
+
+        ListProposalVotes has no boto3 paginator, so pages are requested at the maximum
+        page size to keep the number of round trips down.
+
+        :param network_id: The unique identifier of the network.
+        :param proposal_id: The unique identifier of the proposal.
+        :return: An iterator over all votes cast for the proposal.
+        """
+        pages = iter_token_pages(self.client.list_proposal_votes, NetworkId=network_id, ProposalId=proposal_id,
+                                 MaxResults=MAX_PROPOSAL_VOTES_PAGE_SIZE)
+        for page in pages:
+            yield from page.get('ProposalVotes', [])
+
     def get_all_proposal_votes(self, network_id: str, proposal_id: str) -> List[Dict]:
         """
         Retrieves all votes for a specified proposal, handling pagination.
 
+        Deprecated for large vote histories: prefer `iter_proposal_votes`, which lets
+        callers stop paging as soon as they have what they need.
+
         :param network_id: The unique identifier of the network.
         :param proposal_id: The unique identifier of the proposal.
         :return: A list of all votes cast for the proposal.
         """
-        votes = []
-        next_token = None
+        try:
+            return list(self.iter_proposal_votes(network_id, proposal_id))
+        except botocore.exceptions.BotoCoreError as e:
+            logger.warning("Error listing proposal votes: %s", e)
+            return []
 
-        while True:
-            response = self.list_proposal_votes(network_id=network_id, proposal_id=proposal_id, next_token=next_token)
-            if 'ProposalVotes' in response:
-                votes.extend(response['ProposalVotes'])
-            next_token = response.get('NextToken')
-            if not next_token:
-                break
+    def get_member_vote(self, network_id: str, proposal_id: str, member_id: str) -> Optional[str]:
+        """
+        Returns how a member voted on a proposal, paging only until the vote is found.
 
-        return votes
\ No newline at end of file
+        :param network_id: The unique identifier of the network.
+        :param proposal_id: The unique identifier of the proposal.
+        :param member_id: The unique identifier of the voting member.
+        :return: 'YES' or 'NO', or None if the member has not voted or an error occurs.
+        """
+        try:
+            votes = self.iter_proposal_votes(network_id, proposal_id)
+            return next((vote.get("Vote") for vote in votes if vote.get("MemberId") == member_id), None)
+        except botocore.exceptions.BotoCoreError as e:
+            logger.warning("Error listing proposal votes: %s", e)
+            return None
@@ -1,10 +1,40 @@
-import boto3
+import logging
+import re
 import botocore
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Optional
 
+from src.config.settings import CLIENT_CONFIG, get_managed_blockchain_client
+from src.managed_blockchain.managed_blockchain_utils import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# AWS tag constraints: letters, digits, spaces and _ . : / = + - @; keys 1-128 characters,
+# values 0-256. Checked locally so malformed tags fail without a round trip.
+TAG_KEY_PATTERN = re.compile(r'[\w .:/=+\-@]{1,128}')
+TAG_VALUE_PATTERN = re.compile(r'[\w .:/=+\-@]{0,256}')
+
+
+def validate_tags(tags: dict = None, tag_keys: list = None):
+    """
+    Raises ValueError if any tag key or value breaks the AWS tag constraints.
+
+    :param tags: Tags to be assigned (key-value pairs).
+    :param tag_keys: Tag keys to be removed.
+    """
+    invalid = [
+        key for key, value in (tags or {}).items()
+        if not TAG_KEY_PATTERN.fullmatch(key) or not isinstance(value, str) or not TAG_VALUE_PATTERN.fullmatch(value)
+    ]
+    invalid += [key for key in tag_keys or [] if not TAG_KEY_PATTERN.fullmatch(key)]
+    if invalid:
+        raise ValueError(f"Invalid tag keys or values: {invalid}")
+
+
 class ManagedBlockchainTags:
     def __init__(self):
-        self.client = boto3.client('managedblockchain')
+        self.client = get_managed_blockchain_client()
+        self._cache = TTLCache(maxsize=1024, ttl=60)
 
     def list_tags_for_resource(self, resource_arn: str) -> Dict[str, str]:
         """
@@ -13,11 +43,14 @@ class ManagedBlockchainTags:
         :param resource_arn: The Amazon Resource Name (ARN) of the resource.
         :return: A dictionary containing key-value pairs of tags.
         """
+        def load():
+            return self.client.list_tags_for_resource(ResourceArn=resource_arn).get("Tags", {})
+
         try:
-            response = self.client.list_tags_for_resource(ResourceArn=resource_arn)
-            return response.get("Tags", {})
+            # Errors fall through to the handler below, so only successful lookups are cached.
+            return dict(self._cache.get_or_load(('list_tags_for_resource', resource_arn), load))
         except botocore.exceptions.BotoCoreError as e:
-            print(f"Error retrieving tags: {e}")
+            logger.warning("Error retrieving tags: %s", e)
             return {}
 
     def print_tags(self, resource_arn: str):
@@ -30,9 +63,8 @@ class ManagedBlockchainTags:
         if not tags:
             print(f"No tags found for resource: {resource_arn}")
         else:
-            print(f"Tags for {resource_arn}:")
-            for key, value in tags.items():
-                print(f"  {key}: {value}")
+            lines = "".join(f"\n  {key}: {value}" for key, value in tags.items())
+            print(f"Tags for {resource_arn}:{lines}")
 
     def tag_resource(self, resource_arn: str, tags: dict) -> bool:
         """
@@ -41,13 +73,16 @@ class ManagedBlockchainTags:
         :param resource_arn: The Amazon Resource Name (ARN) of the resource.
         :param tags: A dictionary of tags to assign (key-value pairs).
         :return: True if tagging was successful, False otherwise.
+        :raises ValueError: If a tag key or value is malformed.
         """
+        validate_tags(tags=tags)
         try:
             self.client.tag_resource(ResourceArn=resource_arn, Tags=tags)
-            print(f"Successfully tagged resource: {resource_arn} with tags: {tags}")
+            self._cache.invalidate('list_tags_for_resource', resource_arn)
+            logger.info("Successfully tagged resource: %s with tags: %s", resource_arn, tags)
             return True
         except botocore.exceptions.BotoCoreError as e:
-            print(f"Error tagging resource: {e}")
+            logger.warning("Error tagging resource: %s", e)
             return False
 
     def untag_resource(self, resource_arn: str, tag_keys: list) -> bool:
@@ -57,11 +92,83 @@ class ManagedBlockchainTags:
         :param resource_arn: The Amazon Resource Name (ARN) of the resource.
         :param tag_keys: A list of tag keys to remove.
         :return: True if untagging was successful, False otherwise.
+        :raises ValueError: If a tag key is malformed.
         """
+        validate_tags(tag_keys=tag_keys)
         try:
             self.client.untag_resource(ResourceArn=resource_arn, TagKeys=tag_keys)
-            print(f"Successfully removed tags: {tag_keys} from resource: {resource_arn}")
+            self._cache.invalidate('list_tags_for_resource', resource_arn)
+            logger.info("Successfully removed tags: %s from resource: %s", tag_keys, resource_arn)
             return True
         except botocore.exceptions.BotoCoreError as e:
-            print(f"Error removing tags: {e}")
+            logger.warning("Error removing tags: %s", e)
             return False
+
+
+class TagBatcher:
+    """
+    Buffers tag mutations and applies them concurrently when the block exits.
+
+    Mutations for the same resource are merged, so each ARN gets at most one
+    TagResource and one UntagResource call:
+
+        with TagBatcher(ManagedBlockchainTags()) as batch:
+            for arn in arns:
+                batch.tag(arn, {"Owner": "ledger-team"})
+    """
+
+    def __init__(self, tags_client: ManagedBlockchainTags, max_workers: int = 16):
+        self.tags_client = tags_client
+        self.max_workers = max_workers
+        self._tags: Dict[str, dict] = {}
+        self._tag_keys: Dict[str, set] = {}
+
+    def tag(self, resource_arn: str, tags: dict):
+        """Queues tags to add to or overwrite on the resource."""
+        validate_tags(tags=tags)
+        self._tags.setdefault(resource_arn, {}).update(tags)
+        self._tag_keys.get(resource_arn, set()).difference_update(tags)
+
+    def untag(self, resource_arn: str, tag_keys: list):
+        """Queues tag keys to remove from the resource."""
+        validate_tags(tag_keys=tag_keys)
+        self._tag_keys.setdefault(resource_arn, set()).update(tag_keys)
+        for key in tag_keys:
+            self._tags.get(resource_arn, {}).pop(key, None)
+
+    def _apply(self, resource_arn: str) -> bool:
+        tags = self._tags.get(resource_arn)
+        tag_keys = self._tag_keys.get(resource_arn)
+        try:
+            tagged = not tags or self.tags_client.tag_resource(resource_arn, tags)
+            untagged = not tag_keys or self.tags_client.untag_resource(resource_arn, sorted(tag_keys))
+        except botocore.exceptions.ClientError as e:
+            # One failing resource must not discard the results of the others.
+            logger.warning("Error updating tags of %s: %s", resource_arn, e)
+            return False
+        return tagged and untagged
+
+    def flush(self) -> Dict[str, bool]:
+        """
+        Applies the queued mutations, one worker per resource, and clears the queue.
+
+        :return: A dictionary mapping each resource ARN to whether all of its mutations succeeded.
+        """
+        resource_arns = list(dict.fromkeys([*self._tags, *self._tag_keys]))
+        if not resource_arns:
+            return {}
+
+        max_workers = min(len(resource_arns), self.max_workers, CLIENT_CONFIG.max_pool_connections)
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                return dict(zip(resource_arns, executor.map(self._apply, resource_arns)))
+        finally:
+            self._tags.clear()
+            self._tag_keys.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.flush()
@@ -1,53 +1,72 @@
-import boto3
-import botocore
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Tuple
+
+from src.config.settings import CLIENT_CONFIG, get_managed_blockchain_client
+from src.managed_blockchain.managed_blockchain_utils import handle_client_errors, poll_until
+
+logger = logging.getLogger(__name__)
+
+# Statuses a network, member or node passes through on its way to AVAILABLE.
+PENDING_STATUSES = frozenset({'CREATING', 'UPDATING'})
 
 class ManagedBlockchainWaiter:
+    """
+    Waits for Managed Blockchain resources to become available.
+
+    The service defines no boto3 waiters, so each wait polls the resource with
+    exponential backoff and full jitter (see `poll_until`) and stops as soon as it
+    leaves its pending state. `delay` caps the sleep between attempts, and the wait
+    gives up after `delay * max_attempts` seconds, however many polls that took.
+    """
+
     def __init__(self):
         """Initialize the Managed Blockchain client."""
-        self.client = boto3.client('managedblockchain')
+        self.client = get_managed_blockchain_client()
+
+    def _wait_until_available(self, fetch, description: str, delay: int, max_attempts: int) -> bool:
+        resource = poll_until(fetch, lambda resource: resource.get('Status') not in PENDING_STATUSES,
+                              max_delay=delay, max_attempts=None, max_elapsed=delay * max_attempts)
+        if resource is None:
+            logger.warning("Timed out waiting for %s to become available.", description)
+            return False
+        if resource.get('Status') != 'AVAILABLE':
+            logger.warning("%s ended in status %s instead of AVAILABLE.", description, resource.get('Status'))
+            return False
+        return True
 
+    @handle_client_errors(default=False)
     def wait_for_network_available(self, network_id: str, delay: int = 30, max_attempts: int = 20):
         """
         Waits for a network to become available.
 
         :param network_id: The unique identifier of the network.
-        :param delay: The delay (in seconds) between attempts.
-        :param max_attempts: The maximum number of polling attempts.
+        :param delay: The maximum delay (in seconds) between attempts.
+        :param max_attempts: Bounds the total wait to `delay * max_attempts` seconds.
         :return: True if the network becomes available, False otherwise.
         """
-        try:
-            waiter = self.client.get_waiter('network_available')
-            waiter.wait(
-                NetworkId=network_id,
-                WaiterConfig={'Delay': delay, 'MaxAttempts': max_attempts}
-            )
-            return True
-        except botocore.exceptions.WaiterError as e:
-            print(f"Error waiting for network {network_id} to become available: {e}")
-        return False
+        return self._wait_until_available(
+            lambda: self.client.get_network(NetworkId=network_id).get('Network', {}),
+            f"network {network_id}", delay, max_attempts
+        )
 
+    @handle_client_errors(default=False)
     def wait_for_member_available(self, network_id: str, member_id: str, delay: int = 30, max_attempts: int = 20):
         """
         Waits for a member to become available in a network.
 
         :param network_id: The unique identifier of the network.
         :param member_id: The unique identifier of the member.
-        :param delay: The delay (in seconds) between attempts.
-        :param max_attempts: The maximum number of polling attempts.
+        :param delay: The maximum delay (in seconds) between attempts.
+        :param max_attempts: Bounds the total wait to `delay * max_attempts` seconds.
         :return: True if the member becomes available, False otherwise.
         """
-        try:
-            waiter = self.client.get_waiter('member_available')
-            waiter.wait(
-                NetworkId=network_id,
-                MemberId=member_id,
-                WaiterConfig={'Delay': delay, 'MaxAttempts': max_attempts}
-            )
-            return True
-        except botocore.exceptions.WaiterError as e:
-            print(f"Error waiting for member {member_id} in network {network_id} to become available: {e}")
-        return False
+        return self._wait_until_available(
+            lambda: self.client.get_member(NetworkId=network_id, MemberId=member_id).get('Member', {}),
+            f"member {member_id} in network {network_id}", delay, max_attempts
+        )
 
+    @handle_client_errors(default=False)
     def wait_for_node_available(self, network_id: str, member_id: str, node_id: str, delay: int = 30, max_attempts: int = 20):
         """
         Waits for a node to become available in a network.
@@ -55,19 +74,48 @@ class ManagedBlockchainWaiter:
         :param network_id: The unique identifier of the network.
         :param member_id: The unique identifier of the member.
         :param node_id: The unique identifier of the node.
-        :param delay: The delay (in seconds) between attempts.
-        :param max_attempts: The maximum number of polling attempts.
+        :param delay: The maximum delay (in seconds) between attempts.
+        :param max_attempts: Bounds the total wait to `delay * max_attempts` seconds.
         :return: True if the node becomes available, False otherwise.
         """
-        try:
-            waiter = self.client.get_waiter('node_available')
-            waiter.wait(
-                NetworkId=network_id,
-                MemberId=member_id,
-                NodeId=node_id,
-                WaiterConfig={'Delay': delay, 'MaxAttempts': max_attempts}
-            )
+        params = {"NetworkId": network_id, "NodeId": node_id}
+        if member_id:  # Required for Hyperledger Fabric
+            params["MemberId"] = member_id
+
+        return self._wait_until_available(
+            lambda: self.client.get_node(**params).get('Node', {}),
+            f"node {node_id} in network {network_id}", delay, max_attempts
+        )
+
+    def wait_for_all(
+        self,
+        network_ids: Iterable[str] = (),
+        members: Iterable[Tuple[str, str]] = (),
+        nodes: Iterable[Tuple[str, str, str]] = (),
+        delay: int = 30,
+        max_attempts: int = 20,
+        max_workers: int = 16
+    ) -> bool:
+        """
+        Waits for several resources at once, so the total wait is that of the slowest one.
+
+        :param network_ids: Networks to wait for.
+        :param members: (network_id, member_id) pairs to wait for.
+        :param nodes: (network_id, member_id, node_id) triples to wait for.
+        :param delay: The maximum delay (in seconds) between attempts.
+        :param max_attempts: Bounds the wait for each resource to `delay * max_attempts` seconds.
+        :param max_workers: Maximum number of concurrent polls.
+        :return: True if every resource becomes available, False otherwise.
+        """
+        waits = [
+            *((self.wait_for_network_available, (network_id,)) for network_id in network_ids),
+            *((self.wait_for_member_available, member) for member in members),
+            *((self.wait_for_node_available, node) for node in nodes),
+        ]
+        if not waits:
             return True
-        except botocore.exceptions.WaiterError as e:
-            print(f"Error waiting for node {node_id} in network {network_id} to become available: {e}")
-        return False
+
+        max_workers = min(len(waits), max_workers, CLIENT_CONFIG.max_pool_connections)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(wait, *ids, delay=delay, max_attempts=max_attempts) for wait, ids in waits]
+            return all([future.result() for future in futures])
@@ -0,0 +1,132 @@
+import asyncio
+import logging
+import botocore
+from datetime import datetime
+from typing import Optional, Dict, List
+
+from src.managed_blockchain.async_client import AsyncManagedBlockchainClient
+from src.managed_blockchain_query.managed_blockchain_paginator import (
+    asset_contracts_request, filtered_transaction_events_request, pagination_config,
+    token_balances_request, transaction_events_request, transactions_request
+)
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncManagedBlockchainQueryPaginator(AsyncManagedBlockchainClient):
+    """
+    Async twin of `ManagedBlockchainPaginator` for the Managed Blockchain Query API.
+
+    Several listings can be awaited together, so total latency is that of the
+    slowest one rather than the sum:
+
+        async with AsyncManagedBlockchainQueryPaginator() as paginator:
+            contracts, balances = await asyncio.gather(
+                paginator.paginate_list_asset_contracts(network, "ERC20", deployer),
+                paginator.paginate_list_token_balances(network, owner_address=owner),
+            )
+    """
+
+    service_name = "managedblockchain-query"
+
+    async def _collect(self, operation: str, key: str, request_params: Dict, config: Dict) -> List[Dict]:
+        try:
+            paginator = self.client.get_paginator(operation)
+            results = []
+            extend = results.extend
+            async for page in paginator.paginate(**request_params, PaginationConfig=config):
+                extend(page.get(key, ()))
+            return results
+
+        except botocore.exceptions.ClientError as e:
+            logger.warning("Client error occurred: %s", e)
+            return []
+        except botocore.exceptions.BotoCoreError as e:
+            logger.warning("BotoCore error occurred: %s", e)
+            return []
+
+    async def paginate_list_asset_contracts(self, network: str, token_standard: str, deployer_address: str,
+                                            max_items: Optional[int] = None, page_size: Optional[int] = None,
+                                            starting_token: Optional[str] = None) -> List[Dict]:
+        """Paginates through asset contracts (see `ManagedBlockchainPaginator.paginate_list_asset_contracts`)."""
+        return await self._collect(
+            "list_asset_contracts", "contracts",
+            asset_contracts_request(network, token_standard, deployer_address),
+            pagination_config(max_items, page_size, starting_token)
+        )
+
+    async def paginate_list_filtered_transaction_events(
+        self,
+        network: str,
+        transaction_event_to_address: List[str],
+        from_time: Optional[datetime] = None,
+        to_time: Optional[datetime] = None,
+        vout_spent: Optional[bool] = None,
+        confirmation_status: Optional[List[str]] = None,
+        sort_by: str = "blockchainInstant",
+        sort_order: str = "ASCENDING",
+        max_items: Optional[int] = None,
+        page_size: Optional[int] = None,
+        starting_token: Optional[str] = None
+    ) -> List[Dict]:
+        """Paginates through filtered transaction events (see `ManagedBlockchainPaginator`)."""
+        return await self._collect(
+            "list_filtered_transaction_events", "events",
+            filtered_transaction_events_request(
+                network, transaction_event_to_address, from_time, to_time,
+                vout_spent, confirmation_status, sort_by, sort_order
+            ),
+            pagination_config(max_items, page_size, starting_token)
+        )
+
+    async def paginate_list_token_balances(self, network: str, contract_address: Optional[str] = None,
+                                           token_id: Optional[str] = None, owner_address: Optional[str] = None,
+                                           max_items: Optional[int] = None, page_size: Optional[int] = None,
+                                           starting_token: Optional[str] = None) -> List[Dict]:
+        """Paginates through token balances (see `ManagedBlockchainPaginator.paginate_list_token_balances`)."""
+        return await self._collect(
+            "list_token_balances", "tokenBalances",
+            token_balances_request(network, contract_address, token_id, owner_address),
+            pagination_config(max_items, page_size, starting_token)
+        )
+
+    async def paginate_list_token_balances_bulk(self, network: str, owner_addresses: List[str],
+                                                contract_address: Optional[str] = None,
+                                                token_id: Optional[str] = None,
+                                                concurrency: int = 16) -> Dict[str, List[Dict]]:
+        """
+        Paginates through the token balances of several owners, at most `concurrency` at a time.
+
+        :return: The `paginate_list_token_balances` result of each owner, keyed by owner address.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def one(owner):
+            async with semaphore:
+                return await self.paginate_list_token_balances(network, contract_address, token_id, owner)
+
+        balances = await asyncio.gather(*(one(owner) for owner in owner_addresses))
+        return dict(zip(owner_addresses, balances))
+
+    async def paginate_list_transaction_events(self, network: str, transaction_hash: Optional[str] = None,
+                                               transaction_id: Optional[str] = None,
+                                               max_items: Optional[int] = None, page_size: Optional[int] = None,
+                                               starting_token: Optional[str] = None) -> List[Dict]:
+        """Paginates through transaction events (see `ManagedBlockchainPaginator.paginate_list_transaction_events`)."""
+        return await self._collect(
+            "list_transaction_events", "events",
+            transaction_events_request(network, transaction_hash, transaction_id),
+            pagination_config(max_items, page_size, starting_token)
+        )
+
+    async def paginate_list_transactions(self, address: str, network: str, from_time: Optional[datetime] = None,
+                                         to_time: Optional[datetime] = None, sort_order: Optional[str] = "ASCENDING",
+                                         include_nonfinal: bool = False, max_items: Optional[int] = None,
+                                         page_size: Optional[int] = None,
+                                         starting_token: Optional[str] = None) -> List[Dict]:
+        """Paginates through transactions (see `ManagedBlockchainPaginator.paginate_list_transactions`)."""
+        return await self._collect(
+            "list_transactions", "transactions",
+            transactions_request(address, network, from_time, to_time, sort_order, include_nonfinal),
+            pagination_config(max_items, page_size, starting_token)
+        )
@@ -0,0 +1,127 @@
+import logging
+import botocore
+from datetime import datetime
+from typing import Optional, Dict, Any, List
+
+from src.managed_blockchain.async_client import AsyncManagedBlockchainClient
+from src.managed_blockchain_query.managed_blockchain_query import BITCOIN_NETWORKS, validate_addresses
+from src.managed_blockchain_query.managed_blockchain_paginator import (
+    MAX_QUERY_PAGE_SIZE, asset_contracts_request, filtered_transaction_events_request, page_request,
+    token_balances_request, transaction_events_request, transactions_request
+)
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncManagedBlockchainQuery(AsyncManagedBlockchainClient):
+    """
+    Async twin of `ManagedBlockchainQuery`, for fanning out many query calls from one thread:
+
+        async with AsyncManagedBlockchainQuery() as query:
+            balances = await asyncio.gather(*(query.get_token_balance(network, owner) for owner in owners))
+    """
+
+    service_name = "managedblockchain-query"
+
+    async def _call(self, operation: str, request_params: Dict, default=None):
+        """Awaits a query operation, logging failures and returning `default` instead of raising."""
+        try:
+            return await getattr(self.client, operation)(**request_params)
+        except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError) as e:
+            logger.warning("%s failed: %s", operation, e)
+            return {"error": str(e)} if default is None else default
+
+    async def batch_get_token_balance(self, token_requests: list) -> Dict:
+        """Retrieves balances for multiple tokens for multiple owners in a single request."""
+        response = await self._call("batch_get_token_balance", {"getTokenBalanceInputs": token_requests}, {})
+        return {"tokenBalances": response.get("tokenBalances", []), "errors": response.get("errors", [])}
+
+    async def get_asset_contract(self, network: str, contract_address: str) -> Optional[Dict]:
+        """Retrieve information about a specific blockchain contract, or None if an error occurs."""
+        validate_addresses(network, contract_address=contract_address)
+        response = await self._call(
+            "get_asset_contract", {"contractIdentifier": {"network": network, "contractAddress": contract_address}}
+        )
+        return None if "error" in response else response
+
+    async def get_token_balance(self, network: str, owner_address: str, contract_address: Optional[str] = None,
+                                token_id: Optional[str] = None, timestamp: Optional[datetime] = None) -> Dict:
+        """Fetches the balance of a specific token for a given address on the blockchain."""
+        validate_addresses(network, owner_address=owner_address, contract_address=contract_address)
+        token_identifier = {"network": network, **{
+            key: value for key, value in (("contractAddress", contract_address), ("tokenId", token_id)) if value
+        }}
+        request_params = {"tokenIdentifier": token_identifier, "ownerIdentifier": {"address": owner_address}}
+        if timestamp:
+            request_params["atBlockchainInstant"] = {"time": timestamp}
+        return await self._call("get_token_balance", request_params, {})
+
+    async def get_transaction(self, network: str, transaction_hash: Optional[str] = None,
+                              transaction_id: Optional[str] = None) -> Dict:
+        """Fetches the details of a blockchain transaction."""
+        if not transaction_hash and not transaction_id:
+            raise ValueError("Either transaction_hash or transaction_id must be provided.")
+
+        if network not in BITCOIN_NETWORKS:
+            transaction_id = None
+        request_params = transaction_events_request(network, transaction_hash, transaction_id)
+        return await self._call("get_transaction", request_params, {})
+
+    async def list_asset_contracts(self, network: str, token_standard: str, deployer_address: str,
+                                   next_token: Optional[str] = None,
+                                   max_results: int = MAX_QUERY_PAGE_SIZE) -> Dict[str, Any]:
+        """Lists one page of the asset contracts deployed by a specific address."""
+        validate_addresses(network, deployer_address=deployer_address)
+        return await self._call("list_asset_contracts", page_request(
+            asset_contracts_request(network, token_standard, deployer_address), next_token, max_results
+        ))
+
+    async def list_filtered_transaction_events(
+        self,
+        network: str,
+        transaction_event_to_address: List[str],
+        from_time: Optional[datetime] = None,
+        to_time: Optional[datetime] = None,
+        vout_spent: Optional[bool] = None,
+        confirmation_status: Optional[List[str]] = None,
+        sort_by: str = "blockchainInstant",
+        sort_order: str = "ASCENDING",
+        next_token: Optional[str] = None,
+        max_results: int = MAX_QUERY_PAGE_SIZE
+    ) -> Dict:
+        """Lists one page of the transaction events for an address on the blockchain."""
+        return await self._call("list_filtered_transaction_events", page_request(
+            filtered_transaction_events_request(
+                network, transaction_event_to_address, from_time, to_time,
+                vout_spent, confirmation_status, sort_by, sort_order
+            ),
+            next_token, max_results
+        ))
+
+    async def list_token_balances(self, network: str, contract_address: Optional[str] = None,
+                                  token_id: Optional[str] = None, owner_address: Optional[str] = None,
+                                  next_token: Optional[str] = None, max_results: int = MAX_QUERY_PAGE_SIZE) -> Dict:
+        """Lists one page of token balances for an address, contract, or specific token."""
+        validate_addresses(network, owner_address=owner_address, contract_address=contract_address)
+        return await self._call("list_token_balances", page_request(
+            token_balances_request(network, contract_address, token_id, owner_address), next_token, max_results
+        ))
+
+    async def list_transaction_events(self, network: str, transaction_hash: Optional[str] = None,
+                                      transaction_id: Optional[str] = None, next_token: Optional[str] = None,
+                                      max_results: int = MAX_QUERY_PAGE_SIZE) -> Dict:
+        """Lists one page of the transaction events for a given transaction."""
+        return await self._call("list_transaction_events", page_request(
+            transaction_events_request(network, transaction_hash, transaction_id), next_token, max_results
+        ))
+
+    async def list_transactions(self, address: str, network: str, from_time: Optional[datetime] = None,
+                                to_time: Optional[datetime] = None, sort_order: Optional[str] = "ASCENDING",
+                                next_token: Optional[str] = None, max_results: int = MAX_QUERY_PAGE_SIZE,
+                                include_nonfinal: bool = False) -> Dict:
+        """Lists one page of the transactions for a given address."""
+        validate_addresses(network, address=address)
+        return await self._call("list_transactions", page_request(
+            transactions_request(address, network, from_time, to_time, sort_order, include_nonfinal),
+            next_token, max_results
+        ))
@@ -1,12 +1,250 @@
-import boto3
+import copy
+import logging
 import botocore
-from datetime import datetime
-from typing import Optional, Dict, Any, List
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Dict, Any, Callable, Iterable, Iterator, List
+
+from src.config.settings import CLIENT_CONFIG, get_managed_blockchain_query_client
+from src.managed_blockchain.managed_blockchain_utils import SQLiteCache, TTLCache, prefetch_pages
+
+logger = logging.getLogger(__name__)
+
+# Every Managed Blockchain Query list operation returns at most 250 results per page.
+MAX_QUERY_PAGE_SIZE = 250
+
+# Transactions older than this are treated as final, so listings that end before it can be cached.
+FINALITY_WINDOW = timedelta(hours=1)
+
+
+def is_final(to_time: Optional[datetime]) -> bool:
+    """Returns True if every block up to `to_time` is past the finality window (naive times are UTC)."""
+    if to_time is None:
+        return False
+    if to_time.tzinfo is None:
+        to_time = to_time.replace(tzinfo=timezone.utc)
+    return to_time < datetime.now(timezone.utc) - FINALITY_WINDOW
+
+
+# Fields of a ListTransactions item, in column order for `paginate_list_transactions_columnar`.
+TRANSACTION_FIELDS = ("transactionHash", "transactionId", "network", "transactionTimestamp", "confirmationStatus")
+
+
+@dataclass(frozen=True, slots=True)
+class TransactionRecord:
+    """A ListTransactions item without a per-record dict of repeated key strings."""
+    transaction_hash: str
+    network: str
+    transaction_timestamp: datetime
+    transaction_id: Optional[str] = None
+    confirmation_status: Optional[str] = None
+
+    @classmethod
+    def from_item(cls, item: Dict) -> "TransactionRecord":
+        return cls(
+            transaction_hash=item.get("transactionHash"),
+            network=item.get("network"),
+            transaction_timestamp=item.get("transactionTimestamp"),
+            transaction_id=item.get("transactionId"),
+            confirmation_status=item.get("confirmationStatus"),
+        )
+
+
+def pagination_config(max_items: Optional[int] = None, page_size: Optional[int] = None,
+                      starting_token: Optional[str] = None) -> Dict:
+    """
+    Builds the boto3 PaginationConfig shared by every paginate_list_* method.
+
+    Pages default to the API maximum to keep round trips down, and unset options are
+    left out so boto3 applies its own defaults instead of receiving None. Pages never
+    ask for more than `max_items`, so a small listing costs a single right-sized call.
+    """
+    config = {"PageSize": MAX_QUERY_PAGE_SIZE if page_size is None else page_size}
+    if max_items is not None:
+        config["MaxItems"] = max_items
+        config["PageSize"] = min(config["PageSize"], max_items)
+    if starting_token is not None:
+        config["StartingToken"] = starting_token
+    return config
+
+
+def page_request(request_params: Dict, next_token: Optional[str], max_results: int) -> Dict:
+    """Adds single-page parameters to a request, clamping `max_results` to the API maximum."""
+    page_params = {**request_params, "maxResults": min(max_results, MAX_QUERY_PAGE_SIZE)}
+    if next_token:
+        page_params["nextToken"] = next_token
+    return page_params
+
+
+def asset_contracts_request(network: str, token_standard: str, deployer_address: str) -> Dict:
+    """Builds the ListAssetContracts request parameters."""
+    return {
+        "contractFilter": {
+            "network": network,
+            "tokenStandard": token_standard,
+            "deployerAddress": deployer_address,
+        }
+    }
+
+
+def filtered_transaction_events_request(
+    network: str,
+    transaction_event_to_address: List[str],
+    from_time: Optional[datetime] = None,
+    to_time: Optional[datetime] = None,
+    vout_spent: Optional[bool] = None,
+    confirmation_status: Optional[List[str]] = None,
+    sort_by: str = "blockchainInstant",
+    sort_order: str = "ASCENDING"
+) -> Dict:
+    """Builds the ListFilteredTransactionEvents request parameters."""
+    time_filter = {key: {"time": value} for key, value in (("from", from_time), ("to", to_time)) if value}
+    return {
+        "network": network,
+        "addressIdentifierFilter": {"transactionEventToAddress": transaction_event_to_address},
+        "sort": {"sortBy": sort_by, "sortOrder": sort_order},
+        **{key: value for key, value in (
+            ("timeFilter", time_filter),
+            ("voutFilter", None if vout_spent is None else {"voutSpent": vout_spent}),
+            ("confirmationStatusFilter", confirmation_status and {"include": confirmation_status}),
+        ) if value}
+    }
+
+
+def token_balances_request(network: str, contract_address: Optional[str] = None, token_id: Optional[str] = None,
+                           owner_address: Optional[str] = None) -> Dict:
+    """Builds the ListTokenBalances request parameters."""
+    token_filter = {"network": network, **{
+        key: value for key, value in (("contractAddress", contract_address), ("tokenId", token_id)) if value
+    }}
+    if owner_address:
+        return {"tokenFilter": token_filter, "ownerFilter": {"address": owner_address}}
+    return {"tokenFilter": token_filter}
+
+
+def transaction_events_request(network: str, transaction_hash: Optional[str] = None,
+                               transaction_id: Optional[str] = None) -> Dict:
+    """Builds the ListTransactionEvents request parameters."""
+    return {"network": network, **{
+        key: value for key, value in (("transactionHash", transaction_hash), ("transactionId", transaction_id))
+        if value
+    }}
+
+
+# Shared, never-mutated request fragments: botocore only reads them, so calls need not rebuild them.
+# (MappingProxyType would be safer, but botocore's parameter validation only accepts dicts.)
+_TRANSACTION_SORTS = {
+    order: {"sortBy": "TRANSACTION_TIMESTAMP", "sortOrder": order} for order in ("ASCENDING", "DESCENDING")
+}
+_INCLUDE_NONFINAL = {"include": ["FINAL", "NONFINAL"]}
+
+
+def transactions_request(address: str, network: str, from_time: Optional[datetime] = None,
+                         to_time: Optional[datetime] = None, sort_order: Optional[str] = "ASCENDING",
+                         include_nonfinal: bool = False) -> Dict:
+    """Builds the ListTransactions request parameters."""
+    return {
+        "address": address,
+        "network": network,
+        "sort": _TRANSACTION_SORTS.get(sort_order) or {"sortBy": "TRANSACTION_TIMESTAMP", "sortOrder": sort_order},
+        **{key: value for key, value in (
+            ("fromBlockchainInstant", from_time and {"time": from_time}),
+            ("toBlockchainInstant", to_time and {"time": to_time}),
+            ("confirmationStatusFilter", include_nonfinal and _INCLUDE_NONFINAL),
+        ) if value}
+    }
 
 
 class ManagedBlockchainPaginator:
-    def __init__(self):
-        self.client = boto3.client("managedblockchain-query")
+    def __init__(self, eager_pages: int = 0, cache_path: Optional[str] = None, client=None):
+        """
+        :param eager_pages: Number of pages to fetch ahead while the current page is consumed;
+                            0 (the default) fetches each page only when it is needed.
+        :param cache_path: Optional SQLite file in which finalized transaction listings are kept
+                           across sessions; by default they are only cached in memory.
+        :param client: Optional `managedblockchain-query` client to use instead of the shared one.
+        """
+        self.client = get_managed_blockchain_query_client() if client is None else client
+        self.eager_pages = eager_pages
+        # A deployer's contracts can still grow, so they are only cached briefly; finalized transactions never change.
+        self._cache = TTLCache(maxsize=256, ttl=60)
+        self._final_cache = SQLiteCache(cache_path) if cache_path else TTLCache(maxsize=256, ttl=3600)
+        self._paginators = {}
+
+    def invalidate_cache(self, *key_prefix):
+        """
+        Drops cached listings, e.g. `invalidate_cache('paginate_list_asset_contracts', network)`.
+
+        :param key_prefix: The method name followed by any leading arguments; empty drops everything.
+        """
+        for cache in (self._cache, self._final_cache):
+            if key_prefix:
+                cache.invalidate(*key_prefix)
+            else:
+                cache.clear()
+
+    def _collect(self, items: Callable[[], Iterable[Dict]], cache_key: Optional[tuple] = None,
+                 cache=None) -> List[Dict]:
+        """
+        Collects the items of a paginated listing into a list; failures are logged and yield `[]`.
+        Cached listings are returned as copies, so callers may modify what they get back.
+
+        :param items: Returns an iterator over the listing's items.
+        :param cache_key: If set, the listing is read through the cache under this key.
+        :param cache: The cache to read through; defaults to the in-memory cache.
+        """
+        try:
+            if cache_key is None:
+                return list(items())
+            # Failed calls raise out of get_or_load, so only successful listings are cached.
+            return copy.deepcopy((cache or self._cache).get_or_load(cache_key, lambda: list(items())))
+        except botocore.exceptions.ClientError as e:
+            logger.warning("Client error occurred: %s", e)
+            return []
+        except botocore.exceptions.BotoCoreError as e:
+            logger.warning("BotoCore error occurred: %s", e)
+            return []
+
+    def _paginator(self, operation: str):
+        """Returns the client's paginator for `operation`, built once and reused across calls."""
+        paginator = self._paginators.get(operation)
+        if paginator is None:
+            paginator = self._paginators[operation] = self.client.get_paginator(operation)
+        return paginator
+
+    def _iter_items(self, operation: str, key: str, request_params: Dict, config: Dict) -> Iterator[Dict]:
+        """Yields the `key` items of every page of a paginated query operation."""
+        pages = self._paginator(operation).paginate(**request_params, PaginationConfig=config)
+        for page in prefetch_pages(pages, self.eager_pages):
+            yield from page.get(key, ())
+
+    def iter_asset_contracts(
+        self,
+        network: str,
+        token_standard: str,
+        deployer_address: str,
+        max_items: Optional[int] = None,
+        page_size: Optional[int] = None,
+        starting_token: Optional[str] = None
+    ) -> Iterator[Dict]:
+        """
+        Yields asset contracts page by page, so only the current page is held in memory.
+
+        :param network: The blockchain network (ETHEREUM_MAINNET, ETHEREUM_SEPOLIA_TESTNET, BITCOIN_MAINNET, BITCOIN_TESTNET).
+        :param token_standard: The token standard (ERC20, ERC721, ERC1155).
+        :param deployer_address: The address that deployed the contract.
+        :param max_items: (Optional) The total number of items to return.
+        :param page_size: (Optional) The size of each page. Defaults to the API maximum (250).
+        :param starting_token: (Optional) Token to specify where to start paginating.
+
+        :return: An iterator over asset contracts.
+        """
+        yield from self._iter_items(
+            "list_asset_contracts", "contracts",
+            asset_contracts_request(network, token_standard, deployer_address),
+            pagination_config(max_items, page_size, starting_token)
+        )
 
     def paginate_list_asset_contracts(
         self,
@@ -18,44 +256,61 @@ class ManagedBlockchainPaginator:
         starting_token: Optional[str] = None
     ) -> List[Dict]:
         """
-        Paginates through asset contracts.
+        Paginates through asset contracts. Results are cached for a minute (see `invalidate_cache`).
 
         :param network: The blockchain network (ETHEREUM_MAINNET, ETHEREUM_SEPOLIA_TESTNET, BITCOIN_MAINNET, BITCOIN_TESTNET).
         :param token_standard: The token standard (ERC20, ERC721, ERC1155).
         :param deployer_address: The address that deployed the contract.
         :param max_items: (Optional) The total number of items to return.
-        :param page_size: (Optional) The size of each page.
+        :param page_size: (Optional) The size of each page. Defaults to the API maximum (250).
         :param starting_token: (Optional) Token to specify where to start paginating.
 
         :return: List of asset contracts.
         """
-        try:
-            paginator = self.client.get_paginator("list_asset_contracts")
-            response_iterator = paginator.paginate(
-                contractFilter={
-                    "network": network,
-                    "tokenStandard": token_standard,
-                    "deployerAddress": deployer_address,
-                },
-                PaginationConfig={
-                    "MaxItems": max_items,
-                    "PageSize": page_size,
-                    "StartingToken": starting_token,
-                }
-            )
+        args = (network, token_standard, deployer_address, max_items, page_size, starting_token)
+        return self._collect(
+            lambda: self.iter_asset_contracts(*args), cache_key=('paginate_list_asset_contracts', *args)
+        )
 
-            results = []
-            for page in response_iterator:
-                results.extend(page.get("contracts", []))
+    def iter_filtered_transaction_events(
+        self,
+        network: str,
+        transaction_event_to_address: List[str],
+        from_time: Optional[datetime] = None,
+        to_time: Optional[datetime] = None,
+        vout_spent: Optional[bool] = None,
+        confirmation_status: Optional[List[str]] = None,
+        sort_by: str = "blockchainInstant",
+        sort_order: str = "ASCENDING",
+        max_items: Optional[int] = None,
+        page_size: Optional[int] = None,
+        starting_token: Optional[str] = None
+    ) -> Iterator[Dict]:
+        """
+        Yields filtered transaction events page by page, so only the current page is held in memory.
 
-            return results
+        :param network: The blockchain network (BITCOIN_MAINNET | BITCOIN_TESTNET).
+        :param transaction_event_to_address: List of recipient addresses for filtering transactions.
+        :param from_time: Start time for filtering transactions.
+        :param to_time: End time for filtering transactions.
+        :param vout_spent: Filter based on whether the transaction output is spent.
+        :param confirmation_status: Filter transactions based on confirmation status (FINAL or NONFINAL).
+        :param sort_by: Sorting criteria (default: "blockchainInstant").
+        :param sort_order: Sorting order (ASCENDING or DESCENDING).
+        :param max_items: (Optional) The total number of items to return.
+        :param page_size: (Optional) The size of each page. Defaults to the API maximum (250).
+        :param starting_token: (Optional) Token to specify where to start paginating.
 
-        except botocore.exceptions.ClientError as e:
-            print(f"Client error occurred: {e}")
-            return {"error": str(e)}
-        except botocore.exceptions.BotoCoreError as e:
-            print(f"BotoCore error occurred: {e}")
-            return {"error": str(e)}
+        :return: An iterator over filtered transaction events.
+        """
+        yield from self._iter_items(
+            "list_filtered_transaction_events", "events",
+            filtered_transaction_events_request(
+                network, transaction_event_to_address, from_time, to_time,
+                vout_spent, confirmation_status, sort_by, sort_order
+            ),
+            pagination_config(max_items, page_size, starting_token)
+        )
 
     def paginate_list_filtered_transaction_events(
         self,
@@ -83,52 +338,44 @@ class ManagedBlockchainPaginator:
         :param sort_by: Sorting criteria (default: "blockchainInstant").
         :param sort_order: Sorting order (ASCENDING or DESCENDING).
         :param max_items: (Optional) The total number of items to return.
-        :param page_size: (Optional) The size of each page.
+        :param page_size: (Optional) The size of each page. Defaults to the API maximum (250).
         :param starting_token: (Optional) Token to specify where to start paginating.
 
         :return: List of filtered transaction events.
         """
-        try:
-            paginator = self.client.get_paginator("list_filtered_transaction_events")
-
-            request_params = {
-                "network": network,
-                "addressIdentifierFilter": {"transactionEventToAddress": transaction_event_to_address},
-                "sort": {"sortBy": sort_by, "sortOrder": sort_order}
-            }
+        return self._collect(lambda: self.iter_filtered_transaction_events(
+            network, transaction_event_to_address, from_time, to_time, vout_spent, confirmation_status, sort_by,
+            sort_order, max_items, page_size, starting_token
+        ))
 
-            if from_time or to_time:
-                request_params["timeFilter"] = {}
-                if from_time:
-                    request_params["timeFilter"]["from"] = {"time": from_time}
-                if to_time:
-                    request_params["timeFilter"]["to"] = {"time": to_time}
-
-            if vout_spent is not None:
-                request_params["voutFilter"] = {"voutSpent": vout_spent}
-
-            if confirmation_status:
-                request_params["confirmationStatusFilter"] = {"include": confirmation_status}
-
-            pagination_config = {
-                "MaxItems": max_items,
-                "PageSize": page_size,
-                "StartingToken": starting_token,
-            }
-            response_iterator = paginator.paginate(**request_params, PaginationConfig=pagination_config)
-
-            results = []
-            for page in response_iterator:
-                results.extend(page.get("events", []))
+    def iter_token_balances(
+        self,
+        network: str,
+        contract_address: Optional[str] = None,
+        token_id: Optional[str] = None,
+        owner_address: Optional[str] = None,
+        max_items: Optional[int] = None,
+        page_size: Optional[int] = None,
+        starting_token: Optional[str] = None
+    ) -> Iterator[Dict]:
+        """
+        Yields token balances page by page, so only the current page is held in memory.
 
-            return results
+        :param network: The blockchain network (ETHEREUM_MAINNET, ETHEREUM_SEPOLIA_TESTNET, BITCOIN_MAINNET, BITCOIN_TESTNET).
+        :param contract_address: (Optional) The contract address for filtering balances.
+        :param token_id: (Optional) The unique identifier for a specific token.
+        :param owner_address: (Optional) The wallet or contract address to check balances for.
+        :param max_items: (Optional) The total number of items to return.
+        :param page_size: (Optional) The size of each page. Defaults to the API maximum (250).
+        :param starting_token: (Optional) Token to specify where to start paginating.
 
-        except botocore.exceptions.ClientError as e:
-            print(f"Client error occurred: {e}")
-            return {"error": str(e)}
-        except botocore.exceptions.BotoCoreError as e:
-            print(f"BotoCore error occurred: {e}")
-            return {"error": str(e)}
+        :return: An iterator over token balance details.
+        """
+        yield from self._iter_items(
+            "list_token_balances", "tokenBalances",
+            token_balances_request(network, contract_address, token_id, owner_address),
+            pagination_config(max_items, page_size, starting_token)
+        )
 
     def paginate_list_token_balances(
         self,
@@ -148,47 +395,70 @@ class ManagedBlockchainPaginator:
         :param token_id: (Optional) The unique identifier for a specific token.
         :param owner_address: (Optional) The wallet or contract address to check balances for.
         :param max_items: (Optional) The total number of items to return.
-        :param page_size: (Optional) The size of each page.
+        :param page_size: (Optional) The size of each page. Defaults to the API maximum (250).
         :param starting_token: (Optional) Token to specify where to start paginating.
 
         :return: List of token balance details.
         """
-        try:
-            paginator = self.client.get_paginator("list_token_balances")
-
-            request_params = {
-                "tokenFilter": {"network": network},
-            }
+        return self._collect(lambda: self.iter_token_balances(
+            network, contract_address, token_id, owner_address, max_items, page_size, starting_token
+        ))
 
-            if contract_address:
-                request_params["tokenFilter"]["contractAddress"] = contract_address
-
-            if token_id:
-                request_params["tokenFilter"]["tokenId"] = token_id
-
-            if owner_address:
-                request_params["ownerFilter"] = {"address": owner_address}
-
-            pagination_config = {
-                "MaxItems": max_items,
-                "PageSize": page_size,
-                "StartingToken": starting_token,
-            }
+    def paginate_list_token_balances_bulk(
+        self,
+        network: str,
+        owner_addresses: List[str],
+        contract_address: Optional[str] = None,
+        token_id: Optional[str] = None,
+        max_workers: int = 16
+    ) -> Dict[str, List[Dict]]:
+        """
+        Paginates through the token balances of several owners concurrently.
 
-            response_iterator = paginator.paginate(**request_params, PaginationConfig=pagination_config)
+        :param network: The blockchain network (ETHEREUM_MAINNET, ETHEREUM_SEPOLIA_TESTNET, BITCOIN_MAINNET, BITCOIN_TESTNET).
+        :param owner_addresses: The wallet or contract addresses to check balances for.
+        :param contract_address: (Optional) The contract address for filtering balances.
+        :param token_id: (Optional) The unique identifier for a specific token.
+        :param max_workers: The maximum number of concurrent listings.
+        :return: The `paginate_list_token_balances` result of each owner, keyed by owner address.
+        """
+        if not owner_addresses:
+            return {}
+
+        max_workers = min(len(owner_addresses), max_workers, CLIENT_CONFIG.max_pool_connections)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            balances = executor.map(
+                lambda owner: self.paginate_list_token_balances(network, contract_address, token_id, owner),
+                owner_addresses
+            )
+            return dict(zip(owner_addresses, balances))
 
-            results = []
-            for page in response_iterator:
-                results.extend(page.get("tokenBalances", []))
+    def iter_transaction_events(
+        self,
+        network: str,
+        transaction_hash: Optional[str] = None,
+        transaction_id: Optional[str] = None,
+        max_items: Optional[int] = None,
+        page_size: Optional[int] = None,
+        starting_token: Optional[str] = None
+    ) -> Iterator[Dict]:
+        """
+        Yields transaction events page by page, so only the current page is held in memory.
 
-            return results
+        :param network: The blockchain network (ETHEREUM_MAINNET, ETHEREUM_SEPOLIA_TESTNET, BITCOIN_MAINNET, BITCOIN_TESTNET).
+        :param transaction_hash: (Optional) The hash of the transaction.
+        :param transaction_id: (Optional) The identifier of a Bitcoin transaction (Only for Bitcoin networks).
+        :param max_items: (Optional) The total number of items to return.
+        :param page_size: (Optional) The size of each page. Defaults to the API maximum (250).
+        :param starting_token: (Optional) Token to specify where to start paginating.
 
-        except botocore.exceptions.ClientError as e:
-            print(f"Client error occurred: {e}")
-            return {"error": str(e)}
-        except botocore.exceptions.BotoCoreError as e:
-            print(f"BotoCore error occurred: {e}")
-            return {"error": str(e)}
+        :return: An iterator over transaction event details.
+        """
+        yield from self._iter_items(
+            "list_transaction_events", "events",
+            transaction_events_request(network, transaction_hash, transaction_id),
+            pagination_config(max_items, page_size, starting_token)
+        )
 
     def paginate_list_transaction_events(
         self,
@@ -206,44 +476,48 @@ class ManagedBlockchainPaginator:
         :param transaction_hash: (Optional) The hash of the transaction.
         :param transaction_id: (Optional) The identifier of a Bitcoin transaction (Only for Bitcoin networks).
         :param max_items: (Optional) The total number of items to return.
-        :param page_size: (Optional) The size of each page.
+        :param page_size: (Optional) The size of each page. Defaults to the API maximum (250).
         :param starting_token: (Optional) Token to specify where to start paginating.
 
         :return: List of transaction event details.
         """
-        try:
-            paginator = self.client.get_paginator("list_transaction_events")
-
-            request_params = {
-                "network": network,
-            }
-
-            if transaction_hash:
-                request_params["transactionHash"] = transaction_hash
-
-            if transaction_id:
-                request_params["transactionId"] = transaction_id
+        return self._collect(lambda: self.iter_transaction_events(
+            network, transaction_hash, transaction_id, max_items, page_size, starting_token
+        ))
 
-            pagination_config = {
-                "MaxItems": max_items,
-                "PageSize": page_size,
-                "StartingToken": starting_token,
-            }
-
-            response_iterator = paginator.paginate(**request_params, PaginationConfig=pagination_config)
-
-            results = []
-            for page in response_iterator:
-                results.extend(page.get("events", []))
+    def iter_transactions(
+        self,
+        address: str,
+        network: str,
+        from_time: Optional[datetime] = None,
+        to_time: Optional[datetime] = None,
+        sort_order: Optional[str] = "ASCENDING",
+        include_nonfinal: bool = False,
+        max_items: Optional[int] = None,
+        page_size: Optional[int] = None,
+        starting_token: Optional[str] = None
+    ) -> Iterator[Dict]:
+        """
+        Yields transactions page by page, so only the current page is held in memory.
 
-            return results
+        :param address: (Required) The contract or wallet address whose transactions are requested.
+        :param network: (Required) The blockchain network (ETHEREUM_MAINNET, ETHEREUM_SEPOLIA_TESTNET, BITCOIN_MAINNET, BITCOIN_TESTNET).
+        :param from_time: (Optional) Start time for filtering transactions.
+        :param to_time: (Optional) End time for filtering transactions.
+        :param sort_order: (Optional) Sorting order (ASCENDING or DESCENDING). Default: ASCENDING.
+                           Use DESCENDING with `max_items` for the most recent transactions.
+        :param include_nonfinal: (Optional) Whether to include transactions that have not reached finality.
+        :param max_items: (Optional) The total number of items to return.
+        :param page_size: (Optional) The size of each page. Defaults to the API maximum (250).
+        :param starting_token: (Optional) Token to specify where to start paginating.
 
-        except botocore.exceptions.ClientError as e:
-            print(f"Client error occurred: {e}")
-            return {"error": str(e)}
-        except botocore.exceptions.BotoCoreError as e:
-            print(f"BotoCore error occurred: {e}")
-            return {"error": str(e)}
+        :return: An iterator over transactions.
+        """
+        yield from self._iter_items(
+            "list_transactions", "transactions",
+            transactions_request(address, network, from_time, to_time, sort_order, include_nonfinal),
+            pagination_config(max_items, page_size, starting_token)
+        )
 
     def paginate_list_transactions(
         self,
@@ -260,52 +534,79 @@ class ManagedBlockchainPaginator:
         """
         Paginates through transactions for a given address.
 
+        Listings whose `to_time` is older than `FINALITY_WINDOW` are final and cached for an hour,
+        or kept in the `cache_path` file when the paginator was given one.
+
         :param address: (Required) The contract or wallet address whose transactions are requested.
         :param network: (Required) The blockchain network (ETHEREUM_MAINNET, ETHEREUM_SEPOLIA_TESTNET, BITCOIN_MAINNET, BITCOIN_TESTNET).
         :param from_time: (Optional) Start time for filtering transactions.
         :param to_time: (Optional) End time for filtering transactions.
         :param sort_order: (Optional) Sorting order (ASCENDING or DESCENDING). Default: ASCENDING.
+                           Use DESCENDING with `max_items` for the most recent transactions.
         :param include_nonfinal: (Optional) Whether to include transactions that have not reached finality.
         :param max_items: (Optional) The total number of items to return.
-        :param page_size: (Optional) The size of each page.
+        :param page_size: (Optional) The size of each page. Defaults to the API maximum (250).
         :param starting_token: (Optional) Token to specify where to start paginating.
 
         :return: List of transactions.
         """
-        try:
-            paginator = self.client.get_paginator("list_transactions")
+        args = (
+            address, network, from_time, to_time, sort_order, include_nonfinal, max_items, page_size, starting_token
+        )
+        # Only windows that end before the finality window are immutable and safe to cache.
+        cache_key = None if include_nonfinal or not is_final(to_time) else ('paginate_list_transactions', *args)
+        return self._collect(lambda: self.iter_transactions(*args), cache_key=cache_key, cache=self._final_cache)
+
+    def get_latest_transactions(self, address: str, network: str, count: int = 20,
+                                include_nonfinal: bool = False) -> List[Dict]:
+        """
+        Returns the most recent transactions of an address, newest first.
 
-            request_params = {
-                "address": address,
-                "network": network,
-                "sort": {"sortBy": "TRANSACTION_TIMESTAMP", "sortOrder": sort_order},
-            }
+        The API sorts DESCENDING server-side, so only the first `count` transactions are
+        fetched, however long the address's history is.
 
-            if from_time:
-                request_params["fromBlockchainInstant"] = {"time": from_time}
-            if to_time:
-                request_params["toBlockchainInstant"] = {"time": to_time}
-            if include_nonfinal:
-                request_params["confirmationStatusFilter"] = {"include": ["FINAL", "NONFINAL"]}
+        :param address: The contract or wallet address whose transactions are requested.
+        :param network: The blockchain network (ETHEREUM_MAINNET, ETHEREUM_SEPOLIA_TESTNET, BITCOIN_MAINNET, BITCOIN_TESTNET).
+        :param count: The number of transactions to return.
+        :param include_nonfinal: (Optional) Whether to include transactions that have not reached finality.
+        :return: List of transactions.
+        """
+        return self.paginate_list_transactions(
+            address, network, sort_order="DESCENDING", include_nonfinal=include_nonfinal, max_items=count
+        )
 
-            pagination_config = {
-                "MaxItems": max_items,
-                "PageSize": page_size,
-                "StartingToken": starting_token,
-            }
+    def iter_transaction_records(self, address: str, network: str, **options) -> Iterator[TransactionRecord]:
+        """
+        Yields the transactions of an address as slotted `TransactionRecord`s.
 
-            response_iterator = paginator.paginate(**request_params, PaginationConfig=pagination_config)
+        :param address: The contract or wallet address whose transactions are requested.
+        :param network: The blockchain network.
+        :param options: Any other `iter_transactions` argument (from_time, max_items, ...).
+        :return: An iterator over transaction records.
+        """
+        return map(TransactionRecord.from_item, self.iter_transactions(address, network, **options))
 
-            results = []
-            for page in response_iterator:
-                results.extend(page.get("transactions", []))
+    def paginate_list_transactions_columnar(self, address: str, network: str, **options) -> Dict[str, List]:
+        """
+        Lists the transactions of an address as columns rather than one dict per transaction.
 
-            return results
+        The result maps each of `TRANSACTION_FIELDS` to a list of values and can be passed
+        straight to `pandas.DataFrame` or `pyarrow.table` for bulk analysis.
 
+        :param address: The contract or wallet address whose transactions are requested.
+        :param network: The blockchain network.
+        :param options: Any other `iter_transactions` argument (from_time, max_items, ...).
+        :return: A dictionary of equal-length columns; every column is empty if the call fails.
+        """
+        columns = {field: [] for field in TRANSACTION_FIELDS}
+        appends = [(field, columns[field].append) for field in TRANSACTION_FIELDS]
+        try:
+            for transaction in self.iter_transactions(address, network, **options):
+                for field, append in appends:
+                    append(transaction.get(field))
+            return columns
         except botocore.exceptions.ClientError as e:
-            print(f"Client error occurred: {e}")
-            return {"error": str(e)}
+            logger.warning("Client error occurred: %s", e)
         except botocore.exceptions.BotoCoreError as e:
-            print(f"BotoCore error occurred: {e}")
-            return {"error": str(e)}
-
+            logger.warning("BotoCore error occurred: %s", e)
+        return {field: [] for field in TRANSACTION_FIELDS}
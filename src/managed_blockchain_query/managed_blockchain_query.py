@@ -1,17 +1,107 @@
-import boto3
+import logging
+import re
 import botocore
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Iterator, List, Tuple
+
+from src.config.settings import CLIENT_CONFIG, get_managed_blockchain_query_client
+from src.managed_blockchain.managed_blockchain_utils import TTLCache, cached_read
+from src.managed_blockchain_query.managed_blockchain_paginator import (
+    MAX_QUERY_PAGE_SIZE, ManagedBlockchainPaginator, asset_contracts_request, filtered_transaction_events_request,
+    is_final, page_request, pagination_config, token_balances_request, transaction_events_request, transactions_request
+)
+
+logger = logging.getLogger(__name__)
+
+# BatchGetTokenBalance accepts at most 10 getTokenBalanceInputs per call.
+MAX_TOKEN_BALANCE_BATCH_SIZE = 10
+
+# Only Bitcoin transactions have a transactionId distinct from their hash.
+BITCOIN_NETWORKS = frozenset({"BITCOIN_MAINNET", "BITCOIN_TESTNET"})
+
+ETHEREUM_ADDRESS_PATTERN = re.compile(r'0x[0-9a-fA-F]{40}')
+
+
+def validate_addresses(network: str, **addresses: Optional[str]):
+    """
+    Rejects malformed Ethereum addresses before they cost a round trip to the service.
+
+    :param network: The blockchain network; only Ethereum networks are checked.
+    :param addresses: The addresses to check, keyed by argument name; None values are skipped.
+    :raises ValueError: If an address is not `0x` followed by 40 hex digits.
+    """
+    if not network.startswith("ETHEREUM"):
+        return
+    for name, address in addresses.items():
+        if address is not None and not ETHEREUM_ADDRESS_PATTERN.fullmatch(address):
+            raise ValueError(f"Invalid {name} for {network}: {address!r}")
+
+
+def validate_request_addresses(request_params: Dict):
+    """
+    Applies `validate_addresses` to the addresses of a raw request, such as one passed to `paginate_all`.
+
+    :param request_params: The operation's request parameters, as sent to the service.
+    :raises ValueError: If an Ethereum address in the request is malformed.
+    """
+    contract_filter = request_params.get("contractFilter") or {}
+    token_filter = request_params.get("tokenFilter") or {}
+    network = request_params.get("network") or contract_filter.get("network") or token_filter.get("network")
+    if not network:
+        return
+    validate_addresses(
+        network,
+        address=request_params.get("address"),
+        deployer_address=contract_filter.get("deployerAddress"),
+        contract_address=token_filter.get("contractAddress"),
+        owner_address=(request_params.get("ownerFilter") or {}).get("address"),
+    )
+    for address in (request_params.get("addressIdentifierFilter") or {}).get("transactionEventToAddress", []):
+        validate_addresses(network, transaction_event_to_address=address)
 
 
 class ManagedBlockchainQuery:
-    def __init__(self):
-        """Initialize the Managed Blockchain Query client."""
-        self.client = boto3.client('managedblockchain-query')
+    __slots__ = ('_client', '_cache', '_final_cache', '_paginator')
 
-    def batch_get_token_balance(self, token_requests: list):
+    def __init__(self, client=None):
         """
-        Retrieves balances for multiple tokens for multiple owners in a single request.
+        Initialize the Managed Blockchain Query wrapper.
+
+        :param client: Optional `managedblockchain-query` client to use; by default the shared client
+                       is built on first use.
+        """
+        self._client = client
+        # Reads of the latest chain state go stale quickly; finalized data never changes.
+        self._cache = TTLCache(maxsize=4096, ttl=30)
+        self._final_cache = TTLCache(maxsize=4096, ttl=24 * 3600)
+        self._paginator = None
+
+    @property
+    def client(self):
+        """The shared Managed Blockchain Query client, so processes that never call the API never build it."""
+        if self._client is None:
+            self._client = get_managed_blockchain_query_client()
+        return self._client
+
+    @property
+    def paginator(self) -> ManagedBlockchainPaginator:
+        """The paginator behind the `iter_*` methods, created on first use."""
+        if self._paginator is None:
+            self._paginator = ManagedBlockchainPaginator(client=self._client)
+        return self._paginator
+
+    def clear_cache(self):
+        """Drops every cached contract, transaction and balance read."""
+        self._cache.clear()
+        self._final_cache.clear()
+
+    def batch_get_token_balance(self, token_requests: list, max_workers: int = 16):
+        """
+        Retrieves balances for multiple tokens for multiple owners.
+
+        Requests beyond the API's batch limit are split into batches of
+        `MAX_TOKEN_BALANCE_BATCH_SIZE`, which are sent concurrently and merged.
 
         :param token_requests: List of dictionaries containing token and owner identifiers.
             Example:
@@ -26,32 +116,45 @@ class ManagedBlockchainQuery:
                         "address": "0xabc..."
                     },
                     "atBlockchainInstant": {
-                        "time": datetime.utcnow()
+                        "time": datetime.now(timezone.utc)
                     }
                 }
             ]
+        :param max_workers: The maximum number of concurrent batch requests.
         :return: Dictionary containing token balances and errors (if any).
         """
+        batches = [
+            token_requests[i:i + MAX_TOKEN_BALANCE_BATCH_SIZE]
+            for i in range(0, len(token_requests), MAX_TOKEN_BALANCE_BATCH_SIZE)
+        ]
+        result = {"tokenBalances": [], "errors": []}
+        if not batches:
+            return result
+
+        max_workers = min(len(batches), max_workers, CLIENT_CONFIG.max_pool_connections)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for response in executor.map(self._batch_get_token_balance, batches):
+                result["tokenBalances"].extend(response.get("tokenBalances", []))
+                result["errors"].extend(response.get("errors", []))
+        return result
+
+    def _batch_get_token_balance(self, token_requests: list) -> Dict:
         try:
-            response = self.client.batch_get_token_balance(
-                getTokenBalanceInputs=token_requests
-            )
-            return {
-                "tokenBalances": response.get("tokenBalances", []),
-                "errors": response.get("errors", [])
-            }
-        except botocore.exceptions.BotoCoreError as e:
-            print(f"Error fetching batch token balances: {e}")
-            return {"tokenBalances": [], "errors": []}
+            return self.client.batch_get_token_balance(getTokenBalanceInputs=token_requests)
+        except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError) as e:
+            logger.warning("Error fetching batch token balances: %s", e)
+            return {}
 
+    @cached_read('_final_cache')
     def get_asset_contract(self, network: str, contract_address: str):
         """
-        Retrieve information about a specific blockchain contract.
+        Retrieve information about a specific blockchain contract. Results are cached for a day.
 
         :param network: The blockchain network ('ETHEREUM_MAINNET', 'ETHEREUM_SEPOLIA_TESTNET', etc.).
         :param contract_address: The contract address on the blockchain.
         :return: Dictionary containing contract metadata.
         """
+        validate_addresses(network, contract_address=contract_address)
         try:
             response = self.client.get_asset_contract(
                 contractIdentifier={
@@ -60,8 +163,8 @@ class ManagedBlockchainQuery:
                 }
             )
             return response
-        except botocore.exceptions.ClientError as e:
-            print(f"Error fetching contract details: {e}")
+        except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError) as e:
+            logger.warning("Error fetching contract details: %s", e)
             return None
 
     def get_token_balance(self, network: str, owner_address: str, contract_address: Optional[str] = None,
@@ -69,6 +172,8 @@ class ManagedBlockchainQuery:
         """
         Fetches the balance of a specific token for a given address on the blockchain.
 
+        Balances at a `timestamp` past the finality window are cached for a day, others for 30 seconds.
+
         :param network: The blockchain network ('ETHEREUM_MAINNET', 'BITCOIN_MAINNET', etc.).
         :param owner_address: The contract or wallet address of the token owner.
         :param contract_address: (Optional) The contract address for the token.
@@ -76,36 +181,36 @@ class ManagedBlockchainQuery:
         :param timestamp: (Optional) The time at which to check the balance (defaults to latest).
         :return: Dictionary containing the token balance details.
         """
+        validate_addresses(network, owner_address=owner_address, contract_address=contract_address)
+        cache = self._final_cache if is_final(timestamp) else self._cache
+        key = ('get_token_balance', network, owner_address, contract_address, token_id, timestamp)
+        return cache.get_or_load(key, lambda: self._get_token_balance(
+            network, owner_address, contract_address, token_id, timestamp
+        )) or {}
+
+    def _get_token_balance(self, network: str, owner_address: str, contract_address: Optional[str],
+                           token_id: Optional[str], timestamp: Optional[datetime]) -> Optional[Dict]:
+        request_payload = {
+            "tokenIdentifier": {"network": network, **{
+                key: value for key, value in (("contractAddress", contract_address), ("tokenId", token_id)) if value
+            }},
+            "ownerIdentifier": {"address": owner_address},
+            **({"atBlockchainInstant": {"time": timestamp}} if timestamp else {})
+        }
         try:
-            token_identifier = {
-                "network": network
-            }
-            if contract_address:
-                token_identifier["contractAddress"] = contract_address
-            if token_id:
-                token_identifier["tokenId"] = token_id
-
-            request_payload = {
-                "tokenIdentifier": token_identifier,
-                "ownerIdentifier": {
-                    "address": owner_address
-                }
-            }
-            if timestamp:
-                request_payload["atBlockchainInstant"] = {"time": timestamp}
-
-            response = self.client.get_token_balance(**request_payload)
-            return response
+            return self.client.get_token_balance(**request_payload)
 
-        except botocore.exceptions.BotoCoreError as e:
-            print(f"Error retrieving token balance: {e}")
-            return {}
+        except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError) as e:
+            logger.warning("Error retrieving token balance: %s", e)
+            return None
 
     def get_transaction(self, network: str, transaction_hash: Optional[str] = None,
                         transaction_id: Optional[str] = None) -> Dict:
         """
         Fetches the details of a blockchain transaction.
 
+        Transactions are cached for a day once FINAL, and for 30 seconds until then.
+
         :param network: The blockchain network ('ETHEREUM_MAINNET', 'BITCOIN_MAINNET', etc.).
         :param transaction_hash: The hash of the transaction (Ethereum & Bitcoin).
         :param transaction_id: The transaction ID (only for Bitcoin).
@@ -114,21 +219,27 @@ class ManagedBlockchainQuery:
         if not transaction_hash and not transaction_id:
             raise ValueError("Either transaction_hash or transaction_id must be provided.")
 
+        key = ('get_transaction', network, transaction_hash, transaction_id)
+        response = self._final_cache.get(key)
+        if response is None:
+            response = self._cache.get_or_load(
+                key, lambda: self._get_transaction(network, transaction_hash, transaction_id)
+            )
+            if response and response.get("transaction", {}).get("confirmationStatus") == "FINAL":
+                self._final_cache.set(key, response)
+        return response or {}
+
+    def _get_transaction(self, network: str, transaction_hash: Optional[str],
+                         transaction_id: Optional[str]) -> Optional[Dict]:
+        if network not in BITCOIN_NETWORKS:
+            transaction_id = None
+        request_payload = transaction_events_request(network, transaction_hash, transaction_id)
         try:
-            request_payload = {
-                "network": network
-            }
-            if transaction_hash:
-                request_payload["transactionHash"] = transaction_hash
-            if transaction_id and network in ["BITCOIN_MAINNET", "BITCOIN_TESTNET"]:
-                request_payload["transactionId"] = transaction_id
+            return self.client.get_transaction(**request_payload)
 
-            response = self.client.get_transaction(**request_payload)
-            return response
-
-        except botocore.exceptions.BotoCoreError as e:
-            print(f"Error retrieving transaction details: {e}")
-            return {}
+        except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError) as e:
+            logger.warning("Error retrieving transaction details: %s", e)
+            return None
 
     def can_paginate(self, operation_name: str) -> bool:
         """
@@ -140,18 +251,21 @@ class ManagedBlockchainQuery:
         try:
             return self.client.can_paginate(operation_name)
         except botocore.exceptions.BotoCoreError as e:
-            print(f"Error checking pagination for {operation_name}: {e}")
+            logger.warning("Error checking pagination for %s: %s", operation_name, e)
             return False
 
     def close(self):
         """
         Closes the underlying endpoint connections.
+
+        The client is shared, so this drops the pooled connections of every user of it;
+        they are reopened on the next request.
         """
         try:
             self.client.close()
-            print("Managed Blockchain Query client connection closed.")
+            logger.debug("Managed Blockchain Query client connection closed.")
         except botocore.exceptions.BotoCoreError as e:
-            print(f"Error closing client: {e}")
+            logger.warning("Error closing client: %s", e)
 
     def get_paginator(self, operation_name: str):
         """
@@ -164,9 +278,35 @@ class ManagedBlockchainQuery:
             paginator = self.client.get_paginator(operation_name)
             return paginator
         except botocore.exceptions.BotoCoreError as e:
-            print(f"Error creating paginator: {e}")
+            logger.warning("Error creating paginator: %s", e)
             return None
 
+    def paginate_all(self, operation_name: str, max_items: Optional[int] = None, **request_params) -> Dict:
+        """
+        Fetches every page of a list operation and merges them into a single response.
+
+        botocore's paginator follows nextToken and merges the result keys, so callers need
+        not loop over `list_*` themselves. Pages are requested at the API maximum (250).
+
+            response = query.paginate_all('list_transactions', address=address, network=network,
+                                          sort={'sortBy': 'TRANSACTION_TIMESTAMP', 'sortOrder': 'ASCENDING'})
+
+        :param operation_name: The list operation (e.g., 'list_transactions').
+        :param max_items: (Optional) The total number of items to return.
+        :param request_params: The operation's request parameters.
+        :return: The merged response, or {"error": ...} if a call fails.
+        :raises ValueError: If an Ethereum address in the request is malformed.
+        """
+        validate_request_addresses(request_params)
+        try:
+            pages = self.client.get_paginator(operation_name).paginate(
+                **request_params, PaginationConfig=pagination_config(max_items)
+            )
+            return pages.build_full_result()
+        except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError) as e:
+            logger.warning("Error paginating %s: %s", operation_name, e)
+            return {"error": str(e)}
+
     def get_waiter(self, waiter_name: str):
         """
         Returns an AWS Managed Blockchain Query Waiter.
@@ -177,7 +317,7 @@ class ManagedBlockchainQuery:
         try:
             return self.client.get_waiter(waiter_name)
         except botocore.exceptions.WaiterError as e:
-            print(f"Waiter error: {e}")
+            logger.warning("Waiter error: %s", e)
             return None
 
     def list_asset_contracts(
@@ -186,7 +326,7 @@ class ManagedBlockchainQuery:
         token_standard: str,
         deployer_address: str,
         next_token: Optional[str] = None,
-        max_results: int = 100
+        max_results: int = MAX_QUERY_PAGE_SIZE
     ) -> Optional[Dict[str, Any]]:
         """
         Lists all asset contracts deployed by a specific address.
@@ -195,22 +335,17 @@ class ManagedBlockchainQuery:
         :param token_standard: The token standard (e.g., ERC20, ERC721, ERC1155).
         :param deployer_address: The address that deployed the contract.
         :param next_token: The pagination token to fetch the next set of results.
-        :param max_results: The maximum number of results to return (default: 100).
+        :param max_results: The maximum number of results to return (default and maximum: 250).
         :return: A dictionary containing contract details or None if an error occurs.
         """
+        validate_addresses(network, deployer_address=deployer_address)
+        request_params = page_request(
+            asset_contracts_request(network, token_standard, deployer_address), next_token, max_results
+        )
         try:
-            response = self.client.list_asset_contracts(
-                contractFilter={
-                    "network": network,
-                    "tokenStandard": token_standard,
-                    "deployerAddress": deployer_address
-                },
-                nextToken=next_token,
-                maxResults=max_results
-            )
-            return response
+            return self.client.list_asset_contracts(**request_params)
         except botocore.exceptions.BotoCoreError as e:
-            print(f"Error communicating with AWS API: {e}")
+            logger.warning("Error communicating with AWS API: %s", e)
             return None
 
     def list_filtered_transaction_events(
@@ -224,7 +359,7 @@ class ManagedBlockchainQuery:
         sort_by: str = "blockchainInstant",
         sort_order: str = "ASCENDING",
         next_token: Optional[str] = None,
-        max_results: int = 100
+        max_results: int = MAX_QUERY_PAGE_SIZE
     ) -> Dict:
         """
         Lists all the transaction events for an address on the blockchain.
@@ -238,36 +373,19 @@ class ManagedBlockchainQuery:
         :param sort_by: Sorting criteria (default: "blockchainInstant").
         :param sort_order: Sorting order (ASCENDING or DESCENDING).
         :param next_token: Token for paginated results.
-        :param max_results: Maximum number of results to return (default: 100).
+        :param max_results: Maximum number of results to return (default and maximum: 250).
 
         :return: Dictionary containing transaction events and metadata.
         """
+        request_params = page_request(
+            filtered_transaction_events_request(
+                network, transaction_event_to_address, from_time, to_time,
+                vout_spent, confirmation_status, sort_by, sort_order
+            ),
+            next_token, max_results
+        )
         try:
-            request_params = {
-                "network": network,
-                "addressIdentifierFilter": {"transactionEventToAddress": transaction_event_to_address},
-                "sort": {"sortBy": sort_by, "sortOrder": sort_order},
-                "maxResults": max_results
-            }
-
-            if from_time or to_time:
-                request_params["timeFilter"] = {}
-                if from_time:
-                    request_params["timeFilter"]["from"] = {"time": from_time}
-                if to_time:
-                    request_params["timeFilter"]["to"] = {"time": to_time}
-
-            if vout_spent is not None:
-                request_params["voutFilter"] = {"voutSpent": vout_spent}
-
-            if confirmation_status:
-                request_params["confirmationStatusFilter"] = {"include": confirmation_status}
-
-            if next_token:
-                request_params["nextToken"] = next_token
-
-            response = self.client.list_filtered_transaction_events(**request_params)
-            return response
+            return self.client.list_filtered_transaction_events(**request_params)
 
         except botocore.exceptions.ClientError as e:
             return {"error": str(e)}
@@ -281,7 +399,7 @@ class ManagedBlockchainQuery:
         token_id: Optional[str] = None,
         owner_address: Optional[str] = None,
         next_token: Optional[str] = None,
-        max_results: int = 100
+        max_results: int = MAX_QUERY_PAGE_SIZE
     ) -> Dict:
         """
         Lists token balances for an address, contract, or specific token.
@@ -291,30 +409,16 @@ class ManagedBlockchainQuery:
         :param token_id: (Optional) The unique identifier for a specific token.
         :param owner_address: (Optional) The wallet or contract address to check balances for.
         :param next_token: (Optional) Token for paginated results.
-        :param max_results: Maximum number of results to return (default: 100).
+        :param max_results: Maximum number of results to return (default and maximum: 250).
 
         :return: Dictionary containing token balance details.
         """
+        validate_addresses(network, owner_address=owner_address, contract_address=contract_address)
+        request_params = page_request(
+            token_balances_request(network, contract_address, token_id, owner_address), next_token, max_results
+        )
         try:
-            request_params = {
-                "tokenFilter": {"network": network},
-                "maxResults": max_results
-            }
-
-            if contract_address:
-                request_params["tokenFilter"]["contractAddress"] = contract_address
-
-            if token_id:
-                request_params["tokenFilter"]["tokenId"] = token_id
-
-            if owner_address:
-                request_params["ownerFilter"] = {"address": owner_address}
-
-            if next_token:
-                request_params["nextToken"] = next_token
-
-            response = self.client.list_token_balances(**request_params)
-            return response
+            return self.client.list_token_balances(**request_params)
 
         except botocore.exceptions.ClientError as e:
             return {"error": str(e)}
@@ -327,7 +431,7 @@ class ManagedBlockchainQuery:
         transaction_hash: Optional[str] = None,
         transaction_id: Optional[str] = None,
         next_token: Optional[str] = None,
-        max_results: int = 100
+        max_results: int = MAX_QUERY_PAGE_SIZE
     ) -> Dict:
         """
         Lists all transaction events for a given transaction.
@@ -336,22 +440,15 @@ class ManagedBlockchainQuery:
         :param transaction_hash: (Optional) The hash of the transaction.
         :param transaction_id: (Optional) The identifier of a Bitcoin transaction (Only for Bitcoin networks).
         :param next_token: (Optional) Token for paginated results.
-        :param max_results: Maximum number of results to return (default: 100).
+        :param max_results: Maximum number of results to return (default and maximum: 250).
 
         :return: Dictionary containing transaction event details.
         """
+        request_params = page_request(
+            transaction_events_request(network, transaction_hash, transaction_id), next_token, max_results
+        )
         try:
-            request_params = {"network": network, "maxResults": max_results}
-
-            if transaction_hash:
-                request_params["transactionHash"] = transaction_hash
-            if transaction_id:
-                request_params["transactionId"] = transaction_id
-            if next_token:
-                request_params["nextToken"] = next_token
-
-            response = self.client.list_transaction_events(**request_params)
-            return response
+            return self.client.list_transaction_events(**request_params)
 
         except botocore.exceptions.ClientError as e:
             return {"error": str(e)}
@@ -366,7 +463,7 @@ class ManagedBlockchainQuery:
         to_time: Optional[str] = None,
         sort_order: Optional[str] = "ASCENDING",
         next_token: Optional[str] = None,
-        max_results: int = 100,
+        max_results: int = MAX_QUERY_PAGE_SIZE,
         include_nonfinal: bool = False,
     ) -> Dict:
         """
@@ -378,33 +475,101 @@ class ManagedBlockchainQuery:
         :param to_time: (Optional) End time for transaction filtering (ISO 8601 format).
         :param sort_order: (Optional) Sorting order (ASCENDING or DESCENDING). Default: ASCENDING.
         :param next_token: (Optional) Token for paginated results.
-        :param max_results: (Optional) Maximum number of results to return. Default: 100.
+        :param max_results: (Optional) Maximum number of results to return. Default and maximum: 250.
         :param include_nonfinal: (Optional) Whether to include transactions that have not reached finality.
 
         :return: Dictionary containing transaction details.
         """
+        validate_addresses(network, address=address)
+        request_params = page_request(
+            transactions_request(address, network, from_time, to_time, sort_order, include_nonfinal),
+            next_token, max_results
+        )
         try:
-            request_params = {
-                "address": address,
-                "network": network,
-                "sort": {"sortBy": "TRANSACTION_TIMESTAMP", "sortOrder": sort_order},
-                "maxResults": max_results,
-            }
-
-            if from_time:
-                request_params["fromBlockchainInstant"] = {"time": from_time}
-            if to_time:
-                request_params["toBlockchainInstant"] = {"time": to_time}
-            if next_token:
-                request_params["nextToken"] = next_token
-            if include_nonfinal:
-                request_params["confirmationStatusFilter"] = {"include": ["FINAL", "NONFINAL"]}
-
-            response = self.client.list_transactions(**request_params)
-            return response
+            return self.client.list_transactions(**request_params)
 
         except botocore.exceptions.ClientError as e:
             return {"error": str(e)}
         except botocore.exceptions.BotoCoreError as e:
             return {"error": str(e)}
 
+    def iter_asset_contracts(self, network: str, token_standard: str, deployer_address: str,
+                             **options) -> Iterator[Dict]:
+        """
+        Streams every asset contract deployed by an address, following nextToken lazily.
+
+        :param options: Any other `ManagedBlockchainPaginator.iter_asset_contracts` argument (max_items, ...).
+        """
+        validate_addresses(network, deployer_address=deployer_address)
+        return self.paginator.iter_asset_contracts(network, token_standard, deployer_address, **options)
+
+    def iter_filtered_transaction_events(self, network: str, transaction_event_to_address: List[str],
+                                         **options) -> Iterator[Dict]:
+        """
+        Streams every transaction event for the given addresses, following nextToken lazily.
+
+        :param options: Any other `ManagedBlockchainPaginator.iter_filtered_transaction_events` argument.
+        """
+        for address in transaction_event_to_address:
+            validate_addresses(network, transaction_event_to_address=address)
+        return self.paginator.iter_filtered_transaction_events(network, transaction_event_to_address, **options)
+
+    def iter_token_balances(self, network: str, **options) -> Iterator[Dict]:
+        """
+        Streams every matching token balance, following nextToken lazily.
+
+        :param options: Any other `ManagedBlockchainPaginator.iter_token_balances` argument (owner_address, ...).
+        """
+        validate_addresses(network, owner_address=options.get('owner_address'),
+                           contract_address=options.get('contract_address'))
+        return self.paginator.iter_token_balances(network, **options)
+
+    def iter_transaction_events(self, network: str, **options) -> Iterator[Dict]:
+        """
+        Streams every event of a transaction, following nextToken lazily.
+
+        :param options: Any other `ManagedBlockchainPaginator.iter_transaction_events` argument (transaction_hash, ...).
+        """
+        return self.paginator.iter_transaction_events(network, **options)
+
+    def iter_transactions(self, address: str, network: str, **options) -> Iterator[Dict]:
+        """
+        Streams every transaction of an address, following nextToken lazily.
+
+        :param options: Any other `ManagedBlockchainPaginator.iter_transactions` argument (from_time, ...).
+        """
+        validate_addresses(network, address=address)
+        return self.paginator.iter_transactions(address, network, **options)
+
+    def iter_transactions_multi(self, addresses: List[str], network: str, max_workers: int = 16,
+                                **options) -> Iterator[Tuple[str, List[Dict]]]:
+        """
+        Lists the transactions of several addresses concurrently, yielding each as soon as it completes.
+
+        :param addresses: The contract or wallet addresses whose transactions are requested.
+        :param network: The blockchain network.
+        :param max_workers: The maximum number of concurrent listings.
+        :param options: Any other `ManagedBlockchainPaginator.paginate_list_transactions` argument.
+        :return: An iterator of `(address, transactions)` pairs, in completion order.
+        :raises ValueError: If any address is malformed; nothing is submitted in that case.
+        """
+        for address in addresses:
+            validate_addresses(network, address=address)
+        return self._iter_transactions_multi(addresses, network, max_workers, **options)
+
+    def _iter_transactions_multi(self, addresses: List[str], network: str, max_workers: int,
+                                 **options) -> Iterator[Tuple[str, List[Dict]]]:
+        if not addresses:
+            return
+
+        executor = ThreadPoolExecutor(max_workers=min(len(addresses), max_workers, CLIENT_CONFIG.max_pool_connections))
+        try:
+            futures = {
+                executor.submit(self.paginator.paginate_list_transactions, address, network, **options): address
+                for address in addresses
+            }
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+        finally:
+            # Listings not yet started are dropped if the caller stops iterating early.
+            executor.shutdown(cancel_futures=True)
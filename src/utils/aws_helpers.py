@@ -1,8 +1,17 @@
-import boto3
+from src.config.settings import get_managed_blockchain_client
 
 class ManagedBlockchainUtils:
+    __slots__ = ('_client',)
+
     def __init__(self):
-        self.client = boto3.client('managedblockchain')
+        self._client = None
+
+    @property
+    def client(self):
+        """The shared Managed Blockchain client, built on first use rather than at construction."""
+        if self._client is None:
+            self._client = get_managed_blockchain_client()
+        return self._client
 
     def can_paginate(self, operation_name: str):
         """Checks if an operation supports pagination."""
@@ -17,5 +26,5 @@ class ManagedBlockchainUtils:
         return self.client.get_waiter(waiter_name)
 
     def close(self):
-        """Closes the client connection."""
+        """Closes the shared client's pooled connections; they are reopened on the next request."""
         self.client.close()
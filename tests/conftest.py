@@ -0,0 +1,83 @@
+from types import SimpleNamespace
+
+import boto3
+import botocore
+import pytest
+
+from src.config import settings
+
+
+# Page payloads shared by the query test modules; treat them as read-only.
+TRANSACTION_PAGES = (
+    {"transactions": [{"transactionId": "txABC"}], "NextToken": "token1"},
+    {"transactions": [{"transactionId": "txDEF"}], "NextToken": None},
+)
+
+CONTRACT_PAGES = (
+    {"contracts": [{"chaincodeId": "fabcar", "version": "1.0"}], "NextToken": "token1"},
+    {"contracts": [{"chaincodeId": "supplychain", "version": "2.0"}], "NextToken": None},
+)
+
+EVENT_PAGES = (
+    {"events": [{"transactionId": "tx123", "eventType": "Invoke"}], "NextToken": "token1"},
+    {"events": [{"transactionId": "tx456", "eventType": "Query"}], "NextToken": None},
+)
+
+FILTERED_EVENT_PAGES = (
+    {"events": [{"transactionId": "tx789", "blockNumber": 10}], "NextToken": "token1"},
+    {"events": [{"transactionId": "tx790", "blockNumber": 20}], "NextToken": None},
+)
+
+TOKEN_BALANCE_PAGES = (
+    {"tokenBalances": [{"ownerIdentifier": {"address": "Org1MSP"}, "balance": "100"}], "NextToken": "token1"},
+    {"tokenBalances": [{"ownerIdentifier": {"address": "Org2MSP"}, "balance": "250"}], "NextToken": None},
+)
+
+INVOCATION_PAGES = (
+    {"transactions": [{"transactionId": "txInvoke1", "type": "Invoke"}], "NextToken": "token1"},
+    {"transactions": [{"transactionId": "txInvoke2", "type": "Invoke"}], "NextToken": None},
+)
+
+TRANSACTION_HASH_PAGES = (
+    {"transactions": [{"transactionHash": "0x1"}]},
+    {"transactions": [{"transactionHash": "0x2"}]},
+)
+
+EMPTY_TRANSACTION_PAGES = ({"transactions": []},)
+
+
+# Raised by the mocked client in the error-handling tests.
+VALIDATION_ERROR = botocore.exceptions.ClientError(
+    {"Error": {"Code": "ValidationException", "Message": "Invalid request"}},
+    "list_transactions"
+)
+
+
+def page_stream(*payloads):
+    """Yields the given page payloads in order, as a fresh one-shot paginator response."""
+    yield from payloads
+
+
+def stub_client(**responses):
+    """A plain stand-in client whose operations return canned responses, for tests that never inspect calls."""
+    return SimpleNamespace(**{
+        operation: (lambda *args, _response=response, **kwargs: _response) for operation, response in responses.items()
+    })
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_clients(monkeypatch):
+    """
+    Drop the cached AWS clients so each test builds its client from its own mock.
+
+    The shared session is replaced by one whose `create_client()` forwards to
+    `boto3.client`, so tests that patch `boto3.client` also intercept clients
+    built through the settings factories.
+    """
+    session = SimpleNamespace(create_client=lambda *args, **kwargs: boto3.client(*args, **kwargs))
+    monkeypatch.setattr(settings, "get_session", lambda: session)
+    settings.get_managed_blockchain_client.cache_clear()
+    settings.get_managed_blockchain_query_client.cache_clear()
+    yield
+    settings.get_managed_blockchain_client.cache_clear()
+    settings.get_managed_blockchain_query_client.cache_clear()
@@ -1,10 +1,15 @@
+import asyncio
+import gzip
+import itertools
+import logging
+import threading
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch, MagicMock
 import botocore
-from datetime import datetime
-import uuid
 
 # Import all the modules from your project
+from src.config import settings
 from src.managed_blockchain.accessors import ManagedBlockchainAccessors
 from src.managed_blockchain.invitations import ManagedBlockchainInvitations
 from src.managed_blockchain.list_accessors_paginators import ManagedBlockchainPaginator
@@ -14,15 +19,23 @@ from src.managed_blockchain.network import ManagedBlockchainNetwork
 from src.managed_blockchain.nodes import ManagedBlockchainNodes
 from src.managed_blockchain.paginator import ManagedBlockchainPaginator
 from src.managed_blockchain.proposals import ManagedBlockchainProposals
-from src.managed_blockchain.tags import ManagedBlockchainTags
+from src.managed_blockchain.tags import ManagedBlockchainTags, TagBatcher
 from src.managed_blockchain.waiter import ManagedBlockchainWaiter
 
 
+# Page payloads shared by the tests below; treat them as read-only.
+ACCESSOR_PAGES = (
+    {"Accessors": [{"Id": "acc-123"}], "NextToken": "token1"},
+    {"Accessors": [{"Id": "acc-456"}]},
+)
+
+
 @pytest.fixture
-def mock_boto3_client():
+def mock_boto3_client(monkeypatch):
     """Mock boto3 client for Managed Blockchain."""
-    with patch("boto3.client") as mock_client:
-        yield mock_client.return_value
+    client = MagicMock()
+    monkeypatch.setattr("boto3.client", lambda *args, **kwargs: client)
+    return client
 
 
 # ---- Test Accessors ----
@@ -37,6 +50,29 @@ def test_list_accessors(accessors_client, mock_boto3_client):
     assert response["Accessors"][0]["AccessorId"] == "acc-123"
 
 
+def test_get_all_accessors(accessors_client, mock_boto3_client):
+    mock_paginator = mock_boto3_client.get_paginator.return_value
+    mock_paginator.paginate.return_value = iter(ACCESSOR_PAGES)
+    response = accessors_client.get_all_accessors(network_type="ETHEREUM_MAINNET")
+    assert [accessor["Id"] for accessor in response] == ["acc-123", "acc-456"]
+    mock_boto3_client.get_paginator.assert_called_once_with("list_accessors")
+    mock_paginator.paginate.assert_called_once_with(
+        NetworkType="ETHEREUM_MAINNET", PaginationConfig={"PageSize": 50}
+    )
+
+
+def test_get_all_accessors_multi(accessors_client, mock_boto3_client):
+    mock_paginator = mock_boto3_client.get_paginator.return_value
+    mock_paginator.paginate.side_effect = lambda NetworkType, **kwargs: iter([
+        {"Accessors": [{"Id": f"acc-{NetworkType}"}]}
+    ])
+    response = accessors_client.get_all_accessors_multi(["ETHEREUM_MAINNET", "POLYGON_MAINNET"])
+    assert response == {
+        "ETHEREUM_MAINNET": [{"Id": "acc-ETHEREUM_MAINNET"}],
+        "POLYGON_MAINNET": [{"Id": "acc-POLYGON_MAINNET"}]
+    }
+
+
 # ---- Test Invitations ----
 @pytest.fixture
 def invitations_client(mock_boto3_client):
@@ -49,6 +85,17 @@ def test_list_invitations(invitations_client, mock_boto3_client):
     assert response["Invitations"][0]["InvitationId"] == "inv-123"
 
 
+@pytest.mark.parametrize("eager_pages", [0, 2])
+def test_iter_invitations(invitations_client, mock_boto3_client, eager_pages):
+    mock_boto3_client.list_invitations.side_effect = [
+        {"Invitations": [{"InvitationId": "inv-123"}], "NextToken": "token1"},
+        {"Invitations": [{"InvitationId": "inv-456"}]}
+    ]
+    response = list(invitations_client.iter_invitations(eager_pages=eager_pages))
+    assert [invitation["InvitationId"] for invitation in response] == ["inv-123", "inv-456"]
+    mock_boto3_client.list_invitations.assert_called_with(MaxResults=100, NextToken="token1")
+
+
 # ---- Test Members ----
 @pytest.fixture
 def members_client(mock_boto3_client):
@@ -63,6 +110,26 @@ def test_create_member(members_client, mock_boto3_client):
         admin_password="password"
     )
     assert response["MemberId"] == "m-123"
+    member_configuration = mock_boto3_client.create_member.call_args.kwargs["MemberConfiguration"]
+    assert "Tags" not in member_configuration
+    assert "KmsKeyArn" not in member_configuration
+
+
+def test_create_member_token_is_fresh_per_create(members_client, mock_boto3_client):
+    kwargs = dict(invitation_id="inv-123", network_id="n-456", member_name="TestMember",
+                  admin_username="admin", admin_password="password")
+    members_client.create_member(**kwargs)
+    members_client.create_member(**kwargs)
+    members_client.create_member(**kwargs, client_request_token="my-token")
+    tokens = [call.kwargs["ClientRequestToken"] for call in mock_boto3_client.create_member.call_args_list]
+    assert tokens[0] != tokens[1]
+    assert tokens[2] == "my-token"
+
+
+def test_delete_members_bulk(members_client, mock_boto3_client):
+    mock_boto3_client.delete_member.side_effect = lambda NetworkId, MemberId: {"MemberId": MemberId}
+    response = members_client.delete_members_bulk(network_id="n-123", member_ids=["m-1", "m-2", "m-3"])
+    assert [result["MemberId"] for result in response] == ["m-1", "m-2", "m-3"]
 
 
 def test_get_member(members_client, mock_boto3_client):
@@ -71,6 +138,72 @@ def test_get_member(members_client, mock_boto3_client):
     assert response["Member"]["MemberId"] == "m-123"
 
 
+def test_get_member_is_cached_until_deleted(members_client, mock_boto3_client):
+    mock_boto3_client.get_member.return_value = {"Member": {"Id": "m-123"}}
+    members_client.get_member(network_id="n-123", member_id="m-123")
+    members_client.get_member("n-123", "m-123")
+    assert mock_boto3_client.get_member.call_count == 1
+
+    members_client.delete_member(network_id="n-123", member_id="m-123")
+    members_client.get_member("n-123", "m-123")
+    assert mock_boto3_client.get_member.call_count == 2
+
+
+def test_cached_member_is_copied_per_caller(members_client, mock_boto3_client):
+    mock_boto3_client.get_member.return_value = {"Member": {"Id": "m-123", "Status": "AVAILABLE"}}
+    members_client.get_member("n-123", "m-123")["Status"] = "DELETED"
+    assert members_client.get_member("n-123", "m-123")["Status"] == "AVAILABLE"
+
+
+def test_read_racing_a_delete_is_not_cached(members_client, mock_boto3_client):
+    loading, release = threading.Event(), threading.Event()
+
+    def slow_get_member(**kwargs):
+        loading.set()
+        release.wait(timeout=5)
+        return {"Member": {"Id": kwargs["MemberId"]}}
+
+    mock_boto3_client.get_member.side_effect = slow_get_member
+    reader = threading.Thread(target=members_client.get_member, args=("n-123", "m-123"))
+    reader.start()
+    loading.wait(timeout=5)
+    members_client.delete_member(network_id="n-123", member_id="m-123")
+    release.set()
+    reader.join()
+
+    members_client.get_member("n-123", "m-123")
+    assert mock_boto3_client.get_member.call_count == 2
+
+
+def test_concurrent_get_member_calls_are_coalesced(members_client, mock_boto3_client):
+    release = threading.Event()
+
+    def slow_get_member(**kwargs):
+        release.wait(timeout=5)
+        return {"Member": {"Id": kwargs["MemberId"]}}
+
+    mock_boto3_client.get_member.side_effect = slow_get_member
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(members_client.get_member, "n-123", "m-123") for _ in range(4)]
+        threading.Timer(0.1, release.set).start()
+        results = [future.result() for future in futures]
+
+    assert mock_boto3_client.get_member.call_count == 1
+    assert all(result == {"Id": "m-123"} for result in results)
+
+
+def test_get_member_async(members_client, mock_boto3_client):
+    mock_boto3_client.get_member.return_value = {"Member": {"Id": "m-123"}}
+    response = asyncio.run(members_client.get_member_async(network_id="n-123", member_id="m-123"))
+    assert response["Id"] == "m-123"
+
+
+def test_get_members_bulk(members_client, mock_boto3_client):
+    mock_boto3_client.get_member.side_effect = lambda NetworkId, MemberId: {"Member": {"Id": MemberId}}
+    response = members_client.get_members_bulk(network_id="n-123", member_ids=["m-1", "m-2", "m-3"])
+    assert [member["Id"] for member in response] == ["m-1", "m-2", "m-3"]
+
+
 # ---- Test Networks ----
 @pytest.fixture
 def network_client(mock_boto3_client):
@@ -81,6 +214,17 @@ def test_list_networks(network_client, mock_boto3_client):
     mock_boto3_client.list_networks.return_value = {"Networks": [{"NetworkId": "n-123"}]}
     response = network_client.list_networks()
     assert response["Networks"][0]["NetworkId"] == "n-123"
+    mock_boto3_client.list_networks.assert_called_once_with()
+
+
+def test_get_all_networks(network_client, mock_boto3_client):
+    mock_boto3_client.list_networks.side_effect = [
+        {"Networks": [{"Id": "n-1"}], "NextToken": "token1"},
+        {"Networks": [{"Id": "n-2"}]}
+    ]
+    response = network_client.get_all_networks()
+    assert [network["Id"] for network in response] == ["n-1", "n-2"]
+    mock_boto3_client.list_networks.assert_called_with(MaxResults=10, NextToken="token1")
 
 
 # ---- Test Nodes ----
@@ -95,6 +239,64 @@ def test_list_nodes(nodes_client, mock_boto3_client):
     assert response["Nodes"][0]["NodeId"] == "nd-123"
 
 
+def test_get_all_nodes_by_status(nodes_client, mock_boto3_client):
+    mock_boto3_client.list_nodes.return_value = {"Nodes": [
+        {"Id": "nd-1", "Status": "FAILED"},
+        {"Id": "nd-2", "Status": "CREATING"},
+        {"Id": "nd-3", "Status": "AVAILABLE"},
+    ]}
+    response = nodes_client.get_all_nodes_by_status(network_id="n-123", statuses=("AVAILABLE", "FAILED"))
+    assert [node["Id"] for node in response] == ["nd-3", "nd-1"]
+    mock_boto3_client.list_nodes.assert_called_once_with(NetworkId="n-123", MaxResults=20)
+
+
+def test_create_node_omits_empty_member_id(nodes_client, mock_boto3_client):
+    mock_boto3_client.create_node.return_value = {"NodeId": "nd-123"}
+    response = nodes_client.create_node(network_id="n-123", instance_type="bc.t3.large",
+                                        availability_zone="us-east-1a")
+    assert response["NodeId"] == "nd-123"
+    assert "MemberId" not in mock_boto3_client.create_node.call_args.kwargs
+    assert mock_boto3_client.create_node.call_args.kwargs["NodeConfiguration"] == {
+        "InstanceType": "bc.t3.large", "AvailabilityZone": "us-east-1a"
+    }
+
+
+def test_iter_nodes(nodes_client, mock_boto3_client):
+    mock_boto3_client.list_nodes.side_effect = [
+        {"Nodes": [{"Id": "nd-1"}], "NextToken": "token1"},
+        {"Nodes": [{"Id": "nd-2"}]}
+    ]
+    nodes = nodes_client.iter_nodes(network_id="n-123", member_id="m-456")
+    assert next(nodes)["Id"] == "nd-1"
+    assert mock_boto3_client.list_nodes.call_count == 1
+    assert [node["Id"] for node in nodes] == ["nd-2"]
+
+
+def test_wait_until_available_polls_until_node_settles(nodes_client, mock_boto3_client):
+    mock_boto3_client.get_node.side_effect = [
+        {"Node": {"Status": "CREATING"}},
+        {"Node": {"Status": "CREATING"}},
+        {"Node": {"Status": "AVAILABLE"}},
+    ]
+    with patch("time.sleep") as sleep:
+        assert nodes_client.wait_until_available(network_id="n-123", node_id="nd-1", member_id="m-1")
+    assert sleep.call_count == 2
+
+
+def test_wait_until_available_gives_up_after_max_elapsed(nodes_client, mock_boto3_client):
+    mock_boto3_client.get_node.return_value = {"Node": {"Status": "CREATING"}}
+    with patch("time.sleep"), patch("time.monotonic", side_effect=itertools.count(step=1000.0)):
+        assert not nodes_client.wait_until_available(network_id="n-123", node_id="nd-1", max_elapsed=1800.0)
+    assert mock_boto3_client.get_node.call_count == 2
+
+
+def test_wait_until_deleted_treats_missing_node_as_deleted(nodes_client, mock_boto3_client):
+    mock_boto3_client.get_node.side_effect = botocore.exceptions.ClientError(
+        {"Error": {"Code": "ResourceNotFoundException", "Message": "Node not found"}}, "get_node"
+    )
+    assert nodes_client.wait_until_deleted(network_id="n-123", node_id="nd-1")
+
+
 # ---- Test Tags ----
 @pytest.fixture
 def tags_client(mock_boto3_client):
@@ -107,6 +309,56 @@ def test_list_tags(tags_client, mock_boto3_client):
     assert response["Tags"]["Environment"] == "Test"
 
 
+def test_list_tags_is_cached_until_retagged(tags_client, mock_boto3_client):
+    arn = "arn:aws:managedblockchain:::network/n-123"
+    mock_boto3_client.list_tags_for_resource.return_value = {"Tags": {"Environment": "Test"}}
+    tags_client.list_tags_for_resource(arn)
+    assert tags_client.list_tags_for_resource(arn) == {"Environment": "Test"}
+    assert mock_boto3_client.list_tags_for_resource.call_count == 1
+
+    tags_client.tag_resource(arn, {"Team": "Ledger"})
+    tags_client.list_tags_for_resource(arn)
+    assert mock_boto3_client.list_tags_for_resource.call_count == 2
+
+
+def test_tag_batcher_merges_mutations_per_resource(tags_client, mock_boto3_client):
+    with TagBatcher(tags_client) as batch:
+        batch.tag("arn:n-1", {"Env": "Test"})
+        batch.tag("arn:n-1", {"Team": "Ledger", "Old": "x"})
+        batch.untag("arn:n-1", ["Old"])
+        batch.tag("arn:n-2", {"Env": "Prod"})
+
+    assert mock_boto3_client.tag_resource.call_count == 2
+    mock_boto3_client.tag_resource.assert_any_call(ResourceArn="arn:n-1", Tags={"Env": "Test", "Team": "Ledger"})
+    mock_boto3_client.untag_resource.assert_called_once_with(ResourceArn="arn:n-1", TagKeys=["Old"])
+
+
+def test_tag_batcher_isolates_client_errors(tags_client, mock_boto3_client):
+    def tag_resource(ResourceArn, Tags):
+        if ResourceArn == "arn:n-1":
+            raise botocore.exceptions.ClientError(
+                {"Error": {"Code": "AccessDeniedException", "Message": "Denied"}}, "TagResource"
+            )
+
+    mock_boto3_client.tag_resource.side_effect = tag_resource
+    batch = TagBatcher(tags_client)
+    batch.tag("arn:n-1", {"Env": "Test"})
+    batch.tag("arn:n-2", {"Env": "Prod"})
+
+    assert batch.flush() == {"arn:n-1": False, "arn:n-2": True}
+
+
+def test_tag_resource_rejects_malformed_tags_locally(tags_client, mock_boto3_client):
+    with pytest.raises(ValueError):
+        tags_client.tag_resource("arn:n-1", {"bad#key": "x"})
+    with pytest.raises(ValueError):
+        tags_client.untag_resource("arn:n-1", ["k" * 129])
+    with pytest.raises(ValueError):
+        tags_client.tag_resource("arn:n-1", {"Env": "Prod\n"})
+    mock_boto3_client.tag_resource.assert_not_called()
+    mock_boto3_client.untag_resource.assert_not_called()
+
+
 # ---- Test Proposals ----
 @pytest.fixture
 def proposals_client(mock_boto3_client):
@@ -119,6 +371,60 @@ def test_create_proposal(proposals_client, mock_boto3_client):
     assert response["ProposalId"] == "p-123"
 
 
+def test_create_proposal_token_is_fresh_per_create(proposals_client, mock_boto3_client):
+    proposals_client.create_proposal(network_id="n-123", member_id="m-456", invitations=["123456789012"])
+    proposals_client.create_proposal(network_id="n-123", member_id="m-456", invitations=["123456789012"])
+    proposals_client.create_proposal(network_id="n-123", member_id="m-456", invitations=["123456789012"],
+                                     client_request_token="my-token")
+    tokens = [call.kwargs["ClientRequestToken"] for call in mock_boto3_client.create_proposal.call_args_list]
+    assert tokens[0] != tokens[1]
+    assert tokens[2] == "my-token"
+
+
+def test_only_decided_proposals_are_cached(proposals_client, mock_boto3_client):
+    mock_boto3_client.get_proposal.side_effect = [
+        {"Proposal": {"ProposalId": "p-1", "Status": "IN_PROGRESS"}},
+        {"Proposal": {"ProposalId": "p-1", "Status": "APPROVED"}},
+    ]
+    assert proposals_client.get_proposal("n-123", "p-1")["Status"] == "IN_PROGRESS"
+    assert proposals_client.get_proposal("n-123", "p-1")["Status"] == "APPROVED"
+    assert proposals_client.get_proposal("n-123", "p-1")["Status"] == "APPROVED"
+    assert mock_boto3_client.get_proposal.call_count == 2
+
+
+def test_filter_proposals_by_statuses(proposals_client, mock_boto3_client):
+    mock_boto3_client.list_proposals.return_value = {"Proposals": [
+        {"ProposalId": "p-1", "Status": "APPROVED"},
+        {"ProposalId": "p-2", "Status": "IN_PROGRESS"},
+        {"ProposalId": "p-3", "Status": "REJECTED"},
+    ]}
+    approved = proposals_client.filter_proposals_by_status("n-123", "APPROVED")
+    closed = proposals_client.filter_proposals_by_status("n-123", {"APPROVED", "REJECTED"})
+    assert [proposal["ProposalId"] for proposal in approved] == ["p-1"]
+    assert [proposal["ProposalId"] for proposal in closed] == ["p-1", "p-3"]
+
+
+def test_get_all_proposal_votes(proposals_client, mock_boto3_client):
+    mock_boto3_client.list_proposal_votes.side_effect = [
+        {"ProposalVotes": [{"MemberId": "m-1", "Vote": "YES"}], "NextToken": "token1"},
+        {"ProposalVotes": [{"MemberId": "m-2", "Vote": "NO"}]}
+    ]
+    response = proposals_client.get_all_proposal_votes(network_id="n-123", proposal_id="p-123")
+    assert [vote["MemberId"] for vote in response] == ["m-1", "m-2"]
+    mock_boto3_client.list_proposal_votes.assert_called_with(
+        NetworkId="n-123", ProposalId="p-123", MaxResults=100, NextToken="token1"
+    )
+
+
+def test_get_member_vote_stops_at_first_match(proposals_client, mock_boto3_client):
+    mock_boto3_client.list_proposal_votes.side_effect = [
+        {"ProposalVotes": [{"MemberId": "m-1", "Vote": "YES"}], "NextToken": "token1"},
+        {"ProposalVotes": [{"MemberId": "m-2", "Vote": "NO"}]}
+    ]
+    assert proposals_client.get_member_vote("n-123", "p-123", member_id="m-1") == "YES"
+    assert mock_boto3_client.list_proposal_votes.call_count == 1
+
+
 # ---- Test Waiters ----
 @pytest.fixture
 def waiter_client(mock_boto3_client):
@@ -132,6 +438,39 @@ def test_get_waiter(waiter_client, mock_boto3_client):
     assert waiter is not None
 
 
+def test_wait_for_network_available_stops_on_failure(waiter_client, mock_boto3_client):
+    mock_boto3_client.get_network.side_effect = [
+        {"Network": {"Status": "CREATING"}},
+        {"Network": {"Status": "CREATE_FAILED"}},
+    ]
+    with patch("time.sleep"):
+        assert waiter_client.wait_for_network_available(network_id="n-123") is False
+    assert mock_boto3_client.get_network.call_count == 2
+
+
+def test_wait_is_bounded_by_elapsed_time(waiter_client, mock_boto3_client):
+    mock_boto3_client.get_network.return_value = {"Network": {"Status": "CREATING"}}
+    clock = [0.0]
+
+    def sleep(seconds):
+        clock[0] += seconds
+
+    with patch("time.sleep", side_effect=sleep), patch("time.monotonic", side_effect=lambda: clock[0]):
+        assert waiter_client.wait_for_network_available(network_id="n-123", delay=30, max_attempts=20) is False
+    assert clock[0] == pytest.approx(600)
+    assert mock_boto3_client.get_network.call_count > 20
+
+
+def test_wait_for_all(waiter_client, mock_boto3_client):
+    mock_boto3_client.get_network.return_value = {"Network": {"Status": "AVAILABLE"}}
+    mock_boto3_client.get_member.return_value = {"Member": {"Status": "AVAILABLE"}}
+    mock_boto3_client.get_node.return_value = {"Node": {"Status": "AVAILABLE"}}
+    assert waiter_client.wait_for_all(
+        network_ids=["n-1"], members=[("n-1", "m-1"), ("n-1", "m-2")], nodes=[("n-1", "m-1", "nd-1")]
+    )
+    assert mock_boto3_client.get_member.call_count == 2
+
+
 # ---- Test Paginators ----
 @pytest.fixture
 def paginator_client(mock_boto3_client):
@@ -161,6 +500,33 @@ def test_delete_member(admin_client, mock_boto3_client):
     assert response == {}
 
 
+# ---- Shared Client ----
+def test_shared_client_built_once_under_concurrency():
+    with patch("boto3.client") as mock_client:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            clients = list(executor.map(lambda _: settings.get_managed_blockchain_client(), range(32)))
+
+    assert mock_client.call_count == 1
+    assert all(client is clients[0] for client in clients)
+
+
+def test_unrecoverable_errors_are_not_retried():
+    not_found = (None, {"Error": {"Code": "ResourceNotFoundException"}})
+    throttled = (None, {"Error": {"Code": "ThrottlingException"}})
+    assert settings._no_retry(response=not_found) is False
+    assert settings._no_retry(response=throttled) is None
+    assert settings._no_retry(response=None) is None
+
+
+def test_gzip_responses_are_decompressed_before_parsing():
+    compressed = {"headers": {"Content-Encoding": "gzip"}, "body": gzip.compress(b'{"transactions": []}')}
+    plain = {"headers": {}, "body": b'{"transactions": []}'}
+    settings._gunzip(response_dict=compressed)
+    settings._gunzip(response_dict=plain)
+
+    assert compressed["body"] == plain["body"] == b'{"transactions": []}'
+
+
 # ---- Error Handling ----
 def test_get_member_invalid_id(members_client, mock_boto3_client):
     mock_boto3_client.get_member.side_effect = botocore.exceptions.ClientError(
@@ -171,6 +537,27 @@ def test_get_member_invalid_id(members_client, mock_boto3_client):
     assert response is None
 
 
+def test_client_error_is_logged_with_structured_fields(members_client, mock_boto3_client, caplog):
+    mock_boto3_client.get_member.side_effect = botocore.exceptions.ClientError(
+        {"Error": {"Code": "ResourceNotFoundException", "Message": "Member not found"},
+         "ResponseMetadata": {"RequestId": "req-123"}},
+        "get_member"
+    )
+    members_client.get_member(network_id="n-123", member_id="invalid-id")
+    record = caplog.records[-1]
+    assert (record.op, record.code, record.request_id) == ("get_member", "ResourceNotFoundException", "req-123")
+    assert record.levelname == "WARNING"
+
+
+def test_throttled_client_error_is_logged_at_info(members_client, mock_boto3_client, caplog):
+    caplog.set_level(logging.INFO, logger="src")
+    mock_boto3_client.get_member.side_effect = botocore.exceptions.ClientError(
+        {"Error": {"Code": "ThrottlingException", "Message": "Rate exceeded"}}, "get_member"
+    )
+    assert members_client.get_member(network_id="n-123", member_id="m-123") is None
+    assert caplog.records[-1].levelname == "INFO"
+
+
 # ---- Paginator: List Transactions ----
 def test_list_transactions_pagination(paginator_client, mock_boto3_client):
     mock_paginator = MagicMock()
@@ -1,19 +1,28 @@
 import pytest
-from unittest.mock import patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 import botocore
 from datetime import datetime
 from src.managed_blockchain_query.managed_blockchain_query import ManagedBlockchainQuery
+from conftest import TRANSACTION_HASH_PAGES, VALIDATION_ERROR, page_stream, stub_client
+
 
 @pytest.fixture
 def mock_boto3_client():
-    """Mock boto3 client for ManagedBlockchainQuery."""
-    with patch("boto3.client") as mock_client:
-        yield mock_client.return_value
+    """Mock boto3 client for ManagedBlockchainQuery, injected instead of patching boto3; fresh for every test."""
+    return MagicMock()
+
+
+@pytest.fixture
+def mock_paginator(mock_boto3_client):
+    """The paginator every `get_paginator()` call on the mocked client returns."""
+    return mock_boto3_client.get_paginator.return_value
+
 
 @pytest.fixture
 def blockchain_client(mock_boto3_client):
     """Return an instance of ManagedBlockchainQuery with a mocked client."""
-    return ManagedBlockchainQuery()
+    return ManagedBlockchainQuery(client=mock_boto3_client)
 
 
 ### ✅ TEST: Query Chaincode on Hyperledger Fabric
@@ -107,10 +116,7 @@ def test_list_hyperledger_transactions_pagination(blockchain_client, mock_boto3_
 
 ### ✅ TEST: Error Handling for Transactions
 def test_list_hyperledger_transactions_error_handling(blockchain_client, mock_boto3_client):
-    mock_boto3_client.list_transactions.side_effect = botocore.exceptions.ClientError(
-        {"Error": {"Code": "ValidationException", "Message": "Invalid request"}},
-        "list_transactions"
-    )
+    mock_boto3_client.list_transactions.side_effect = VALIDATION_ERROR
 
     response = blockchain_client.list_transactions(
         address="Org1MSP",
@@ -154,3 +160,113 @@ def test_get_block(blockchain_client, mock_boto3_client):
     assert response["blockNumber"] == 100
     assert response["blockHash"] == "0xabc123"
     assert response["previousBlockHash"] == "0xdef456"
+
+
+### ✅ TEST: Query Wrappers Share One Client
+def test_query_wrappers_share_client(monkeypatch):
+    from src.managed_blockchain_query.managed_blockchain_paginator import ManagedBlockchainPaginator
+
+    monkeypatch.setattr("boto3.client", lambda *args, **kwargs: MagicMock())
+    assert ManagedBlockchainQuery().client is ManagedBlockchainQuery().client is ManagedBlockchainPaginator().client
+
+
+### ✅ TEST: Large Token Balance Batches Are Split
+def test_batch_get_token_balance_splits_batches(blockchain_client, mock_boto3_client):
+    mock_boto3_client.batch_get_token_balance.side_effect = lambda getTokenBalanceInputs: {
+        "tokenBalances": getTokenBalanceInputs, "errors": []
+    }
+    token_requests = [{"ownerIdentifier": {"address": f"0x{i}"}} for i in range(25)]
+
+    response = blockchain_client.batch_get_token_balance(token_requests)
+
+    assert mock_boto3_client.batch_get_token_balance.call_count == 3
+    assert response == {"tokenBalances": token_requests, "errors": []}
+
+
+### ✅ TEST: Final Transactions and Historical Balances Are Cached
+def test_immutable_reads_are_cached(blockchain_client, mock_boto3_client):
+    mock_boto3_client.get_transaction.return_value = {"transaction": {"confirmationStatus": "FINAL"}}
+    mock_boto3_client.get_token_balance.return_value = {"balance": "1"}
+
+    for _ in range(2):
+        blockchain_client.get_transaction("ETHEREUM_MAINNET", transaction_hash="0x1")
+        blockchain_client.get_token_balance("ETHEREUM_MAINNET", "0x" + "a" * 40, timestamp=datetime(2024, 1, 1))
+    assert mock_boto3_client.get_transaction.call_count == 1
+    assert mock_boto3_client.get_token_balance.call_count == 1
+
+    blockchain_client.clear_cache()
+    blockchain_client.get_transaction("ETHEREUM_MAINNET", transaction_hash="0x1")
+    assert mock_boto3_client.get_transaction.call_count == 2
+
+
+### ✅ TEST: Listings Can Be Streamed
+def test_iter_transactions_streams_pages():
+    paginator = SimpleNamespace(paginate=lambda **kwargs: iter(TRANSACTION_HASH_PAGES))
+    blockchain_client = ManagedBlockchainQuery(client=stub_client(get_paginator=paginator))
+
+    transactions = blockchain_client.iter_transactions("0x" + "a" * 40, "ETHEREUM_MAINNET")
+
+    assert [transaction["transactionHash"] for transaction in transactions] == ["0x1", "0x2"]
+
+
+### ✅ TEST: Malformed Ethereum Addresses Fail Before the Call
+def test_malformed_ethereum_address_rejected(blockchain_client, mock_boto3_client):
+    with pytest.raises(ValueError):
+        blockchain_client.list_transactions(address="0xabc", network="ETHEREUM_MAINNET")
+    with pytest.raises(ValueError):
+        blockchain_client.get_token_balance("ETHEREUM_MAINNET", "0x" + "a" * 40, contract_address="0xnothex")
+
+    mock_boto3_client.list_transactions.assert_not_called()
+    mock_boto3_client.get_token_balance.assert_not_called()
+
+
+### ✅ TEST: Malformed Ethereum Addresses Fail Before Streaming
+def test_malformed_ethereum_address_rejected_when_streaming(blockchain_client, mock_boto3_client):
+    with pytest.raises(ValueError):
+        blockchain_client.iter_transactions("0xabc", "ETHEREUM_MAINNET")
+    with pytest.raises(ValueError):
+        blockchain_client.iter_asset_contracts("ETHEREUM_MAINNET", "ERC20", "0xabc")
+    with pytest.raises(ValueError):
+        blockchain_client.iter_transactions_multi(["0x" + "a" * 40, "0xabc"], "ETHEREUM_MAINNET")
+    with pytest.raises(ValueError):
+        blockchain_client.paginate_all("list_asset_contracts", contractFilter={
+            "network": "ETHEREUM_MAINNET", "tokenStandard": "ERC20", "deployerAddress": "0xabc"
+        })
+
+    mock_boto3_client.get_paginator.assert_not_called()
+
+
+### ✅ TEST: Every Page Merged into One Response
+def test_paginate_all(blockchain_client, mock_boto3_client, mock_paginator):
+    mock_pages = mock_paginator.paginate.return_value
+    mock_pages.build_full_result.return_value = {"transactions": [{"transactionHash": "0x1"}, {"transactionHash": "0x2"}]}
+
+    response = blockchain_client.paginate_all("list_transactions", address="0x" + "a" * 40, network="ETHEREUM_MAINNET")
+
+    assert len(response["transactions"]) == 2
+    mock_boto3_client.get_paginator.assert_called_once_with("list_transactions")
+    assert mock_paginator.paginate.call_args.kwargs["PaginationConfig"] == {"PageSize": 250}
+
+
+### ✅ TEST: Failed Reads Are Logged, Not Raised
+def test_failed_reads_are_logged(blockchain_client, mock_boto3_client, mock_paginator, caplog):
+    mock_boto3_client.get_token_balance.side_effect = VALIDATION_ERROR
+    mock_paginator.paginate.side_effect = VALIDATION_ERROR
+
+    assert blockchain_client.get_token_balance("ETHEREUM_MAINNET", "0x" + "a" * 40) == {}
+    assert "error" in blockchain_client.paginate_all("list_transactions", address="0x" + "a" * 40,
+                                                     network="ETHEREUM_MAINNET")
+    assert caplog.text.count("ValidationException") == 2
+
+
+### ✅ TEST: Transactions of Several Addresses
+def test_iter_transactions_multi():
+    def paginate(address, **kwargs):
+        return page_stream({"transactions": [{"to": address}]})
+
+    blockchain_client = ManagedBlockchainQuery(client=stub_client(get_paginator=SimpleNamespace(paginate=paginate)))
+
+    address_a, address_b = "0x" + "a" * 40, "0x" + "b" * 40
+    results = dict(blockchain_client.iter_transactions_multi([address_a, address_b], "ETHEREUM_MAINNET"))
+
+    assert results == {address_a: [{"to": address_a}], address_b: [{"to": address_b}]}
@@ -1,164 +1,241 @@
 import pytest
-from unittest.mock import patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 import botocore
 from datetime import datetime
-from src.managed_blockchain_query.managed_blockchain_paginator import ManagedBlockchainPaginator
+from src.managed_blockchain_query.managed_blockchain_paginator import TRANSACTION_FIELDS, ManagedBlockchainPaginator
+from conftest import (
+    CONTRACT_PAGES, EMPTY_TRANSACTION_PAGES, EVENT_PAGES, FILTERED_EVENT_PAGES, INVOCATION_PAGES, TOKEN_BALANCE_PAGES,
+    TRANSACTION_PAGES, VALIDATION_ERROR, page_stream, stub_client
+)
 
 
 @pytest.fixture
 def mock_boto3_client():
-    """Mock boto3 client for ManagedBlockchainPaginator."""
-    with patch("boto3.client") as mock_client:
-        yield mock_client.return_value
+    """Mock boto3 client for ManagedBlockchainPaginator, injected instead of patching boto3; fresh for every test."""
+    return MagicMock()
+
+
+@pytest.fixture
+def mock_paginator(mock_boto3_client):
+    """The paginator every `get_paginator()` call on the mocked client returns."""
+    return mock_boto3_client.get_paginator.return_value
 
 
 @pytest.fixture
 def paginator_client(mock_boto3_client):
     """Return an instance of ManagedBlockchainPaginator with a mocked client."""
-    return ManagedBlockchainPaginator()
+    return ManagedBlockchainPaginator(client=mock_boto3_client)
+
+
+### ✅ TEST: Paginate Every Listing on Hyperledger Fabric
+@pytest.mark.parametrize("method,kwargs,pages,key", [
+    pytest.param(
+        "paginate_list_transactions",
+        {"address": "Org1MSP", "network": "HYPERLEDGER_FABRIC", "max_items": 10, "page_size": 5},
+        TRANSACTION_PAGES, "transactions", id="chaincode_queries"
+    ),
+    pytest.param(
+        "paginate_list_asset_contracts",
+        {"network": "HYPERLEDGER_FABRIC", "token_standard": "chaincode", "deployer_address": "Org1MSP"},
+        CONTRACT_PAGES, "contracts", id="chaincode_deployments"
+    ),
+    pytest.param(
+        "paginate_list_transaction_events",
+        {"network": "HYPERLEDGER_FABRIC", "transaction_hash": "tx12345"},
+        EVENT_PAGES, "events", id="transaction_events"
+    ),
+    pytest.param(
+        "paginate_list_filtered_transaction_events",
+        {"network": "HYPERLEDGER_FABRIC", "transaction_event_to_address": ["Org1MSP"]},
+        FILTERED_EVENT_PAGES, "events", id="ledger_queries"
+    ),
+    pytest.param(
+        "paginate_list_token_balances",
+        {"network": "HYPERLEDGER_FABRIC", "owner_address": "Org1MSP"},
+        TOKEN_BALANCE_PAGES, "tokenBalances", id="token_balances"
+    ),
+    pytest.param(
+        "paginate_list_transactions",
+        {"address": "Org1MSP", "network": "HYPERLEDGER_FABRIC", "max_items": 10},
+        INVOCATION_PAGES, "transactions", id="chaincode_invocation_transactions"
+    ),
+])
+def test_paginate_listing(method, kwargs, pages, key):
+    paginator = SimpleNamespace(paginate=lambda **kwargs: iter(pages))
+    paginator_client = ManagedBlockchainPaginator(client=stub_client(get_paginator=paginator))
+
+    response = getattr(paginator_client, method)(**kwargs)
+
+    assert response == [record for page in pages for record in page[key]]
 
 
-### ✅ TEST: Paginate Chaincode Queries on Hyperledger Fabric
-def test_paginate_chaincode_queries(paginator_client, mock_boto3_client):
-    mock_paginator = MagicMock()
-    mock_boto3_client.get_paginator.return_value = mock_paginator
-
-    mock_paginator.paginate.return_value = iter([
-        {"transactions": [{"transactionId": "txABC"}], "NextToken": "token1"},
-        {"transactions": [{"transactionId": "txDEF"}], "NextToken": None}
-    ])
+### ✅ TEST: Paginate Errors Properly Handled
+def test_pagination_error_handling(paginator_client, mock_boto3_client, caplog):
+    mock_boto3_client.get_paginator.side_effect = VALIDATION_ERROR
 
     response = paginator_client.paginate_list_transactions(
         address="Org1MSP",
-        network="HYPERLEDGER_FABRIC",
-        max_items=10,
-        page_size=5
+        network="HYPERLEDGER_FABRIC"
     )
 
-    assert len(response) == 2
-    assert response[0]["transactionId"] == "txABC"
-    assert response[1]["transactionId"] == "txDEF"
+    assert response == []
+    assert "ValidationException" in caplog.text
 
 
-### ✅ TEST: Paginate Smart Contract Deployments on Hyperledger Fabric
-def test_paginate_chaincode_deployments(paginator_client, mock_boto3_client):
-    mock_paginator = MagicMock()
-    mock_boto3_client.get_paginator.return_value = mock_paginator
+### ✅ TEST: Pages Default to the API Maximum
+def test_pages_default_to_api_maximum(paginator_client, mock_paginator):
+    mock_paginator.paginate.return_value = iter(EMPTY_TRANSACTION_PAGES)
 
-    mock_paginator.paginate.return_value = iter([
-        {"contracts": [{"chaincodeId": "fabcar", "version": "1.0"}], "NextToken": "token1"},
-        {"contracts": [{"chaincodeId": "supplychain", "version": "2.0"}], "NextToken": None}
-    ])
+    paginator_client.paginate_list_transactions(address="0xabc", network="ETHEREUM_MAINNET")
 
-    response = paginator_client.paginate_list_asset_contracts(
-        network="HYPERLEDGER_FABRIC",
-        token_standard="chaincode",
-        deployer_address="Org1MSP"
-    )
+    assert mock_paginator.paginate.call_args.kwargs["PaginationConfig"] == {"PageSize": 250}
 
-    assert len(response) == 2
-    assert response[0]["chaincodeId"] == "fabcar"
-    assert response[1]["chaincodeId"] == "supplychain"
 
+### ✅ TEST: Pages Never Exceed max_items
+def test_page_size_capped_at_max_items(paginator_client, mock_paginator):
+    mock_paginator.paginate.return_value = iter(EMPTY_TRANSACTION_PAGES)
 
-### ✅ TEST: Paginate Transaction Events on Hyperledger Fabric
-def test_paginate_transaction_events(paginator_client, mock_boto3_client):
-    mock_paginator = MagicMock()
-    mock_boto3_client.get_paginator.return_value = mock_paginator
+    paginator_client.paginate_list_transactions(address="0xabc", network="ETHEREUM_MAINNET", max_items=20)
 
-    mock_paginator.paginate.return_value = iter([
-        {"events": [{"transactionId": "tx123", "eventType": "Invoke"}], "NextToken": "token1"},
-        {"events": [{"transactionId": "tx456", "eventType": "Query"}], "NextToken": None}
-    ])
+    assert mock_paginator.paginate.call_args.kwargs["PaginationConfig"] == {"PageSize": 20, "MaxItems": 20}
 
-    response = paginator_client.paginate_list_transaction_events(
-        network="HYPERLEDGER_FABRIC",
-        transaction_hash="tx12345"
-    )
 
-    assert len(response) == 2
-    assert response[0]["transactionId"] == "tx123"
-    assert response[0]["eventType"] == "Invoke"
-    assert response[1]["transactionId"] == "tx456"
-    assert response[1]["eventType"] == "Query"
+### ✅ TEST: Token Balances for Several Owners
+def test_paginate_list_token_balances_bulk(paginator_client, mock_paginator):
+    def paginate(ownerFilter, **kwargs):
+        return page_stream({"tokenBalances": [{"ownerIdentifier": ownerFilter}]})
 
+    mock_paginator.paginate.side_effect = paginate
 
-### ✅ TEST: Paginate Ledger Queries on Hyperledger Fabric
-def test_paginate_ledger_queries(paginator_client, mock_boto3_client):
-    mock_paginator = MagicMock()
-    mock_boto3_client.get_paginator.return_value = mock_paginator
+    balances = paginator_client.paginate_list_token_balances_bulk("ETHEREUM_MAINNET", ["0xa", "0xb"])
 
-    mock_paginator.paginate.return_value = iter([
-        {"ledgerState": [{"blockNumber": 10, "status": "VALID"}], "NextToken": "token1"},
-        {"ledgerState": [{"blockNumber": 20, "status": "VALID"}], "NextToken": None}
-    ])
+    assert balances == {
+        "0xa": [{"ownerIdentifier": {"address": "0xa"}}],
+        "0xb": [{"ownerIdentifier": {"address": "0xb"}}],
+    }
 
-    response = paginator_client.paginate_list_filtered_transaction_events(
-        network="HYPERLEDGER_FABRIC",
-        transaction_event_to_address=["Org1MSP"]
-    )
 
-    assert len(response) == 2
-    assert response[0]["blockNumber"] == 10
-    assert response[1]["blockNumber"] == 20
+### ✅ TEST: Paginators Are Built Once per Operation
+def test_paginator_reused_across_calls(paginator_client, mock_boto3_client, mock_paginator):
+    mock_paginator.paginate.side_effect = lambda **kwargs: page_stream({"transactions": []})
 
+    paginator_client.paginate_list_transactions(address="0xabc", network="ETHEREUM_MAINNET")
+    paginator_client.paginate_list_transactions(address="0xdef", network="ETHEREUM_MAINNET")
 
-### ✅ TEST: Paginate Token Balances on Hyperledger Fabric
-def test_paginate_token_balances(paginator_client, mock_boto3_client):
-    mock_paginator = MagicMock()
-    mock_boto3_client.get_paginator.return_value = mock_paginator
+    mock_boto3_client.get_paginator.assert_called_once_with("list_transactions")
 
-    mock_paginator.paginate.return_value = iter([
-        {"tokenBalances": [{"ownerIdentifier": {"address": "Org1MSP"}, "balance": "100"}], "NextToken": "token1"},
-        {"tokenBalances": [{"ownerIdentifier": {"address": "Org2MSP"}, "balance": "250"}], "NextToken": None}
-    ])
 
-    response = paginator_client.paginate_list_token_balances(
-        network="HYPERLEDGER_FABRIC",
-        owner_address="Org1MSP"
-    )
+### ✅ TEST: Latest Transactions Are Sorted Server-Side
+def test_get_latest_transactions(paginator_client, mock_paginator):
+    mock_paginator.paginate.return_value = page_stream({"transactions": [{"transactionHash": "0x2"}]})
 
-    assert len(response) == 2
-    assert response[0]["ownerIdentifier"]["address"] == "Org1MSP"
-    assert response[0]["balance"] == "100"
-    assert response[1]["ownerIdentifier"]["address"] == "Org2MSP"
-    assert response[1]["balance"] == "250"
+    response = paginator_client.get_latest_transactions("0xabc", "ETHEREUM_MAINNET", count=5)
 
+    kwargs = mock_paginator.paginate.call_args.kwargs
+    assert response == [{"transactionHash": "0x2"}]
+    assert kwargs["sort"] == {"sortBy": "TRANSACTION_TIMESTAMP", "sortOrder": "DESCENDING"}
+    assert kwargs["PaginationConfig"] == {"PageSize": 5, "MaxItems": 5}
 
-### ✅ TEST: Paginate Chaincode Invocation Transactions
-def test_paginate_chaincode_invocation_transactions(paginator_client, mock_boto3_client):
-    mock_paginator = MagicMock()
-    mock_boto3_client.get_paginator.return_value = mock_paginator
 
-    mock_paginator.paginate.return_value = iter([
-        {"transactions": [{"transactionId": "txInvoke1", "type": "Invoke"}], "NextToken": "token1"},
-        {"transactions": [{"transactionId": "txInvoke2", "type": "Invoke"}], "NextToken": None}
-    ])
+### ✅ TEST: Iterators Stream Items Without Fetching Every Page
+def test_iter_transactions_is_lazy(mock_boto3_client, mock_paginator):
+    paginator_client = ManagedBlockchainPaginator(client=mock_boto3_client)
+    fetched = []
 
-    response = paginator_client.paginate_list_transactions(
-        address="Org1MSP",
-        network="HYPERLEDGER_FABRIC",
-        max_items=10
-    )
+    def pages(**kwargs):
+        for page in ({"transactions": [{"transactionHash": "0x1"}]}, {"transactions": [{"transactionHash": "0x2"}]}):
+            fetched.append(page)
+            yield page
 
-    assert len(response) == 2
-    assert response[0]["transactionId"] == "txInvoke1"
-    assert response[0]["type"] == "Invoke"
-    assert response[1]["transactionId"] == "txInvoke2"
-    assert response[1]["type"] == "Invoke"
+    mock_paginator.paginate.side_effect = pages
 
+    transactions = paginator_client.iter_transactions(address="0xabc", network="ETHEREUM_MAINNET")
+    assert next(transactions)["transactionHash"] == "0x1"
+    assert len(fetched) == 1
 
-### ✅ TEST: Paginate Errors Properly Handled
-def test_pagination_error_handling(paginator_client, mock_boto3_client):
-    mock_boto3_client.get_paginator.side_effect = botocore.exceptions.ClientError(
-        {"Error": {"Code": "ValidationException", "Message": "Invalid request"}},
-        "get_paginator"
-    )
 
-    response = paginator_client.paginate_list_transactions(
-        address="Org1MSP",
-        network="HYPERLEDGER_FABRIC"
-    )
+### ✅ TEST: Final Transaction Windows Are Served From Cache
+def test_final_transaction_windows_are_cached(paginator_client, mock_paginator):
+    mock_paginator.paginate.side_effect = lambda **kwargs: page_stream({"transactions": [{"transactionHash": "0x1"}]})
+
+    for _ in range(2):
+        paginator_client.paginate_list_transactions(address="0xabc", network="ETHEREUM_MAINNET",
+                                                    to_time=datetime(2024, 1, 1))
+    assert mock_paginator.paginate.call_count == 1
+
+    paginator_client.paginate_list_transactions(address="0xabc", network="ETHEREUM_MAINNET")
+    paginator_client.paginate_list_transactions(address="0xabc", network="ETHEREUM_MAINNET")
+    assert mock_paginator.paginate.call_count == 3
+
+
+### ✅ TEST: Asset Contract Listings Expire Quickly
+def test_asset_contract_listings_expire_after_a_minute(paginator_client, mock_paginator, monkeypatch):
+    clock = [0.0]
+    monkeypatch.setattr("time.monotonic", lambda: clock[0])
+    mock_paginator.paginate.side_effect = lambda **kwargs: page_stream({"contracts": [{"contractAddress": "0x1"}]})
+
+    for elapsed in (0, 59, 61):
+        clock[0] = elapsed
+        paginator_client.paginate_list_asset_contracts("ETHEREUM_MAINNET", "ERC20", "0xabc")
+    assert mock_paginator.paginate.call_count == 2
+
+
+### ✅ TEST: Cached Listings Are Copied Per Caller
+def test_cached_listing_is_copied_per_caller(paginator_client, mock_paginator):
+    mock_paginator.paginate.side_effect = lambda **kwargs: page_stream({"transactions": [{"transactionHash": "0x1"}]})
+
+    response = paginator_client.paginate_list_transactions(address="0xabc", network="ETHEREUM_MAINNET",
+                                                           to_time=datetime(2024, 1, 1))
+    response[0]["transactionHash"] = "0xjunk"
+    response.append("junk")
+
+    assert paginator_client.paginate_list_transactions(
+        address="0xabc", network="ETHEREUM_MAINNET", to_time=datetime(2024, 1, 1)
+    ) == [{"transactionHash": "0x1"}]
+    assert mock_paginator.paginate.call_count == 1
+
+
+### ✅ TEST: Final Transaction Windows Persist Across Sessions
+def test_final_transaction_windows_persist_to_disk(tmp_path, mock_boto3_client, mock_paginator):
+    mock_paginator.paginate.side_effect = lambda **kwargs: page_stream({"transactions": [{"transactionHash": "0x1"}]})
+    cache_path = str(tmp_path / "transactions.sqlite")
+
+    for _ in range(2):
+        paginator_client = ManagedBlockchainPaginator(cache_path=cache_path, client=mock_boto3_client)
+        response = paginator_client.paginate_list_transactions(
+            address="0xabc", network="ETHEREUM_MAINNET", to_time=datetime(2024, 1, 1)
+        )
+    assert response == [{"transactionHash": "0x1"}]
+    assert mock_paginator.paginate.call_count == 1
+
+    paginator_client = ManagedBlockchainPaginator(cache_path=cache_path, client=mock_boto3_client)
+    paginator_client.invalidate_cache("paginate_list_transactions", "0xabc")
+    paginator_client.paginate_list_transactions(address="0xabc", network="ETHEREUM_MAINNET",
+                                                to_time=datetime(2024, 1, 1))
+    assert mock_paginator.paginate.call_count == 2
+
+
+### ✅ TEST: Transactions as Records and Columns
+def test_transactions_as_records_and_columns(paginator_client, mock_paginator):
+    page = {"transactions": [
+        {"transactionHash": "0x1", "network": "ETHEREUM_MAINNET", "transactionTimestamp": datetime(2024, 1, 1)},
+        {"transactionHash": "0x2", "network": "ETHEREUM_MAINNET", "transactionTimestamp": datetime(2024, 1, 2)},
+    ]}
+    mock_paginator.paginate.side_effect = lambda **kwargs: page_stream(page)
+
+    records = list(paginator_client.iter_transaction_records("0xabc", "ETHEREUM_MAINNET"))
+    columns = paginator_client.paginate_list_transactions_columnar("0xabc", "ETHEREUM_MAINNET", max_items=10)
+
+    assert [record.transaction_hash for record in records] == ["0x1", "0x2"]
+    assert columns["transactionHash"] == ["0x1", "0x2"]
+    assert columns["transactionId"] == [None, None]
+
+
+### ✅ TEST: Failed Columnar Listings Return Empty Columns
+def test_columnar_listing_error_returns_empty_columns(paginator_client, mock_boto3_client):
+    mock_boto3_client.get_paginator.side_effect = VALIDATION_ERROR
+
+    columns = paginator_client.paginate_list_transactions_columnar("0xabc", "ETHEREUM_MAINNET")
 
-    assert "error" in response
-    assert "ValidationException" in response["error"]
+    assert columns == {field: [] for field in TRANSACTION_FIELDS}